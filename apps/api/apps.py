@@ -0,0 +1,14 @@
+# apps/api/apps.py
+
+"""
+Configuração do app 'api' para a aplicação Django.
+"""
+
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    """Classe de configuração para o aplicativo 'api'."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.api"
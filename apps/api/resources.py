@@ -0,0 +1,167 @@
+# apps/api/resources.py
+
+"""
+Recursos expostos pela API JSON (somente leitura).
+
+Cada recurso reaproveita o ``ListSpec`` da listagem correspondente, de modo
+que os filtros aceitos (e seus parâmetros) são os mesmos das páginas de
+listagem. Os campos da API são mapeados para caminhos do ORM e apenas os
+campos solicitados em ``?fields=`` são buscados no banco de dados.
+"""
+
+from apps.certifications.lists import CERTIFICATION_LIST
+from apps.certifications.models import Certification
+from apps.certifiers.lists import CERTIFIER_LIST
+from apps.certifiers.models import Certifier
+from apps.clients.lists import CLIENT_LIST
+from apps.clients.models import Client
+from apps.testCenter.lists import EXAM_LIST, TESTCENTER_LIST
+from apps.testCenter.models import TestCenter
+
+
+class ApiResource:
+    """
+    Recurso da API.
+
+    Args:
+        name (str): Nome do recurso na URL.
+        spec (ListSpec): Listagem cujos filtros são aceitos.
+        fields (dict): Campos da API e seus caminhos no ORM.
+        ordering (tuple): Chave da paginação por cursor (caminhos do ORM);
+            o último campo deve ser único.
+        depends_on (tuple): Modelos cujas escritas alteram as respostas
+            (usados no ETag).
+    """
+
+    def __init__(self, name, spec, fields, ordering, depends_on=()):
+        self.name = name
+        self.spec = spec
+        self.fields = dict(fields)
+        self.ordering = tuple(ordering)
+        self.depends_on = (spec.model, *depends_on)
+
+    @property
+    def model(self):
+        """Modelo do recurso."""
+        return self.spec.model
+
+    @property
+    def filters(self):
+        """Parâmetros de filtro aceitos (os mesmos da listagem)."""
+        return [list_filter.param for list_filter in self.spec.filters]
+
+    def parse_fields(self, value):
+        """
+        Converte o parâmetro ``fields`` na lista de campos da resposta.
+
+        Args:
+            value (str): Campos separados por vírgula (vazio: todos).
+
+        Returns:
+            list: Campos da API, na ordem solicitada.
+
+        Raises:
+            ValueError: Se algum campo não existir no recurso.
+        """
+        if not value:
+            return list(self.fields)
+        fields = list(dict.fromkeys(
+            field.strip() for field in value.split(",") if field.strip()
+        ))
+        unknown = [field for field in fields if field not in self.fields]
+        if unknown:
+            raise ValueError(
+                f"Campo(s) desconhecido(s) em '{self.name}': "
+                f"{', '.join(unknown)}."
+            )
+        return fields or list(self.fields)
+
+    def projection(self, fields):
+        """Caminhos do ORM buscados: os campos e a chave do cursor."""
+        paths = [self.fields[field] for field in fields]
+        return paths + [path for path in self.ordering if path not in paths]
+
+    def serialize(self, row, fields):
+        """
+        Monta o objeto JSON de um registro (tupla da projeção); colunas
+        extras da chave do cursor são descartadas.
+        """
+        return dict(zip(fields, row))
+
+
+RESOURCES = {
+    resource.name: resource
+    for resource in [
+        ApiResource(
+            "clients",
+            CLIENT_LIST,
+            fields={
+                "uid": "uid",
+                "name": "name",
+                "country": "country",
+                "city": "city",
+                "notes": "notes",
+                "idle": "idle",
+            },
+            ordering=("uid",),
+        ),
+        ApiResource(
+            "certifiers",
+            CERTIFIER_LIST,
+            fields={
+                "id": "id",
+                "name": "name",
+                "abbreviation": "abbreviation",
+                "notes": "notes",
+                "idle": "idle",
+            },
+            ordering=("id",),
+        ),
+        ApiResource(
+            "certifications",
+            CERTIFICATION_LIST,
+            fields={
+                "id": "id",
+                "certifier": "certifier_id",
+                "certifier_name": "certifier__name",
+                "name": "name",
+                "examCode": "examCode",
+                "duration": "duration",
+                "notes": "notes",
+                "idle": "idle",
+            },
+            ordering=("id",),
+            depends_on=(Certifier,),
+        ),
+        ApiResource(
+            "testcenters",
+            TESTCENTER_LIST,
+            fields={
+                "id": "id",
+                "name": "name",
+                "notes": "notes",
+                "idle": "idle",
+            },
+            ordering=("id",),
+        ),
+        ApiResource(
+            "exams",
+            EXAM_LIST,
+            fields={
+                "id": "id",
+                "date": "date",
+                "client": "client_id",
+                "client_name": "client__name",
+                "certification": "certification_id",
+                "certification_name": "certification__name",
+                "testCenter": "testCenter_id",
+                "testCenter_name": "testCenter__name",
+                "presence": "presence",
+                "bookingKey": "bookingKey",
+                "notes": "notes",
+            },
+            ordering=("date", "id"),
+            depends_on=(Client, Certification, TestCenter),
+        ),
+    ]
+}
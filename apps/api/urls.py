@@ -0,0 +1,23 @@
+# apps/api/urls.py
+
+"""
+Definição das URLs da API JSON (versão 1).
+"""
+
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("", views.api_index, name="api_index"),
+    path(
+        "<str:resource>/",
+        views.api_resource_list,
+        name="api_resource_list"
+    ),
+    path(
+        "<str:resource>/<str:pk>/",
+        views.api_resource_detail,
+        name="api_resource_detail"
+    ),
+]
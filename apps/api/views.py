@@ -0,0 +1,149 @@
+# apps/api/views.py
+
+"""
+Definição das views da API JSON (somente leitura, versão 1).
+
+- ``GET /api/v1/``: recursos disponíveis, seus campos e filtros;
+- ``GET /api/v1/<recurso>/``: registros paginados por cursor
+  (``?cursor=``), com os filtros da listagem correspondente,
+  ``?fields=`` e ``?records_per_page=``;
+- ``GET /api/v1/<recurso>/<pk>/``: um registro.
+
+As respostas trazem um ETag forte derivado das versões de dados dos
+modelos envolvidos (``cache_versions``) e dos parâmetros da requisição;
+``If-None-Match`` com o ETag atual recebe 304 sem consultar o banco.
+"""
+
+import hashlib
+
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import condition, require_GET
+
+from apps.utils.cache_versions import get_version
+from apps.utils.pagination import CursorPaginator
+
+from .resources import RESOURCES
+
+API_VERSION = "v1"
+API_MAX_PAGE_SIZE = 500
+
+
+def api_error(message, status):
+    """Resposta JSON de erro, no formato de ``json_error_response``."""
+    return JsonResponse(
+        {"success": False, "message": message}, status=status
+    )
+
+
+def resource_etag(request, resource, pk=None):
+    """
+    ETag de uma resposta da API: versões de dados dos modelos do recurso e
+    parâmetros da requisição. Escritas em qualquer um desses modelos
+    alteram o ETag.
+    """
+    api_resource = RESOURCES.get(resource)
+    if api_resource is None:
+        return None
+    versions = [get_version(model) for model in api_resource.depends_on]
+    key = repr((
+        API_VERSION,
+        resource,
+        pk,
+        versions,
+        sorted(request.GET.lists()),
+    ))
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+@require_GET
+def api_index(request):
+    """View com os recursos disponíveis na API."""
+
+    return JsonResponse({
+        "version": API_VERSION,
+        "resources": [
+            {
+                "name": name,
+                "url": request.build_absolute_uri(
+                    reverse("api_resource_list", args=[name])
+                ),
+                "fields": list(api_resource.fields),
+                "filters": api_resource.filters,
+            }
+            for name, api_resource in RESOURCES.items()
+        ],
+    })
+
+
+@require_GET
+@condition(etag_func=resource_etag)
+def api_resource_list(request, resource):
+    """View com uma página de registros de um recurso."""
+
+    api_resource = RESOURCES.get(resource)
+    if api_resource is None:
+        return api_error(f"Recurso desconhecido: '{resource}'.", 404)
+
+    try:
+        fields = api_resource.parse_fields(request.GET.get("fields", ""))
+    except ValueError as e:
+        return api_error(str(e), 400)
+
+    # Mesmos filtros da listagem; a ordenação é a chave do cursor
+    list_query = api_resource.spec.compile(
+        request, max_per_page=API_MAX_PAGE_SIZE
+    )
+    queryset = list_query.queryset.values_list(
+        *api_resource.projection(fields), named=True
+    )
+    paginator = CursorPaginator(
+        queryset,
+        ordering=api_resource.ordering,
+        per_page=list_query.per_page,
+        descending=list_query.descending,
+    )
+    page = paginator.get_page(request.GET.get("cursor"))
+
+    def page_url(cursor):
+        if cursor is None:
+            return None
+        params = request.GET.copy()
+        params["cursor"] = cursor
+        return request.build_absolute_uri(
+            f"{request.path}?{params.urlencode()}"
+        )
+
+    return JsonResponse({
+        "results": [api_resource.serialize(row, fields) for row in page],
+        "next": page_url(page.next_cursor),
+        "previous": page_url(page.previous_cursor),
+    })
+
+
+@require_GET
+@condition(etag_func=resource_etag)
+def api_resource_detail(request, resource, pk):
+    """View com um registro de um recurso."""
+
+    api_resource = RESOURCES.get(resource)
+    if api_resource is None:
+        return api_error(f"Recurso desconhecido: '{resource}'.", 404)
+
+    try:
+        fields = api_resource.parse_fields(request.GET.get("fields", ""))
+    except ValueError as e:
+        return api_error(str(e), 400)
+
+    try:
+        row = (
+            api_resource.model.objects.filter(pk=pk)
+            .values_list(*api_resource.projection(fields))
+            .first()
+        )
+    except (ValueError, TypeError):
+        row = None
+    if row is None:
+        return api_error("Registro não encontrado.", 404)
+
+    return JsonResponse(api_resource.serialize(row, fields))
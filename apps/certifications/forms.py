@@ -5,8 +5,9 @@ Definição dos formulários do aplicativo 'certifications'.
 """
 
 from django import forms
+from django.urls import reverse_lazy
 
-from apps.utils.widgets import BooleanSelect
+from apps.utils.widgets import AjaxModelChoiceField, AjaxSelect, BooleanSelect
 from apps.certifications.models import Certifier
 
 from .models import Certification
@@ -17,10 +18,12 @@ class CertificationForm(forms.ModelForm):
     Formulário para cadastro e edição de Certificações.
     """
 
-    certifier = forms.ModelChoiceField(
-        queryset=Certifier.objects.all(),
+    certifier = AjaxModelChoiceField(
+        queryset=Certifier.objects.filter(idle=False),
         label="Certificador",
-        widget=forms.Select(
+        widget=AjaxSelect(
+            url=reverse_lazy("certifier_autocomplete"),
+            url_params={"idle": "False"},
             attrs={
                 "class": "apps-form-input select2",
                 "id": "certification-certifier",
@@ -97,12 +100,6 @@ class CertificationForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["certifier"].queryset = (
-            Certifier.objects
-            .filter(idle=False)
-            .order_by("name")
-        )
-
         self.fields["certifier"].label_from_instance = (
             self.certifier_label_from_instance
         )
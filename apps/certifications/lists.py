@@ -0,0 +1,85 @@
+# apps/certifications/lists.py
+
+"""
+Especificação da listagem de Certificações, das opções de Certificação
+nos campos de seleção (autocompletar) e da dimensão (cache local) de
+Certificações.
+"""
+
+from django.db.models import Q
+
+from apps.certifiers.lists import CERTIFIER_DIMENSION
+from apps.utils.autocomplete import prefix_q
+from apps.utils.dimensions import Dimension
+from apps.utils.list_engine import (
+    BooleanFilter,
+    ExactFilter,
+    ListSpec,
+    SearchFilter,
+    SortKey,
+)
+from apps.utils.tables import BooleanCell, Cell, DimensionCell, LinkCell
+
+from .models import Certification
+
+# Colunas carregadas nas opções de Certificação dos campos de seleção
+CERTIFICATION_OPTION_VALUES = ("id", "name", "examCode")
+
+# Certificações em memória, para rótulos e opções sem consultas
+CERTIFICATION_DIMENSION = Dimension(
+    Certification, CERTIFICATION_OPTION_VALUES, ordering=("name", "pk")
+)
+
+
+def certification_option_label(row):
+    """Rótulo de uma Certificação nos campos de seleção."""
+    _, name, exam_code = row
+    return f"{name} ({exam_code})"
+
+
+def certification_option_q(term):
+    """Busca de Certificações por prefixo do nome ou do ID."""
+    return Q(name__istartswith=term) | prefix_q("id", term.upper())
+
+
+CERTIFICATION_LIST = ListSpec(
+    Certification,
+    filters=[
+        SearchFilter("certification-list-query", ["name", "examCode"]),
+        ExactFilter("certification-list-certifier", "certifier__id"),
+        BooleanFilter("certification-list-idle", "idle"),
+    ],
+    sort_keys=[
+        "id",
+        "name",
+        SortKey("certifier", ["certifier__name", "name"]),
+    ],
+    default_sort="name",
+    columns=[
+        {"field": "id", "label": "ID"},
+        {"field": "name", "label": "Nome da Certificação"},
+        {"field": "certifier", "label": "Certificador"},
+        {"field": "examCode", "label": "Código do Exame"},
+        {"field": "duration", "label": "Duração (minutos)"},
+        {"field": "notes", "label": "Observações"},
+        {"field": "idle", "label": "Inativo"},
+    ],
+    cells=[
+        Cell("id"),
+        LinkCell("name", "certification_detail", pk_field="id"),
+        DimensionCell("certifier_id", CERTIFIER_DIMENSION),
+        Cell("examCode"),
+        Cell("duration"),
+        Cell("notes"),
+        BooleanCell("idle"),
+    ],
+    values=(
+        "id",
+        "name",
+        "certifier_id",
+        "examCode",
+        "duration",
+        "notes",
+        "idle",
+    ),
+)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certifications', '0002_rename_durantion_certification_duration'),
+        ('certifiers', '0002_certifier_tb_certifier_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['name'], name='tb_certification_name_idx'),
+        ),
+    ]
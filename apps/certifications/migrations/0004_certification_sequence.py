@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+NUMBER_DIGITS = 4
+
+
+def create_sequences(apps, schema_editor):
+    """
+    Cria a sequência de cada sigla (a dos Certificadores e as que aparecem
+    nos IDs já cadastrados) a partir do maior número já usado.
+    """
+    Certifier = apps.get_model("certifiers", "Certifier")
+    Certification = apps.get_model("certifications", "Certification")
+    CertificationSequence = apps.get_model(
+        "certifications", "CertificationSequence"
+    )
+    using = schema_editor.connection.alias
+
+    last_numbers = dict.fromkeys(
+        Certifier.objects.using(using).values_list("abbreviation", flat=True),
+        0,
+    )
+    for certification_id in (
+        Certification.objects.using(using).values_list("id", flat=True)
+    ):
+        prefix = certification_id[:-NUMBER_DIGITS]
+        number = certification_id[-NUMBER_DIGITS:]
+        if prefix and number.isdigit():
+            last_numbers[prefix] = max(
+                last_numbers.get(prefix, 0), int(number)
+            )
+
+    CertificationSequence.objects.using(using).bulk_create([
+        CertificationSequence(prefix=prefix, next_number=number + 1)
+        for prefix, number in last_numbers.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certifications', '0003_certification_tb_certification_name_idx'),
+        ('certifiers', '0002_certifier_tb_certifier_name_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CertificationSequence',
+            fields=[
+                ('prefix', models.CharField(
+                    max_length=3, primary_key=True, serialize=False
+                )),
+                ('next_number', models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                'db_table': 'tb_certification_sequence',
+            },
+        ),
+        migrations.RunPython(create_sequences, migrations.RunPython.noop),
+    ]
@@ -5,8 +5,7 @@ Definições dos modelos do aplicativo 'certifications'.
 """
 
 from django.db import models
-from django.db.models.signals import pre_save
-from django.dispatch import receiver
+from django.db.models.functions import Now
 
 from apps.certifiers.models import Certifier
 
@@ -21,39 +20,55 @@ class Certification(models.Model):
     duration = models.PositiveIntegerField(default=0, blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
     idle = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+
+    class Meta:
+        """Meta-informações para o modelo Certification."""
+        db_table = "tb_certification"
+        indexes = [
+            models.Index(fields=["name"], name="tb_certification_name_idx"),
+        ]
 
     def __str__(self):
         """Retorna uma representação em string do objeto Certification."""
         return f"Certificação: {self.name} ({self.examCode})"
 
-    class Meta:
-        """Meta-informações para o modelo Certification."""
-        db_table = "tb_certification"
+    def save(self, *args, **kwargs):
+        """
+        Sobrescreve o método save para definir o ID de uma nova
+        Certificação pela sequência da sigla do Certificador, no padrão
+        "ABC0001" (ver ``sequences.py``).
 
+        A Certificação nova é gravada com INSERT forçado, para nunca
+        sobrescrever uma Certificação com o mesmo ID.
+        """
+        if self._state.adding and not self.id:
+            from .sequences import save_with_new_id
+            kwargs["force_insert"] = True
+            parent_save = super().save
+            save_with_new_id(
+                self,
+                lambda: parent_save(*args, **kwargs),
+                using=kwargs.get("using"),
+            )
+            return
+        super().save(*args, **kwargs)
 
-@receiver(pre_save, sender=Certification)
-def set_certification_id(sender, instance, **kwargs):
-
-    # Lógica para definir o ID da certificação
-    if not instance.id:
-        # Geração de um ID único baseado na Sigla do Certificador
-        examCode = instance.certifier.abbreviation
-
-        # Obtenção do último ID usado para a certificação com o mesmo examCode
-        last_certification = (
-            Certification.objects.
-            filter(id__startswith=examCode)
-            .order_by('-id')
-            .first()
-        )
-
-        if last_certification:
-            # Incrementação do Número Sequencial
-            last_number = int(last_certification.id[-4:])
-            new_number = last_number + 1
-        else:
-            # Se não houver certificações anteriores, inicia com 1
-            new_number = 1
-
-        # Formatação do novo ID com o padrão "ABC0001"
-        instance.id = f"{examCode}{new_number:04d}"
+
+class CertificationSequence(models.Model):
+    """
+    Próximo número sequencial dos IDs de Certificações de uma sigla.
+
+    Lido e incrementado sob ``select_for_update`` (ver ``sequences.py``).
+    """
+
+    prefix = models.CharField(max_length=3, primary_key=True)
+    next_number = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        """Meta-informações para o modelo CertificationSequence."""
+        db_table = "tb_certification_sequence"
+
+    def __str__(self):
+        """Retorna uma representação em string da sequência."""
+        return f"Sequência {self.prefix}: próximo número {self.next_number}"
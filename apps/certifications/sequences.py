@@ -0,0 +1,223 @@
+# apps/certifications/sequences.py
+
+"""
+Sequências dos IDs de Certificações, por sigla.
+
+O ID de uma Certificação é a sigla do Certificador seguida de um número
+sequencial de 4 dígitos (ex.: "ABC0001"). O próximo número de cada sigla
+fica em ``tb_certification_sequence`` e é lido e incrementado sob
+``select_for_update``, sem ordenar IDs como texto. Cargas em massa reservam
+um intervalo de IDs de uma só vez com ``reserve_certification_ids``.
+
+A sequência é identificada pela sigla, e não pelo Certificador: após a
+troca da sigla de um Certificador, os IDs já emitidos com a sigla anterior
+continuam reservados na sequência dela.
+
+Novas Certificações são gravadas com INSERT forçado
+(``save_with_new_id``): se o ID gerado já existir (ex.: Certificações
+gravadas com ID explícito por ``loaddata``), a sequência é avançada além
+do maior ID cadastrado e a gravação é repetida, em vez de sobrescrever a
+Certificação existente.
+
+O ID é limitado a 7 caracteres (``Certification.id``): ao passar de
+``MAX_NUMBER``, a reserva é recusada com ``ValidationError`` em vez de gerar
+IDs maiores que a coluna.
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, router, transaction
+
+from apps.certifiers.models import Certifier
+
+from .models import Certification, CertificationSequence
+
+NUMBER_DIGITS = 4
+MAX_NUMBER = 10 ** NUMBER_DIGITS - 1
+
+# Tentativas de gravar uma nova Certificação quando o ID gerado já existe
+ID_INSERT_ATTEMPTS = 3
+
+
+def format_certification_id(abbreviation, number):
+    """Formata o ID de uma Certificação, ex.: ("ABC", 1) -> "ABC0001"."""
+    return f"{abbreviation}{number:0{NUMBER_DIGITS}d}"
+
+
+def parse_certification_number(abbreviation, certification_id):
+    """
+    Retorna o número sequencial de um ID da sigla informada, ou None se o
+    ID não pertencer à sigla (ex.: "ABC0001" não pertence a "AB").
+    """
+    number = certification_id[len(abbreviation):]
+    if (
+        not certification_id.startswith(abbreviation)
+        or len(number) != NUMBER_DIGITS
+        or not number.isdigit()
+    ):
+        return None
+    return int(number)
+
+
+def _initial_number(abbreviation, using):
+    """Próximo número livre, a partir das Certificações já cadastradas."""
+    numbers = [
+        parse_certification_number(abbreviation, certification_id)
+        for certification_id in (
+            Certification.objects.using(using)
+            .filter(id__startswith=abbreviation)
+            .values_list("id", flat=True)
+        )
+    ]
+    return max(filter(None, numbers), default=0) + 1
+
+
+def reserve_numbers(abbreviation, count, using=None):
+    """
+    Reserva ``count`` números consecutivos na sequência da sigla.
+
+    Args:
+        abbreviation (str): Sigla do Certificador (prefixo dos IDs).
+        count (int): Quantidade de números reservados.
+        using (str): Alias do banco de dados.
+
+    Returns:
+        range: Números reservados.
+
+    Raises:
+        ValueError: Se ``count`` for menor que 1.
+        ValidationError: Se a reserva ultrapassar ``MAX_NUMBER``.
+    """
+    if count < 1:
+        raise ValueError("A quantidade de IDs reservados deve ser positiva.")
+    using = using or router.db_for_write(Certification)
+
+    with transaction.atomic(using=using):
+        sequence = _locked_sequence(abbreviation, using)
+        start = sequence.next_number
+        if start + count - 1 > MAX_NUMBER:
+            raise ValidationError(
+                f"Limite de IDs de Certificações atingido para o "
+                f"Certificador {abbreviation} "
+                f"({format_certification_id(abbreviation, MAX_NUMBER)})."
+            )
+        CertificationSequence.objects.using(using).filter(
+            prefix=abbreviation
+        ).update(next_number=start + count)
+
+    return range(start, start + count)
+
+
+def _locked_sequence(abbreviation, using):
+    """
+    Sequência da sigla sob ``select_for_update``, criada a partir das
+    Certificações já cadastradas se ainda não existir.
+    """
+    sequences = CertificationSequence.objects.using(using)
+    sequence = (
+        sequences.select_for_update().filter(prefix=abbreviation).first()
+    )
+    if sequence is None:
+        # Primeira Certificação com a sigla
+        try:
+            with transaction.atomic(using=using):
+                sequence = sequences.create(
+                    prefix=abbreviation,
+                    next_number=_initial_number(abbreviation, using),
+                )
+        except IntegrityError:
+            # Criada por outro processo em paralelo
+            sequence = sequences.select_for_update().get(prefix=abbreviation)
+    return sequence
+
+
+def skip_used_numbers(abbreviation, using=None):
+    """
+    Avança a sequência da sigla para depois do maior ID cadastrado (ex.:
+    após Certificações gravadas com ID explícito).
+    """
+    using = using or router.db_for_write(Certification)
+    with transaction.atomic(using=using):
+        sequence = _locked_sequence(abbreviation, using)
+        next_number = _initial_number(abbreviation, using)
+        if next_number > sequence.next_number:
+            CertificationSequence.objects.using(using).filter(
+                prefix=abbreviation
+            ).update(next_number=next_number)
+
+
+def reserve_certification_ids(certifier, count, using=None):
+    """
+    Reserva ``count`` IDs de Certificações do Certificador.
+
+    Args:
+        certifier (Certifier): Certificador.
+        count (int): Quantidade de IDs reservados.
+        using (str): Alias do banco de dados.
+
+    Returns:
+        list: IDs reservados, em ordem.
+    """
+    numbers = reserve_numbers(certifier.abbreviation, count, using=using)
+    return [
+        format_certification_id(certifier.abbreviation, number)
+        for number in numbers
+    ]
+
+
+def next_certification_id(certification, using=None):
+    """
+    Retorna o ID de uma nova Certificação.
+
+    A sigla é lida do Certificador já carregado na instância ou, se ele
+    ainda não foi carregado, apenas a coluna ``abbreviation``.
+    """
+    if Certification.certifier.is_cached(certification):
+        abbreviation = certification.certifier.abbreviation
+    else:
+        abbreviation = (
+            Certifier.objects.using(using)
+            .values_list("abbreviation", flat=True)
+            .get(pk=certification.certifier_id)
+        )
+    number = reserve_numbers(abbreviation, 1, using=using)[0]
+    return format_certification_id(abbreviation, number)
+
+
+def save_with_new_id(certification, save, using=None):
+    """
+    Grava uma nova Certificação com um ID gerado pela sequência da sigla.
+
+    ``save`` deve gravar com ``force_insert=True``: um ID já existente gera
+    ``IntegrityError`` em vez de um UPDATE da outra Certificação. Nesse
+    caso, a sequência é avançada além do maior ID cadastrado e a gravação é
+    repetida.
+
+    Args:
+        certification (Certification): Certificação nova, sem ID.
+        save (callable): Grava a Certificação (sem argumentos).
+        using (str): Alias do banco de dados.
+
+    Raises:
+        IntegrityError: Se a gravação falhar por outro motivo, ou se o ID
+            continuar em uso após ``ID_INSERT_ATTEMPTS`` tentativas.
+        ValidationError: Se a sequência ultrapassar ``MAX_NUMBER``.
+    """
+    using = using or router.db_for_write(Certification)
+    for attempt in range(1, ID_INSERT_ATTEMPTS + 1):
+        certification.id = next_certification_id(certification, using=using)
+        try:
+            with transaction.atomic(using=using):
+                save()
+            return
+        except IntegrityError:
+            certification_id, certification.id = certification.id, None
+            if (
+                attempt == ID_INSERT_ATTEMPTS
+                or not Certification.objects.using(using)
+                .filter(pk=certification_id)
+                .exists()
+            ):
+                raise
+            skip_used_numbers(
+                certification_id[:-NUMBER_DIGITS], using=using
+            )
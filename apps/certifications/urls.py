@@ -23,6 +23,11 @@ urlpatterns = [
         views.certification_list,
         name="certification_list"
     ),
+    path(
+        "certification/autocomplete/",
+        views.certification_autocomplete,
+        name="certification_autocomplete"
+    ),
     path(
         "certification/new/",
         views.certification_new,
@@ -6,19 +6,43 @@ Definição das views para o aplicativo Certification.
 
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
 from django.db import IntegrityError, DatabaseError
-from django.db.models import Q, ProtectedError
+from django.db.models import ProtectedError
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
-from django.utils.safestring import mark_safe
 
+from apps.certifiers.lists import certifier_options
+from apps.utils.autocomplete import autocomplete_response
+from apps.utils.conditional import detail_condition
 from apps.utils.json_responses import json_error_response, log_exception
+from apps.utils.list_engine import render_list
+from apps.utils.object_cache import ObjectCache
 
 from .forms import CertificationForm
+from .lists import (
+    CERTIFICATION_LIST,
+    CERTIFICATION_OPTION_VALUES,
+    certification_option_label,
+    certification_option_q,
+)
 from .models import Certification, Certifier
 
+# Campos exibidos na página de detalhe, mantidos em cache
+CERTIFICATION_DETAIL = ObjectCache(
+    Certification,
+    fields=(
+        "name",
+        "idle",
+        "examCode",
+        "duration",
+        "notes",
+        "updated_at",
+        "certifier__name",
+        "certifier__abbreviation",
+    ),
+)
+
 
 def certification_home(request):
     """View para a página inicial de Certificações."""
@@ -29,57 +53,6 @@ def certification_home(request):
 def certification_list(request):
     """View para Listar as Certificações."""
 
-    # Obtenção dos Filtros
-    query = request.GET.get("certification-list-query")
-    certifier = request.GET.get("certification-list-certifier")
-    idle = request.GET.get("certification-list-idle")
-
-    # Ordenação
-    order_by = request.GET.get("order_by", "name")
-    descending = request.GET.get("descending", "False") == "True"
-
-    # Otimização da Consulta
-    certification = Certification.objects.select_related("certifier")
-
-    # Filtragem
-    if query:
-        certification = certification.filter(
-            Q(name__icontains=query) |
-            Q(examCode__icontains=query)
-        )
-
-    if certifier:
-        certification = certification.filter(certifier__id=certifier)
-
-    if idle in ["True", "False"]:
-        certification = certification.filter(idle=(idle == "True"))
-
-    # Aplicação dos Filtros da Ordenação
-    if descending:
-        order_by = f"-{order_by}"
-    certification = certification.order_by(order_by)
-
-    # Registros por Página
-    records_per_page = request.GET.get("records_per_page", 20)
-    try:
-        records_per_page = int(records_per_page)
-    except (ValueError, TypeError):
-        records_per_page = 10
-
-    # Paginação
-    paginator = Paginator(certification, records_per_page)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-
-    # Tratamento de Erros na Paginação
-    try:
-        page_obj = paginator.get_page(page_number)
-    except (ValueError, TypeError):
-        page_obj = paginator.get_page(1)
-
-    # Busca e Ordenação das Opções de Seleção
-    certifiers = Certifier.objects.order_by("name")
-
     # Definição dos Campos de Pesquisa
     search_fields = [
         {
@@ -95,10 +68,9 @@ def certification_list(request):
             "name": "certification-list-certifier",
             "label": "Selecione o Certificador",
             "type": "select",
-            "options": [
-                (certifier.id, f"{certifier.name} ({certifier.abbreviation})")
-                for certifier in certifiers
-            ],
+            # Opções carregadas apenas quando o bloco não está em cache
+            "options": certifier_options,
+            "options_model": Certifier,
             "selected": request.GET.get("certifier", ""),
         },
         {
@@ -111,54 +83,32 @@ def certification_list(request):
         },
     ]
 
-    context = {
-        "certification": certification,
-        "page_obj": page_obj,
-        "search_fields": search_fields,
-        "query_params": request.GET.urlencode(),
-        "headers": [
-            {"field": "id", "label": "ID"},
-            {"field": "name", "label": "Nome da Certificação"},
-            {"field": "certifier", "label": "Certificador"},
-            {"field": "examCode", "label": "Código do Exame"},
-            {"field": "duration", "label": "Duração (minutos)"},
-            {"field": "notes", "label": "Observações"},
-            {"field": "idle", "label": "Inativo"},
-        ],
-        "rows": [
-            [
-                certification.id,
-                mark_safe(
-                    f'<a href="{reverse(
-                        "certification_detail",
-                        args=[certification.id]
-                    )}">{certification.name}</a>'
-                ),
-                certification.certifier.name,
-                certification.examCode,
-                certification.duration,
-                certification.notes,
-                "Sim" if certification.idle else "Não",
-            ]
-            for certification in page_obj
-        ],
-    }
-
-    if request.headers.get("x-requested-with") == "XMLHttpRequest":
-        return render(request, "includes/table.html", context)
-    else:
-        return render(
-            request,
-            "certifications/certifications_list.html",
-            context
-        )
+    return render_list(
+        request,
+        CERTIFICATION_LIST,
+        "certifications/certifications_list.html",
+        {"search_fields": search_fields},
+    )
 
 
+def certification_autocomplete(request):
+    """View de autocompletar Certificações nos campos select2."""
+
+    return autocomplete_response(
+        request,
+        Certification.objects.order_by("name", "pk"),
+        search=certification_option_q,
+        label=certification_option_label,
+        values=CERTIFICATION_OPTION_VALUES,
+    )
+
+
+@detail_condition(Certification, objects=CERTIFICATION_DETAIL)
 def certification_detail(request, pk):
     """View para Visualizar os Detalhes de uma Certificação."""
 
     # Obtenção dos Filtros
-    certification = get_object_or_404(Certification, pk=pk)
+    certification = CERTIFICATION_DETAIL.get_or_404(request, pk)
 
     # Mensagem de confirmação de exclusão do Certificador
     message_confirmation_delete = (
@@ -286,6 +236,8 @@ def certification_new(request):
                     request,
                     "Erro: Já existe uma Certificação com este ID."
                 )
+            except ValidationError as e:
+                messages.error(request, " ".join(e.messages))
             except DatabaseError as e:
                 log_exception(
                     exception=e,
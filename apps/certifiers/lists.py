@@ -0,0 +1,70 @@
+# apps/certifiers/lists.py
+
+"""
+Especificação da listagem de Certificadores e da dimensão (cache local)
+de Certificadores.
+"""
+
+from django.db.models import Q
+
+from apps.utils.dimensions import Dimension
+from apps.utils.list_engine import BooleanFilter, ListSpec, SearchFilter
+from apps.utils.tables import BooleanCell, Cell, LinkCell
+
+from .models import Certifier
+
+# Colunas carregadas nos campos de seleção (autocompletar)
+CERTIFIER_OPTION_VALUES = ("id", "name", "abbreviation")
+
+# Certificadores em memória, para rótulos e opções sem consultas
+CERTIFIER_DIMENSION = Dimension(
+    Certifier, CERTIFIER_OPTION_VALUES, ordering=("name", "pk")
+)
+
+
+def certifier_option_label(row):
+    """Rótulo de um Certificador nos campos de seleção."""
+    _, name, abbreviation = row
+    return f"{name} ({abbreviation})"
+
+
+def certifier_options():
+    """Opções de todos os Certificadores para os campos de seleção."""
+    return [
+        (record.pk, certifier_option_label(record))
+        for record in CERTIFIER_DIMENSION.all()
+    ]
+
+
+def certifier_option_q(term):
+    """Busca de Certificadores por prefixo do nome ou da sigla."""
+    return (
+        Q(name__istartswith=term)
+        | Q(abbreviation__istartswith=term)
+    )
+
+
+CERTIFIER_LIST = ListSpec(
+    Certifier,
+    filters=[
+        SearchFilter("certifier-list-query", ["name", "abbreviation"]),
+        BooleanFilter("certifier-list-idle", "idle"),
+    ],
+    sort_keys=["id", "name", "abbreviation"],
+    default_sort="name",
+    columns=[
+        {"field": "id", "label": "ID"},
+        {"field": "name", "label": "Nome"},
+        {"field": "abbreviation", "label": "Sigla"},
+        {"field": "notes", "label": "Observações"},
+        {"field": "idle", "label": "Inativo"},
+    ],
+    cells=[
+        Cell("id"),
+        LinkCell("name", "certifier_detail", pk_field="id"),
+        Cell("abbreviation"),
+        Cell("notes"),
+        BooleanCell("idle"),
+    ],
+    values=("id", "name", "abbreviation", "notes", "idle"),
+)
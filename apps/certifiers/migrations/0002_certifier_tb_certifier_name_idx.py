@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certifiers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certifier',
+            index=models.Index(fields=['name'], name='tb_certifier_name_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:00
+
+from django.db import migrations, models
+from django.db.models.functions import Now
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certifiers', '0002_certifier_tb_certifier_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='certifier',
+            name='updated_at',
+            field=models.DateTimeField(
+                auto_now=True, db_default=Now()
+            ),
+        ),
+    ]
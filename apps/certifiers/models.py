@@ -5,6 +5,7 @@ Definições dos modelos do aplicativo 'certifiers'.
 """
 
 from django.db import models
+from django.db.models.functions import Now
 
 
 class Certifier(models.Model):
@@ -15,6 +16,7 @@ class Certifier(models.Model):
     abbreviation = models.CharField(max_length=3, unique=True)
     notes = models.TextField(blank=True, null=True)
     idle = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     def save(self, *args, **kwargs):
         """
@@ -32,3 +34,6 @@ class Certifier(models.Model):
     class Meta:
         """Meta-informações para o modelo Certifier."""
         db_table = "tb_certifier"
+        indexes = [
+            models.Index(fields=["name"], name="tb_certifier_name_idx"),
+        ]
@@ -15,6 +15,11 @@ urlpatterns = [
 
     # URLs de Certificadores
     path("certifier/list/", views.certifier_list, name="certifier_list"),
+    path(
+        "certifier/autocomplete/",
+        views.certifier_autocomplete,
+        name="certifier_autocomplete"
+    ),
     path(
         "certifier/<int:pk>/",
         views.certifier_detail,
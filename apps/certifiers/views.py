@@ -6,19 +6,39 @@ Definição das views para o aplicativo Certifier.
 
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
 from django.db import IntegrityError, DatabaseError
-from django.db.models import Q, ProtectedError
+from django.db.models import ProtectedError
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
-from django.utils.safestring import mark_safe
 
+from apps.utils.autocomplete import autocomplete_response
+from apps.utils.conditional import detail_condition
 from apps.utils.json_responses import json_error_response, log_exception
+from apps.utils.list_engine import render_list
+from apps.utils.object_cache import ObjectCache
 
 from .forms import CertifierForm
+from .lists import (
+    CERTIFIER_LIST,
+    CERTIFIER_OPTION_VALUES,
+    certifier_option_label,
+    certifier_option_q,
+)
 from .models import Certifier
 
+# Campos exibidos na página de detalhe, mantidos em cache
+CERTIFIER_DETAIL = ObjectCache(
+    Certifier,
+    fields=(
+        "abbreviation",
+        "name",
+        "idle",
+        "notes",
+        "updated_at",
+    ),
+)
+
 
 def certifier_home(request):
     """View para a Página Inicial de Certificadores."""
@@ -29,50 +49,6 @@ def certifier_home(request):
 def certifier_list(request):
     """View para Listar os Certificadores."""
 
-    # Obtenção dos Filtros
-    query = request.GET.get("certifier-list-query")
-    idle = request.GET.get("certifier-list-idle")
-
-    # Ordenação
-    order_by = request.GET.get("order_by", "name")
-    descending = request.GET.get("descending", "False") == "True"
-
-    # Otimização da Consulta
-    certifier = Certifier.objects.all()
-
-    # Filtragem
-    if query:
-        certifier = certifier.filter(
-            Q(name__icontains=query) |
-            Q(abbreviation__icontains=query)
-        )
-
-    if idle in ["True", "False"]:
-        certifier = certifier.filter(idle=(idle == "True"))
-
-    # Aplicação de Filtros da Ordenação
-    if descending:
-        order_by = f"-{order_by}"
-    certifier = certifier.order_by(order_by)
-
-    # Registros por Página
-    records_per_page = request.GET.get("records_per_page", 20)
-    try:
-        records_per_page = int(records_per_page)
-    except (ValueError, TypeError):
-        records_per_page = 10
-
-    # Paginação
-    paginator = Paginator(certifier, records_per_page)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-
-    # Tratamento de Erros na Paginação
-    try:
-        page_obj = paginator.get_page(page_number)
-    except (ValueError, TypeError):
-        page_obj = paginator.get_page(1)
-
     # Definição dos Campos de Pesquisa
     search_fields = [
         {
@@ -93,46 +69,32 @@ def certifier_list(request):
         },
     ]
 
-    context = {
-        "certifier": certifier,
-        "page_obj": page_obj,
-        "search_fields": search_fields,
-        "query_params": request.GET.urlencode(),
-        "headers": [
-            {"field": "id", "label": "ID"},
-            {"field": "name", "label": "Nome"},
-            {"field": "abbreviation", "label": "Sigla"},
-            {"field": "notes", "label": "Observações"},
-            {"field": "idle", "label": "Inativo"},
-        ],
-        "rows": [
-            [
-                certifier.id,
-                mark_safe(
-                    f'<a href="{reverse(
-                        "certifier_detail",
-                        args=[certifier.id]
-                    )}">{certifier.name}</a>'
-                ),
-                certifier.abbreviation,
-                certifier.notes,
-                "Sim" if certifier.idle else "Não",
-            ]
-            for certifier in page_obj
-        ],
-    }
-
-    if request.headers.get("x-requested-with") == "XMLHttpRequest":
-        return render(request, "includes/table.html", context)
-    else:
-        return render(request, "certifiers/certifiers_list.html", context)
+    return render_list(
+        request,
+        CERTIFIER_LIST,
+        "certifiers/certifiers_list.html",
+        {"search_fields": search_fields},
+    )
 
 
+def certifier_autocomplete(request):
+    """View de autocompletar Certificadores nos campos select2."""
+
+    return autocomplete_response(
+        request,
+        Certifier.objects.order_by("name", "pk"),
+        search=certifier_option_q,
+        label=certifier_option_label,
+        values=CERTIFIER_OPTION_VALUES,
+    )
+
+
+@detail_condition(Certifier, objects=CERTIFIER_DETAIL)
 def certifier_detail(request, pk):
     """View para Visualizar os Detalhes de um Certificador."""
 
     # Obtenção dos Filtros
-    certifier = get_object_or_404(Certifier, pk=pk)
+    certifier = CERTIFIER_DETAIL.get_or_404(request, pk)
 
     # Mensagem de confirmação de exclusão do Certificador
     message_confirmation_delete = (
@@ -12,3 +12,7 @@ class ClientsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.clients"
+
+    def ready(self):
+        """Registra os receptores de sinais do índice de busca."""
+        from . import search  # noqa: F401
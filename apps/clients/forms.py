@@ -75,3 +75,24 @@ class ClientForm(forms.ModelForm):
 
         model = Client
         fields = ["name", "country", "city", "notes", "idle"]
+
+
+class ClientImportForm(forms.Form):
+    """
+    Formulário para importação de Clientes a partir de um arquivo CSV.
+    """
+
+    file = forms.FileField(
+        label="Arquivo CSV",
+        help_text=(
+            "Cabeçalho com as colunas: name (obrigatória), country, city, "
+            "notes e idle."
+        ),
+        widget=forms.ClearableFileInput(
+            attrs={
+                "class": "apps-form-input",
+                "id": "client-import-file",
+                "accept": ".csv,text/csv",
+            }
+        ),
+    )
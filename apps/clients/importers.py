@@ -0,0 +1,135 @@
+# apps/clients/importers.py
+
+"""
+Importação em massa de Clientes a partir de arquivos CSV.
+
+O arquivo é lido linha a linha (``csv.DictReader``) e processado em lotes
+de ``batch_size`` linhas: cada lote é validado, recebe UIDs reservados de
+uma só vez (``uids.reserve_uids``) e é gravado com ``bulk_create`` em uma
+transação. O consumo de memória depende apenas do tamanho do lote, e não do
+tamanho do arquivo.
+
+Colunas aceitas (cabeçalho obrigatório): ``name`` (obrigatória),
+``country``, ``city``, ``notes`` e ``idle``.
+"""
+
+import csv
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, router, transaction
+
+from apps.utils.cache_versions import bump_version
+from apps.utils.imports import (
+    ImportResult,
+    error_message,
+    normalize_header,
+    parse_boolean,
+)
+
+from .models import Client
+from .search import index_clients
+from .uids import UID_INSERT_ATTEMPTS, reserve_uids, sync_counter
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def build_client(row):
+    """
+    Monta e valida um Cliente a partir de uma linha do CSV.
+
+    Args:
+        row (dict): Linha lida pelo ``csv.DictReader``.
+
+    Returns:
+        Client: Cliente validado, ainda sem UID.
+
+    Raises:
+        ValidationError: Se algum valor for inválido.
+    """
+    client = Client(
+        name=(row.get("name") or "").strip().upper(),
+        country=(row.get("country") or "").strip() or None,
+        city=(row.get("city") or "").strip() or None,
+        notes=(row.get("notes") or "").strip() or None,
+        idle=parse_boolean("idle", row.get("idle")),
+    )
+    client.clean_fields(exclude=["uid"])
+    return client
+
+
+def save_batch(clients, using):
+    """
+    Grava um lote de Clientes validados com UIDs reservados.
+
+    Se algum UID reservado já existir (Cliente gravado com UID explícito),
+    o contador é avançado (``uids.sync_counter``) e o lote é gravado com
+    novos UIDs.
+    """
+    for attempt in range(1, UID_INSERT_ATTEMPTS + 1):
+        uids = reserve_uids(len(clients), using)
+        try:
+            with transaction.atomic(using=using):
+                for client, uid in zip(clients, uids):
+                    client.uid = uid
+                Client.objects.using(using).bulk_create(clients)
+                index_clients(
+                    [(client.uid, client.name) for client in clients],
+                    using=using,
+                )
+            return
+        except IntegrityError:
+            if (
+                attempt == UID_INSERT_ATTEMPTS
+                or not Client.objects.using(using)
+                .filter(pk__in=uids)
+                .exists()
+            ):
+                raise
+            sync_counter(using)
+
+
+def import_clients(lines, batch_size=IMPORT_BATCH_SIZE, using=None):
+    """
+    Importa Clientes de um arquivo CSV.
+
+    Linhas inválidas são ignoradas e registradas no resultado; as demais são
+    gravadas em lotes.
+
+    Args:
+        lines (iterable): Linhas de texto do arquivo (ex.: arquivo aberto).
+        batch_size (int): Quantidade de linhas por lote.
+        using (str): Alias do banco de dados.
+
+    Returns:
+        ImportResult: Quantidade de Clientes criados e erros por linha.
+
+    Raises:
+        ValidationError: Se o cabeçalho não tiver a coluna ``name``.
+    """
+    using = using or router.db_for_write(Client)
+    result = ImportResult()
+
+    reader = csv.DictReader(lines)
+    normalize_header(reader, required=["name"])
+
+    batch = []
+    for row in reader:
+        try:
+            batch.append(build_client(row))
+        except ValidationError as e:
+            result.add_error(reader.line_num, error_message(e))
+            continue
+        if len(batch) >= batch_size:
+            save_batch(batch, using)
+            result.created += len(batch)
+            batch = []
+
+    if batch:
+        save_batch(batch, using)
+        result.created += len(batch)
+
+    if result.created:
+        # bulk_create não dispara os sinais de post_save
+        transaction.on_commit(lambda: bump_version(Client), using=using)
+
+    return result
@@ -0,0 +1,72 @@
+# apps/clients/lists.py
+
+"""
+Especificação da listagem de Clientes e das opções de Cliente nos
+campos de seleção (autocompletar).
+"""
+
+from django.db.models import Q
+
+from apps.utils.autocomplete import prefix_q
+from apps.utils.list_engine import BooleanFilter, ListSpec
+from apps.utils.tables import BooleanCell, Cell, LinkCell
+
+from .models import Client
+from .search import ClientSearchFilter
+
+# Quantidade de dígitos dos UIDs (iniciam em 10000000)
+UID_DIGITS = 8
+
+# Colunas carregadas nas opções de Cliente dos campos de seleção
+CLIENT_OPTION_VALUES = ("uid", "name")
+
+
+def client_option_label(row):
+    """Rótulo de um Cliente nos campos de seleção."""
+    uid, name = row
+    return f"{uid}: {name}"
+
+
+def client_option_q(term):
+    """
+    Busca de Clientes por prefixo do nome ou do UID (colunas indexadas).
+
+    Os nomes são gravados em caixa alta, então o prefixo também é.
+    """
+    condition = prefix_q("name", term.upper())
+    if term.isdigit() and len(term) <= UID_DIGITS:
+        padding = UID_DIGITS - len(term)
+        condition |= Q(uid__range=(
+            int(term + "0" * padding),
+            int(term + "9" * padding),
+        ))
+    return condition
+
+
+CLIENT_LIST = ListSpec(
+    Client,
+    filters=[
+        ClientSearchFilter("client-list-query"),
+        BooleanFilter("client-list-idle", "idle"),
+    ],
+    sort_keys=["uid", "name"],
+    default_sort="name",
+    columns=[
+        {"field": "uid", "label": "ID"},
+        {"field": "name", "label": "Nome"},
+        {"field": "country", "label": "País"},
+        {"field": "city", "label": "Cidade"},
+        {"field": "notes", "label": "Observações"},
+        {"field": "idle", "label": "Inativo"},
+    ],
+    cells=[
+        Cell("uid"),
+        LinkCell("name", "client_detail", pk_field="uid"),
+        Cell("country"),
+        Cell("city"),
+        Cell("notes"),
+        BooleanCell("idle"),
+    ],
+    values=("uid", "name", "country", "city", "notes", "idle"),
+    approximate_count=True,
+)
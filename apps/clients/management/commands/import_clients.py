@@ -0,0 +1,73 @@
+# apps/clients/management/commands/import_clients.py
+
+"""
+Comando para importar Clientes de um arquivo CSV.
+
+Uso: ``python manage.py import_clients clientes.csv [--batch-size N]``
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.management import BaseCommand, CommandError
+
+from apps.clients.importers import IMPORT_BATCH_SIZE, import_clients
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa Clientes de um arquivo CSV "
+        "(colunas: name, country, city, notes, idle)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Caminho do arquivo CSV.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Quantidade de linhas gravadas por lote.",
+        )
+        parser.add_argument(
+            "--encoding",
+            default="utf-8-sig",
+            help="Codificação do arquivo.",
+        )
+        parser.add_argument(
+            "--database",
+            default=None,
+            help="Alias do banco de dados.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size deve ser maior que zero.")
+
+        try:
+            with open(
+                options["path"], encoding=options["encoding"], newline=""
+            ) as csv_file:
+                result = import_clients(
+                    csv_file,
+                    batch_size=options["batch_size"],
+                    using=options["database"],
+                )
+        except OSError as e:
+            raise CommandError(f"Erro ao abrir o arquivo: {e}") from e
+        except UnicodeDecodeError as e:
+            raise CommandError(
+                f"Erro de codificação do arquivo: {e}"
+            ) from e
+        except ValidationError as e:
+            raise CommandError(" ".join(e.messages)) from e
+
+        for line, message in result.errors:
+            self.stderr.write(f"Linha {line}: {message}")
+        if result.error_count > len(result.errors):
+            self.stderr.write(
+                f"... e mais {result.error_count - len(result.errors)} "
+                f"erro(s)."
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.created} Cliente(s) importado(s), "
+            f"{result.error_count} linha(s) com erro."
+        ))
@@ -0,0 +1,53 @@
+# Cria o índice de busca textual de Clientes (ver apps/clients/search.py)
+
+from django.db import DatabaseError, migrations
+
+SEARCH_TABLE = "tb_client_search"
+
+
+def create_search_index(apps, schema_editor):
+    """Cria e popula a tabela-sombra de busca (SQLite FTS5 / MySQL)."""
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        try:
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {SEARCH_TABLE} "
+                f"USING fts5(document, tokenize='trigram')"
+            )
+        except DatabaseError:
+            # SQLite sem FTS5/trigram: a busca continua usando icontains
+            return
+        schema_editor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, document) "
+            f"SELECT uid, uid || ' ' || COALESCE(name, '') FROM tb_client"
+        )
+    elif connection.vendor == "mysql":
+        schema_editor.execute(
+            f"CREATE TABLE {SEARCH_TABLE} ("
+            f"uid INTEGER NOT NULL PRIMARY KEY, "
+            f"document VARCHAR(300) NOT NULL, "
+            f"FULLTEXT KEY {SEARCH_TABLE}_document_ft (document) "
+            f"WITH PARSER ngram"
+            f") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (uid, document) "
+            f"SELECT uid, CONCAT(uid, ' ', COALESCE(name, '')) FROM tb_client"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    """Remove a tabela-sombra de busca."""
+    if schema_editor.connection.vendor in ("sqlite", "mysql"):
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_client_tb_client_name_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
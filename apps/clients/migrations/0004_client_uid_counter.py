@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+UID_START = 10000000
+
+
+def create_counter(apps, schema_editor):
+    """Inicia o contador de UIDs a partir do maior UID já cadastrado."""
+    Client = apps.get_model("clients", "Client")
+    ClientUIDCounter = apps.get_model("clients", "ClientUIDCounter")
+    using = schema_editor.connection.alias
+    last_uid = (
+        Client.objects.using(using)
+        .aggregate(models.Max("uid"))["uid__max"]
+    )
+    next_uid = UID_START if last_uid is None else max(last_uid + 1, UID_START)
+    ClientUIDCounter.objects.using(using).create(pk=1, next_uid=next_uid)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_client_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientUIDCounter',
+            fields=[
+                ('id', models.BigAutoField(
+                    auto_created=True,
+                    primary_key=True,
+                    serialize=False,
+                    verbose_name='ID',
+                )),
+                ('next_uid', models.BigIntegerField()),
+            ],
+            options={
+                'db_table': 'tb_client_uid_counter',
+            },
+        ),
+        migrations.RunPython(create_counter, migrations.RunPython.noop),
+    ]
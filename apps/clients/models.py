@@ -5,6 +5,7 @@ Definições dos modelos do aplicativo 'clients'.
 """
 
 from django.db import models
+from django.db.models.functions import Now
 
 
 class Client(models.Model):
@@ -16,13 +17,28 @@ class Client(models.Model):
     city = models.CharField(max_length=255, blank=True, null=True)
     notes = models.TextField(blank=True, null=True)
     idle = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+
+    class Meta:
+        """Meta-informações para o modelo Client."""
+
+        db_table = "tb_client"
+        indexes = [
+            models.Index(fields=["name"], name="tb_client_name_idx"),
+        ]
+
+    def __str__(self):
+        """Retorna uma representação em string do objeto Cliente."""
+        return f"Cliente: {self.uid} - {self.name}"
 
     def save(self, *args, **kwargs):
         """
         Sobrescreve o método save para definir o UID inicial
         e garantir que o nome seja salvo em caixa alta.
 
-        O UID é gerado automaticamente a partir do último ID utilizado.
+        O UID é obtido do alocador de UIDs (``uids.py``), que reserva
+        blocos no contador ``tb_client_uid_counter``; o Cliente novo é
+        gravado com INSERT forçado e, se o UID já existir, com outro UID.
         O nome é convertido para caixa alta para padronizar os dados.
         """
 
@@ -30,20 +46,36 @@ class Client(models.Model):
         if self.name:
             self.name = self.name.upper()
 
-        # Lógica para definir o UID inicial
+        # Lógica para definir o UID inicial (INSERT forçado, para nunca
+        # sobrescrever um Cliente com o mesmo UID)
         if self._state.adding and self.uid is None:
-            last_id = Client.objects.aggregate(models.Max("uid"))["uid__max"]
-            if last_id is None:
-                self.uid = 10000000
-            else:
-                self.uid = last_id + 1
+            from .uids import save_with_new_uid
+            kwargs["force_insert"] = True
+            parent_save = super().save
+            save_with_new_uid(
+                self,
+                lambda: parent_save(*args, **kwargs),
+                using=kwargs.get("using"),
+            )
+            return
         super().save(*args, **kwargs)
 
-    def __str__(self):
-        """Retorna uma representação em string do objeto Cliente."""
-        return f"Cliente: {self.uid} - {self.name}"
+
+class ClientUIDCounter(models.Model):
+    """
+    Contador dos UIDs de Clientes (linha única).
+
+    Guarda o próximo UID ainda não reservado; é lido e incrementado sob
+    ``select_for_update`` pelo alocador de UIDs (``uids.py``).
+    """
+
+    next_uid = models.BigIntegerField()
 
     class Meta:
-        """Meta-informações para o modelo Client."""
+        """Meta-informações para o modelo ClientUIDCounter."""
 
-        db_table = "tb_client"
+        db_table = "tb_client_uid_counter"
+
+    def __str__(self):
+        """Retorna uma representação em string do contador."""
+        return f"Próximo UID de Cliente: {self.next_uid}"
@@ -0,0 +1,205 @@
+# apps/clients/search.py
+
+"""
+Índice de busca textual de Clientes (nome e UID).
+
+O índice é uma tabela-sombra, ``tb_client_search``, mantida em sincronia
+com ``tb_client`` por sinais:
+
+- SQLite: tabela virtual FTS5 com o tokenizador ``trigram`` (rowid = UID),
+  que atende buscas por trecho de texto a partir de 3 caracteres;
+- MySQL: tabela com índice FULLTEXT (parser ``ngram``).
+
+A busca mantém a semântica de ``icontains`` sobre o nome e o UID e não
+altera a ordenação da listagem: o índice apenas seleciona os UIDs. Em
+outros bancos, ou para termos curtos demais para o índice, a busca volta a
+usar ``icontains``.
+"""
+
+from django.db import DatabaseError, connections, router
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.utils.list_engine import ListFilter
+
+from .models import Client
+
+SEARCH_TABLE = "tb_client_search"
+
+# Tamanho mínimo do termo atendido pelo índice em cada banco
+MIN_QUERY_LENGTH = {
+    "sqlite": 3,  # trigram
+    "mysql": 2,  # ngram_token_size padrão
+}
+
+_available = {}
+
+
+def get_connection():
+    """Retorna a conexão usada para ler os Clientes."""
+    return connections[router.db_for_read(Client)]
+
+
+def is_available(connection):
+    """
+    Indica se o índice de busca existe no banco da conexão.
+
+    O resultado é guardado por alias de conexão.
+    """
+    if connection.vendor not in MIN_QUERY_LENGTH:
+        return False
+    if connection.alias not in _available:
+        try:
+            tables = connection.introspection.table_names()
+        except DatabaseError:
+            return False
+        _available[connection.alias] = SEARCH_TABLE in tables
+    return _available[connection.alias]
+
+
+def document(uid, name):
+    """Texto indexado de um Cliente."""
+    return f"{uid} {name or ''}"
+
+
+def match_sql(connection, value):
+    """
+    Retorna o SQL (e parâmetros) que seleciona os UIDs que casam com o termo.
+
+    O termo é buscado como frase exata, para equivaler a ``icontains``.
+    """
+    if connection.vendor == "sqlite":
+        phrase = '"{}"'.format(value.replace('"', '""'))
+        return (
+            f"SELECT rowid FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s",
+            [phrase],
+        )
+    phrase = '"{}"'.format(value.replace('"', " "))
+    return (
+        f"SELECT uid FROM {SEARCH_TABLE} "
+        f"WHERE MATCH(document) AGAINST (%s IN BOOLEAN MODE)",
+        [phrase],
+    )
+
+
+class ClientSearchFilter(ListFilter):
+    """
+    Filtro da listagem de Clientes pelo índice de busca textual.
+
+    Equivale a ``Q(uid__icontains=valor) | Q(name__icontains=valor)``.
+    """
+
+    def __init__(self, param):
+        super().__init__(param, "uid")
+
+    def to_q(self, value):
+        value = value.strip()
+        if not value:
+            return None
+
+        connection = get_connection()
+        if (
+            is_available(connection)
+            and len(value) >= MIN_QUERY_LENGTH[connection.vendor]
+        ):
+            sql, params = match_sql(connection, value)
+            return Q(uid__in=RawSQL(sql, params))
+
+        return Q(uid__icontains=value) | Q(name__icontains=value)
+
+
+def index_client(uid, name, using=None):
+    """Insere ou atualiza um Cliente no índice de busca."""
+    connection = connections[using or router.db_for_write(Client)]
+    if not is_available(connection):
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [uid]
+            )
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, document) "
+                f"VALUES (%s, %s)",
+                [uid, document(uid, name)],
+            )
+        else:
+            cursor.execute(
+                f"REPLACE INTO {SEARCH_TABLE} (uid, document) "
+                f"VALUES (%s, %s)",
+                [uid, document(uid, name)],
+            )
+
+
+def index_clients(clients, using=None):
+    """
+    Insere novos Clientes no índice de busca de uma só vez.
+
+    Usado por cargas em massa (``bulk_create``), que não disparam sinais.
+
+    Args:
+        clients (list): Tuplas (uid, nome) de Clientes ainda não indexados.
+        using (str): Alias do banco de dados.
+    """
+    connection = connections[using or router.db_for_write(Client)]
+    if not clients or not is_available(connection):
+        return
+    column = "rowid" if connection.vendor == "sqlite" else "uid"
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {SEARCH_TABLE} ({column}, document) "
+            f"VALUES (%s, %s)",
+            [(uid, document(uid, name)) for uid, name in clients],
+        )
+
+
+def unindex_client(uid, using=None):
+    """Remove um Cliente do índice de busca."""
+    connection = connections[using or router.db_for_write(Client)]
+    if not is_available(connection):
+        return
+    column = "rowid" if connection.vendor == "sqlite" else "uid"
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {SEARCH_TABLE} WHERE {column} = %s", [uid]
+        )
+
+
+def rebuild_index(using=None):
+    """
+    Reconstrói o índice de busca a partir de ``tb_client``.
+
+    Útil após cargas em massa que não disparam sinais (ex.: ``bulk_create``).
+    """
+    connection = connections[using or router.db_for_write(Client)]
+    if not is_available(connection):
+        return
+    table = Client._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+        if connection.vendor == "sqlite":
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, document) "
+                f"SELECT uid, uid || ' ' || COALESCE(name, '') FROM {table}"
+            )
+        else:
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} (uid, document) "
+                f"SELECT uid, CONCAT(uid, ' ', COALESCE(name, '')) "
+                f"FROM {table}"
+            )
+
+
+@receiver(post_save, sender=Client, dispatch_uid="clients_index_client")
+def index_client_on_save(sender, instance, using, **kwargs):
+    """Mantém o índice de busca atualizado após salvar um Cliente."""
+    index_client(instance.uid, instance.name, using=using)
+
+
+@receiver(post_delete, sender=Client, dispatch_uid="clients_unindex_client")
+def unindex_client_on_delete(sender, instance, using, **kwargs):
+    """Remove o Cliente excluído do índice de busca."""
+    unindex_client(instance.uid, using=using)
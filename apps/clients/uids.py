@@ -0,0 +1,232 @@
+# apps/clients/uids.py
+
+"""
+Alocação concorrente de UIDs de Clientes.
+
+O próximo UID livre fica na tabela ``tb_client_uid_counter`` (uma única
+linha). Cada processo reserva um bloco de ``CLIENT_UID_BLOCK_SIZE`` UIDs
+com ``select_for_update`` e os distribui localmente, sem consultar o banco
+a cada novo Cliente. Cargas em massa reservam N UIDs de uma só vez com
+``reserve_uids``.
+
+UIDs de um bloco não utilizados (ex.: processo reiniciado) não são
+reaproveitados: a sequência é única e crescente, mas pode ter lacunas.
+
+O contador é iniciado pela migração a partir do maior UID cadastrado.
+Clientes gravados depois com UID explícito (ex.: ``loaddata``) não passam
+por ele, então ``save_with_new_uid`` grava com INSERT forçado: se o UID já
+existir, o contador é avançado para depois do maior UID cadastrado
+(``sync_counter``) e o bloco local é descartado, em vez de sobrescrever o
+Cliente existente. Assim a consulta do maior UID só ocorre nesse caso.
+Dentro de uma transação, apenas o UID usado é reservado, pois um bloco
+guardado em memória seria desfeito junto com a transação.
+"""
+
+import threading
+
+from django.conf import settings
+from django.db import (
+    IntegrityError,
+    connections,
+    models,
+    router,
+    transaction,
+)
+
+from .models import Client, ClientUIDCounter
+
+UID_START = 10000000
+
+COUNTER_PK = 1
+
+# Tentativas de gravar um novo Cliente quando o UID alocado já existe
+UID_INSERT_ATTEMPTS = 3
+
+
+def _initial_uid(using):
+    """Primeiro UID livre, a partir dos Clientes já cadastrados."""
+    last_uid = (
+        Client.objects.using(using)
+        .aggregate(models.Max("uid"))["uid__max"]
+    )
+    return UID_START if last_uid is None else max(last_uid + 1, UID_START)
+
+
+def _locked_counter(using):
+    """
+    Linha do contador, travada com ``select_for_update`` (deve ser chamada
+    dentro de uma transação). Criada se ainda não existir.
+    """
+    counter = (
+        ClientUIDCounter.objects.using(using)
+        .select_for_update()
+        .filter(pk=COUNTER_PK)
+        .first()
+    )
+    if counter is not None:
+        return counter
+
+    # Contador ainda não criado (ex.: banco anterior à migração)
+    try:
+        with transaction.atomic(using=using):
+            return ClientUIDCounter.objects.using(using).create(
+                pk=COUNTER_PK, next_uid=_initial_uid(using)
+            )
+    except IntegrityError:
+        # Criado por outro processo em paralelo
+        return (
+            ClientUIDCounter.objects.using(using)
+            .select_for_update()
+            .get(pk=COUNTER_PK)
+        )
+
+
+def reserve_uids(count, using=None):
+    """
+    Reserva ``count`` UIDs consecutivos no contador.
+
+    Args:
+        count (int): Quantidade de UIDs reservados.
+        using (str): Alias do banco de dados.
+
+    Returns:
+        range: UIDs reservados.
+
+    Raises:
+        ValueError: Se ``count`` for menor que 1.
+    """
+    if count < 1:
+        raise ValueError("A quantidade de UIDs reservados deve ser positiva.")
+    using = using or router.db_for_write(Client)
+
+    with transaction.atomic(using=using):
+        start = _locked_counter(using).next_uid
+        ClientUIDCounter.objects.using(using).filter(pk=COUNTER_PK).update(
+            next_uid=start + count
+        )
+
+    return range(start, start + count)
+
+
+def sync_counter(using=None):
+    """
+    Avança o contador para depois do maior UID cadastrado, quando Clientes
+    gravados com UID explícito o tiverem ultrapassado.
+
+    Args:
+        using (str): Alias do banco de dados.
+    """
+    using = using or router.db_for_write(Client)
+    with transaction.atomic(using=using):
+        counter = _locked_counter(using)
+        next_uid = _initial_uid(using)
+        if next_uid > counter.next_uid:
+            ClientUIDCounter.objects.using(using).filter(
+                pk=COUNTER_PK
+            ).update(next_uid=next_uid)
+
+
+class UIDAllocator:
+    """
+    Distribui UIDs a partir de blocos reservados no contador.
+
+    Os blocos são mantidos por alias de banco de dados e protegidos por uma
+    trava, podendo ser compartilhados entre threads do mesmo processo.
+
+    Args:
+        block_size (int): UIDs reservados a cada acesso ao contador.
+    """
+
+    def __init__(self, block_size=None):
+        self.block_size = block_size
+        self._blocks = {}
+        self._lock = threading.Lock()
+
+    def get_block_size(self):
+        """Tamanho do bloco (padrão: ``CLIENT_UID_BLOCK_SIZE``)."""
+        return self.block_size or getattr(
+            settings, "CLIENT_UID_BLOCK_SIZE", 50
+        )
+
+    def next_uid(self, using=None):
+        """
+        Retorna o próximo UID livre, reservando um novo bloco se necessário.
+
+        Args:
+            using (str): Alias do banco de dados.
+
+        Returns:
+            int: UID reservado para o novo Cliente.
+        """
+        using = using or router.db_for_write(Client)
+        with self._lock:
+            block = self._blocks.get(using)
+            uid = next(block, None) if block is not None else None
+            if uid is not None:
+                return uid
+
+            if connections[using].in_atomic_block:
+                # A reserva seria desfeita junto com a transação externa;
+                # reserva apenas o UID usado, sem guardar um bloco
+                return reserve_uids(1, using)[0]
+
+            block = iter(reserve_uids(self.get_block_size(), using))
+            self._blocks[using] = block
+            return next(block)
+
+    def reset(self, using=None):
+        """
+        Descarta os blocos locais (os UIDs restantes não são reusados).
+
+        Args:
+            using (str): Alias do banco de dados (padrão: todos).
+        """
+        with self._lock:
+            if using is None:
+                self._blocks.clear()
+            else:
+                self._blocks.pop(using, None)
+
+
+allocator = UIDAllocator()
+
+
+def allocate_uid(using=None):
+    """Retorna um UID livre para um novo Cliente."""
+    return allocator.next_uid(using=using)
+
+
+def save_with_new_uid(client, save, using=None):
+    """
+    Grava um novo Cliente com um UID alocado.
+
+    ``save`` deve gravar com ``force_insert=True``: um UID já existente
+    gera ``IntegrityError`` em vez de um UPDATE do outro Cliente. Nesse
+    caso, o contador é avançado (``sync_counter``), o bloco local é
+    descartado e a gravação é repetida com um novo UID.
+
+    Args:
+        client (Client): Cliente novo, sem UID.
+        save (callable): Grava o Cliente (sem argumentos).
+        using (str): Alias do banco de dados.
+
+    Raises:
+        IntegrityError: Se a gravação falhar por outro motivo, ou se o UID
+            continuar em uso após ``UID_INSERT_ATTEMPTS`` tentativas.
+    """
+    using = using or router.db_for_write(Client)
+    for attempt in range(1, UID_INSERT_ATTEMPTS + 1):
+        client.uid = allocate_uid(using=using)
+        try:
+            with transaction.atomic(using=using):
+                save()
+            return
+        except IntegrityError:
+            uid, client.uid = client.uid, None
+            if (
+                attempt == UID_INSERT_ATTEMPTS
+                or not Client.objects.using(using).filter(pk=uid).exists()
+            ):
+                raise
+            sync_counter(using)
+            allocator.reset(using)
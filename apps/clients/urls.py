@@ -13,8 +13,14 @@ urlpatterns = [
     path("clients/", views.client_home, name="client_home"),
     # URLs de Clientes
     path("client/list/", views.client_list, name="client_list"),
+    path(
+        "client/autocomplete/",
+        views.client_autocomplete,
+        name="client_autocomplete",
+    ),
     path("client/<int:pk>/", views.client_detail, name="client_detail"),
     path("client/new/", views.client_new, name="client_new"),
+    path("client/import/", views.client_import, name="client_import"),
     path("client/<int:pk>/edit/", views.client_edit, name="client_edit"),
     path("client/<int:pk>/delete/", views.client_delete, name="client_delete"),
 ]
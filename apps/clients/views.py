@@ -4,21 +4,47 @@
 Definição das views para o aplicativo Client.
 """
 
+import io
+
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
 from django.db import IntegrityError, DatabaseError
-from django.db.models import Q, ProtectedError
+from django.db.models import ProtectedError
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
-from django.utils.safestring import mark_safe
 
+from apps.utils.autocomplete import autocomplete_response
+from apps.utils.conditional import detail_condition
+from apps.utils.guardrails import guardrails_exempt
 from apps.utils.json_responses import json_error_response, log_exception
-
-from .forms import ClientForm
+from apps.utils.list_engine import render_list
+from apps.utils.object_cache import ObjectCache
+
+from .forms import ClientForm, ClientImportForm
+from .importers import import_clients
+from .lists import (
+    CLIENT_LIST,
+    CLIENT_OPTION_VALUES,
+    client_option_label,
+    client_option_q,
+)
 from .models import Client
 
+# Campos exibidos na página de detalhe, mantidos em cache
+CLIENT_DETAIL = ObjectCache(
+    Client,
+    fields=(
+        "uid",
+        "name",
+        "idle",
+        "country",
+        "city",
+        "notes",
+        "updated_at",
+    ),
+)
+
 
 def client_home(request):
     """View para a Página Inicial de Clientes"""
@@ -29,50 +55,6 @@ def client_home(request):
 def client_list(request):
     """View para Listar os Clientes"""
 
-    # Obtenção dos Filtros
-    query = request.GET.get("client-list-query")
-    idle = request.GET.get("client-list-idle")
-
-    # Ordenação
-    order_by = request.GET.get("order_by", "name")
-    descending = request.GET.get("descending", "False") == "True"
-
-    # Otimização da Consulta
-    client = Client.objects.all()
-
-    # Filtragem
-    if query:
-        client = client.filter(
-            Q(uid__icontains=query) |
-            Q(name__icontains=query)
-        )
-
-    if idle in ["True", "False"]:
-        client = client.filter(idle=idle == "True")
-
-    # Aplicação de Filtros da Ordenação
-    if descending:
-        order_by = f"-{order_by}"
-    client = client.order_by(order_by)
-
-    # Registros por Página
-    records_per_page = request.GET.get("records_per_page", 20)
-    try:
-        records_per_page = int(records_per_page)
-    except (ValueError, TypeError):
-        records_per_page = 10
-
-    # Paginação
-    paginator = Paginator(client, records_per_page)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-
-    # Tratamento de Erros na Páginação
-    try:
-        page_obj = paginator.get_page(page_number)
-    except (ValueError, TypeError):
-        page_obj = paginator.get_page(1)
-
     # Definição dos Campos de Pesquisa
     search_fields = [
         {
@@ -93,48 +75,32 @@ def client_list(request):
         },
     ]
 
-    context = {
-        "client": client,
-        "page_obj": page_obj,
-        "search_fields": search_fields,
-        "query_params": request.GET.urlencode(),
-        "headers": [
-            {"field": "uid", "label": "ID"},
-            {"field": "nome", "label": "Nome"},
-            {"field": "country", "label": "País"},
-            {"field": "city", "label": "Cidade"},
-            {"field": "notes", "label": "Observações"},
-            {"field": "inativo", "label": "Inativo"},
-        ],
-        "rows": [
-            [
-                client.uid,
-                mark_safe(
-                    f'<a href="{reverse(
-                        "client_detail",
-                        args=[client.uid]
-                    )}">{client.name}</a>'
-                ),
-                client.country,
-                client.city,
-                client.notes,
-                "Sim" if client.idle else "Não",
-            ]
-            for client in page_obj
-        ],
-    }
-
-    if request.headers.get("x-requested-with") == "XMLHttpRequest":
-        return render(request, "includes/table.html", context)
-    else:
-        return render(request, "clients/clients_list.html", context)
+    return render_list(
+        request,
+        CLIENT_LIST,
+        "clients/clients_list.html",
+        {"search_fields": search_fields},
+    )
+
 
+def client_autocomplete(request):
+    """View de autocompletar Clientes nos campos select2."""
 
+    return autocomplete_response(
+        request,
+        Client.objects.order_by("name", "pk"),
+        search=client_option_q,
+        label=client_option_label,
+        values=CLIENT_OPTION_VALUES,
+    )
+
+
+@detail_condition(Client, objects=CLIENT_DETAIL)
 def client_detail(request, pk):
     """View para Visualizar os Detalhes de um Cliente"""
 
     # Obtenção dos filtros
-    client = get_object_or_404(Client, pk=pk)
+    client = CLIENT_DETAIL.get_or_404(request, pk)
 
     # Mensagem de confirmação de exclusão do Cliente
     message_confirmation_delete = (
@@ -281,6 +247,93 @@ def client_new(request):
     )
 
 
+@guardrails_exempt
+def client_import(request):
+    """View para Importar Clientes de um arquivo CSV"""
+
+    result = None
+    if request.method == "POST":
+        form = ClientImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            # Leitura do arquivo em fluxo, sem carregá-lo inteiro na memória
+            csv_file = io.TextIOWrapper(
+                form.cleaned_data["file"].file,
+                encoding="utf-8-sig",
+                newline="",
+            )
+            try:
+                result = import_clients(csv_file)
+                messages.success(
+                    request,
+                    f"{result.created} Cliente(s) importado(s), "
+                    f"{result.error_count} linha(s) com erro."
+                )
+            except UnicodeDecodeError:
+                form.add_error(
+                    "file",
+                    "O arquivo deve estar codificado em UTF-8."
+                )
+            except ValidationError as e:
+                form.add_error("file", e)
+            except DatabaseError as e:
+                log_exception(
+                    exception=e,
+                    context="Erro ao importar Clientes",
+                )
+                messages.error(
+                    request,
+                    "Erro interno ao importar os Clientes."
+                )
+        else:
+            messages.error(
+                request,
+                "Erro ao importar os Clientes."
+            )
+    else:
+        form = ClientImportForm()
+
+    # Definição das Seções e Botões para o Template
+    sections = [
+        {
+            "title": "Arquivo de Clientes",
+            "fields": [form["file"]],
+        },
+    ]
+    if result is not None:
+        sections.append({
+            "title": (
+                f"Resultado: {result.created} Cliente(s) importado(s), "
+                f"{result.error_count} linha(s) com erro"
+            ),
+            "is_table": True,
+            "table_headers": ["Linha", "Erro"],
+            "fields": [
+                {"values": [line, message]}
+                for line, message in result.errors
+            ],
+        })
+
+    buttons = [
+        {
+            "class": "btn-return",
+            "url": reverse("client_home"),
+            "title": "Retornar",
+            "text": "Retornar",
+        },
+    ]
+
+    # Renderização do template
+    return render(
+        request,
+        "clients/clients_import.html",
+        {
+            "form": form,
+            "sections": sections,
+            "buttons": buttons,
+        },
+    )
+
+
 def client_edit(request, pk):
     """View para Editar um Cliente"""
 
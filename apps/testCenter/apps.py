@@ -12,3 +12,7 @@ class TestCenterConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.testCenter"
+
+    def ready(self):
+        """Registra as verificações do sistema do app."""
+        from . import checks  # noqa: F401
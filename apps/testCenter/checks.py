@@ -0,0 +1,60 @@
+# apps/testCenter/checks.py
+
+"""
+Verificações do sistema para o aplicativo 'testCenter'.
+
+Executadas com ``python manage.py check --database default``: analisam o
+plano de execução das consultas da listagem de Exames (SQLite e MySQL) e
+alertam se algum filtro voltar a percorrer a tabela inteira.
+"""
+
+from django.core.checks import Tags, Warning, register
+from django.db import DatabaseError
+
+from apps.utils.query_plans import full_scan_problems
+
+# Valores de exemplo para cada filtro da listagem de Exames
+EXAM_LIST_PLAN_SAMPLES = {
+    "exam-list-client": "10000000",
+    "exam-list-certification": "ABC0001",
+    "exam-list-testCenter": "1",
+    "exam-list-dateRange": "01/01/2024 - 31/01/2024",
+    "exam-list-presence": "True",
+}
+
+
+@register(Tags.database)
+def check_exam_list_query_plans(app_configs=None, databases=None, **kwargs):
+    """
+    Verifica se cada filtro da listagem de Exames, com a ordenação padrão,
+    é atendido por um índice.
+    """
+    if not databases:
+        return []
+
+    from .lists import EXAM_LIST
+
+    samples = [{}] + [
+        {param: value} for param, value in EXAM_LIST_PLAN_SAMPLES.items()
+    ]
+
+    warnings = []
+    for params in samples:
+        queryset = EXAM_LIST.compile_params(params).queryset
+        for alias in databases:
+            try:
+                problems = full_scan_problems(queryset.using(alias))
+            except DatabaseError:
+                # Banco ainda sem as tabelas (antes do migrate)
+                continue
+            if problems:
+                warnings.append(
+                    Warning(
+                        "A listagem de Exames não usa índice para "
+                        f"os filtros {sorted(params) or 'padrão'}.",
+                        hint="; ".join(problems),
+                        obj="testCenter.TestCenterExam",
+                        id="testCenter.W001",
+                    )
+                )
+    return warnings
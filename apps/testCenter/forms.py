@@ -5,8 +5,9 @@ Definição dos formulários do aplicativo 'testCenter'.
 """
 
 from django import forms
+from django.urls import reverse_lazy
 
-from apps.utils.widgets import BooleanSelect
+from apps.utils.widgets import AjaxModelChoiceField, AjaxSelect, BooleanSelect
 from apps.certifications.models import Certification
 from apps.clients.models import Client
 
@@ -67,10 +68,12 @@ class TestCenterExamForm(forms.ModelForm):
     Realizados no Centro de Provas.
     """
 
-    certification = forms.ModelChoiceField(
-        queryset=Certification.objects.all(),
+    certification = AjaxModelChoiceField(
+        queryset=Certification.objects.filter(idle=False),
         label="Certificação",
-        widget=forms.Select(
+        widget=AjaxSelect(
+            url=reverse_lazy("certification_autocomplete"),
+            url_params={"idle": "False"},
             attrs={
                 "class": "apps-form-input select2",
                 "id": "testCenterExam-certification",
@@ -90,10 +93,12 @@ class TestCenterExamForm(forms.ModelForm):
             }
         ),
     )
-    client = forms.ModelChoiceField(
-        queryset=Client.objects.all(),
+    client = AjaxModelChoiceField(
+        queryset=Client.objects.filter(idle=False),
         label="Cliente",
-        widget=forms.Select(
+        widget=AjaxSelect(
+            url=reverse_lazy("client_autocomplete"),
+            url_params={"idle": "False"},
             attrs={
                 "class": "apps-form-input select2",
                 "id": "testCenterExam-client",
@@ -149,20 +154,10 @@ class TestCenterExamForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields["certification"].queryset = (
-            Certification.objects
-            .filter(idle=False)
-            .order_by("name")
-        )
         self.fields["certification"].label_from_instance = (
             self.certification_label_from_instance
         )
 
-        self.fields["client"].queryset = (
-            Client.objects
-            .filter(idle=False)
-            .order_by("name")
-        )
         self.fields["client"].label_from_instance = (
             self.client_label_from_instance
         )
@@ -178,3 +173,25 @@ class TestCenterExamForm(forms.ModelForm):
         Retorna o rótulo para o Cliente.
         """
         return f"{obj.uid}: {obj.name}"
+
+
+class ExamImportForm(forms.Form):
+    """
+    Formulário para importação da agenda de Exames de um Certificador.
+    """
+
+    file = forms.FileField(
+        label="Agenda de Exames (CSV)",
+        help_text=(
+            "Cabeçalho com as colunas: booking, client (UID), certification "
+            "(ID), testCenter (ID), date, presence e notes. Reservas já "
+            "importadas são atualizadas."
+        ),
+        widget=forms.ClearableFileInput(
+            attrs={
+                "class": "apps-form-input",
+                "id": "exam-import-file",
+                "accept": ".csv,text/csv",
+            }
+        ),
+    )
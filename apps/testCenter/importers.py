@@ -0,0 +1,290 @@
+# apps/testCenter/importers.py
+
+"""
+Importação idempotente de Exames a partir das agendas dos Certificadores.
+
+Cada linha do CSV é identificada pelo código da reserva (``booking``), que
+é gravado em ``TestCenterExam.bookingKey``. As linhas são gravadas em lotes
+com ``bulk_create(update_conflicts=True)``: reservas novas são inseridas e
+reservas já importadas são atualizadas, de modo que reimportar o mesmo
+arquivo não duplica Exames.
+
+As referências (Cliente, Certificação e Centro de Provas) são resolvidas
+por mapas em memória criados uma vez por arquivo: Certificações e Centros
+de Provas são carregados por inteiro; Clientes são carregados por lote,
+apenas os UIDs citados, e mantidos no mapa até o fim do arquivo.
+
+Colunas (cabeçalho obrigatório): ``booking``, ``client`` (UID),
+``certification`` (ID), ``testcenter`` (ID), ``date``, ``presence`` e
+``notes``.
+"""
+
+import csv
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import connections, router, transaction
+
+from apps.certifications.models import Certification
+from apps.clients.models import Client
+from apps.utils.cache_versions import bump_object_versions, bump_version
+from apps.utils.imports import (
+    ImportResult,
+    error_message,
+    normalize_header,
+    parse_boolean,
+)
+
+from .models import TestCenter, TestCenterExam
+
+IMPORT_BATCH_SIZE = 1000
+
+REQUIRED_COLUMNS = ("booking", "client", "certification", "testcenter", "date")
+
+# Campos atualizados quando a reserva já foi importada
+UPSERT_FIELDS = [
+    "certification",
+    "testCenter",
+    "client",
+    "date",
+    "presence",
+    "notes",
+    "updated_at",
+]
+
+BOOKING_KEY_MAX_LENGTH = TestCenterExam._meta.get_field(
+    "bookingKey"
+).max_length
+
+
+class ReferenceMap:
+    """
+    Mapa em memória das referências do arquivo para as chaves primárias.
+
+    Args:
+        queryset (QuerySet): Registros que podem ser referenciados.
+        label (str): Nome da coluna, usado nas mensagens de erro.
+        numeric (bool): Indica se a referência é numérica (ex.: UID).
+    """
+
+    def __init__(self, queryset, label, numeric=False):
+        self.queryset = queryset
+        self.label = label
+        self.numeric = numeric
+        self.keys = {}
+
+    def preload(self):
+        """Carrega todas as referências de uma só vez (tabelas pequenas)."""
+        self.keys = {
+            str(pk): pk for pk in self.queryset.values_list("pk", flat=True)
+        }
+        self.queryset = None
+        return self
+
+    def load(self, values):
+        """Carrega, em uma única consulta, as referências ainda ausentes."""
+        if self.queryset is None:
+            return
+        missing = {
+            value for value in values
+            if value not in self.keys
+            and (not self.numeric or value.isdigit())
+        }
+        if not missing:
+            return
+        found = set(
+            self.queryset.filter(pk__in=missing)
+            .values_list("pk", flat=True)
+        )
+        for pk in found:
+            self.keys[str(pk)] = pk
+        for value in missing:
+            self.keys.setdefault(value, None)
+
+    def resolve(self, value):
+        """
+        Retorna a chave primária da referência.
+
+        Raises:
+            ValidationError: Se a referência não existir.
+        """
+        pk = self.keys.get(value)
+        if pk is None:
+            raise ValidationError(f"{self.label} não encontrado(a): {value!r}.")
+        return pk
+
+
+DATE_FIELD = forms.DateTimeField()
+
+
+def parse_row(row):
+    """
+    Valida os campos próprios de uma linha (sem as referências).
+
+    Returns:
+        dict: Valores convertidos, incluindo as referências como texto.
+
+    Raises:
+        ValidationError: Se algum valor for inválido.
+    """
+    booking = (row.get("booking") or "").strip()
+    if not booking:
+        raise ValidationError("booking: Código da reserva obrigatório.")
+    if len(booking) > BOOKING_KEY_MAX_LENGTH:
+        raise ValidationError(
+            f"booking: Código da reserva maior que "
+            f"{BOOKING_KEY_MAX_LENGTH} caracteres."
+        )
+    try:
+        date = DATE_FIELD.clean((row.get("date") or "").strip())
+    except ValidationError as e:
+        raise ValidationError(f"date: {' '.join(e.messages)}") from e
+
+    return {
+        "booking": booking,
+        "client": (row.get("client") or "").strip(),
+        "certification": (row.get("certification") or "").strip().upper(),
+        "testcenter": (row.get("testcenter") or "").strip(),
+        "date": date,
+        "presence": parse_boolean("presence", row.get("presence")),
+        "notes": (row.get("notes") or "").strip() or None,
+    }
+
+
+class ExamImporter:
+    """
+    Importa um arquivo de agenda de Exames.
+
+    Args:
+        batch_size (int): Quantidade de linhas por lote.
+        using (str): Alias do banco de dados.
+    """
+
+    def __init__(self, batch_size=IMPORT_BATCH_SIZE, using=None):
+        self.batch_size = batch_size
+        self.using = using or router.db_for_write(TestCenterExam)
+        self.result = ImportResult()
+        self.clients = ReferenceMap(
+            Client.objects.using(self.using), "Cliente", numeric=True
+        )
+        self.certifications = ReferenceMap(
+            Certification.objects.using(self.using), "Certificação"
+        ).preload()
+        self.test_centers = ReferenceMap(
+            TestCenter.objects.using(self.using),
+            "Centro de Provas",
+            numeric=True,
+        ).preload()
+
+    def run(self, lines):
+        """
+        Importa as linhas de texto de um arquivo CSV.
+
+        Returns:
+            ImportResult: Exames criados, atualizados e erros por linha.
+
+        Raises:
+            ValidationError: Se o cabeçalho não tiver as colunas
+                obrigatórias.
+        """
+        reader = csv.DictReader(lines)
+        normalize_header(reader, required=REQUIRED_COLUMNS)
+
+        batch = []
+        for row in reader:
+            try:
+                batch.append((reader.line_num, parse_row(row)))
+            except ValidationError as e:
+                self.result.add_error(reader.line_num, error_message(e))
+                continue
+            if len(batch) >= self.batch_size:
+                self.save_batch(batch)
+                batch = []
+
+        if batch:
+            self.save_batch(batch)
+        self.result.errors.sort()
+
+        if self.result.created or self.result.updated:
+            # bulk_create não dispara os sinais de post_save
+            transaction.on_commit(
+                lambda: bump_version(TestCenterExam), using=self.using
+            )
+
+        return self.result
+
+    def build_exam(self, values):
+        """Monta o Exame de uma linha, resolvendo as referências."""
+        return TestCenterExam(
+            bookingKey=values["booking"],
+            client_id=self.clients.resolve(values["client"]),
+            certification_id=self.certifications.resolve(
+                values["certification"]
+            ),
+            testCenter_id=self.test_centers.resolve(values["testcenter"]),
+            date=values["date"],
+            presence=values["presence"],
+            notes=values["notes"],
+        )
+
+    def save_batch(self, batch):
+        """Resolve as referências de um lote e grava os Exames (upsert)."""
+        self.clients.load(values["client"] for _, values in batch)
+
+        # A última linha de uma mesma reserva prevalece
+        exams = {}
+        for line, values in batch:
+            try:
+                exams[values["booking"]] = self.build_exam(values)
+            except ValidationError as e:
+                self.result.add_error(line, error_message(e))
+        if not exams:
+            return
+
+        with transaction.atomic(using=self.using):
+            existing = dict(
+                TestCenterExam.objects.using(self.using)
+                .filter(bookingKey__in=list(exams))
+                .values_list("bookingKey", "pk")
+            )
+            # O MySQL (ON DUPLICATE KEY UPDATE) não aceita indicar a
+            # restrição em conflito: usa qualquer chave única, e a única
+            # além da chave primária é bookingKey
+            features = connections[self.using].features
+            unique_fields = (
+                ["bookingKey"]
+                if features.supports_update_conflicts_with_target
+                else None
+            )
+            TestCenterExam.objects.using(self.using).bulk_create(
+                list(exams.values()),
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=UPSERT_FIELDS,
+            )
+
+        if existing:
+            # bulk_create não dispara os sinais: invalida as páginas de
+            # detalhe dos Exames atualizados
+            pks = list(existing.values())
+            transaction.on_commit(
+                lambda: bump_object_versions(TestCenterExam, pks),
+                using=self.using,
+            )
+        self.result.updated += len(existing)
+        self.result.created += len(exams) - len(existing)
+
+
+def import_exams(lines, batch_size=IMPORT_BATCH_SIZE, using=None):
+    """
+    Importa (ou atualiza) Exames de um arquivo de agenda em CSV.
+
+    Args:
+        lines (iterable): Linhas de texto do arquivo (ex.: arquivo aberto).
+        batch_size (int): Quantidade de linhas por lote.
+        using (str): Alias do banco de dados.
+
+    Returns:
+        ImportResult: Exames criados, atualizados e erros por linha.
+    """
+    return ExamImporter(batch_size=batch_size, using=using).run(lines)
@@ -0,0 +1,128 @@
+# apps/testCenter/lists.py
+
+"""
+Especificações das listagens do aplicativo 'testCenter', das opções de
+Centro de Provas nos campos de seleção (autocompletar) e da dimensão (cache
+local) de Centros de Provas.
+"""
+
+from django.db.models import Q
+
+from apps.certifications.lists import CERTIFICATION_DIMENSION
+from apps.utils.dimensions import Dimension
+from apps.utils.list_engine import (
+    BooleanFilter,
+    DateRangeFilter,
+    ExactFilter,
+    ListSpec,
+    SearchFilter,
+    SortKey,
+)
+from apps.utils.tables import (
+    BooleanCell,
+    Cell,
+    DateTimeCell,
+    DimensionCell,
+    LinkCell,
+)
+
+from .models import TestCenter, TestCenterExam
+
+# Colunas carregadas nas opções de Centro de Provas dos campos de seleção
+TESTCENTER_OPTION_VALUES = ("id", "name")
+
+# Centros de Provas em memória, para rótulos e opções sem consultas
+TESTCENTER_DIMENSION = Dimension(
+    TestCenter, TESTCENTER_OPTION_VALUES, ordering=("name", "pk")
+)
+
+
+def testcenter_option_label(row):
+    """Rótulo de um Centro de Provas nos campos de seleção."""
+    return row[1]
+
+
+def testcenter_option_q(term):
+    """Busca de Centros de Provas por prefixo do nome."""
+    return Q(name__istartswith=term)
+
+
+TESTCENTER_LIST = ListSpec(
+    TestCenter,
+    filters=[
+        SearchFilter("testCenter-list-query", ["name"]),
+        BooleanFilter("testCenter-list-idle", "idle"),
+    ],
+    sort_keys=["id", "name"],
+    default_sort="name",
+    columns=[
+        {"field": "id", "label": "ID"},
+        {"field": "name", "label": "Nome"},
+        {"field": "notes", "label": "Observações"},
+        {"field": "idle", "label": "Inativo"},
+    ],
+    cells=[
+        Cell("id"),
+        LinkCell("name", "testcenter_detail", pk_field="id"),
+        Cell("notes"),
+        BooleanCell("idle"),
+    ],
+    values=("id", "name", "notes", "idle"),
+)
+
+EXAM_LIST = ListSpec(
+    TestCenterExam,
+    filters=[
+        ExactFilter("exam-list-client", "client__uid"),
+        ExactFilter("exam-list-certification", "certification__id"),
+        ExactFilter("exam-list-testCenter", "testCenter__id"),
+        DateRangeFilter("exam-list-dateRange", "date"),
+        BooleanFilter("exam-list-presence", "presence"),
+    ],
+    sort_keys=[
+        "date",
+        SortKey("client__name", ["client__name", "date"]),
+        SortKey("certification__name", ["certification__name", "date"]),
+        SortKey("testCenter__name", ["testCenter__name", "date"]),
+    ],
+    default_sort="date",
+    columns=[
+        {"field": "date", "label": "Data e Hora do Exame"},
+        {"field": "client__name", "label": "Cliente"},
+        {"field": "certification__name", "label": "Certificação"},
+        {"field": "testCenter__name", "label": "Centro de Provas"},
+        {"field": "presence", "label": "Presença Confirmada"},
+    ],
+    cells=[
+        DateTimeCell("date"),
+        LinkCell("client__name", "exam_detail", pk_field="id"),
+        DimensionCell("certification_id", CERTIFICATION_DIMENSION),
+        DimensionCell("testCenter_id", TESTCENTER_DIMENSION),
+        BooleanCell("presence"),
+    ],
+    values=(
+        "id",
+        "date",
+        "client__name",
+        "certification_id",
+        "testCenter_id",
+        "presence",
+    ),
+    cursor_ordering=("date", "id"),
+    approximate_count=True,
+)
+
+# Colunas da exportação de Exames (apps/utils/exports.py)
+EXAM_EXPORT_COLUMNS = [
+    ("id", "ID"),
+    ("date", "Data e Hora do Exame"),
+    ("client__uid", "UID do Cliente"),
+    ("client__name", "Cliente"),
+    ("certification__id", "ID da Certificação"),
+    ("certification__name", "Certificação"),
+    ("testCenter__id", "ID do Centro de Provas"),
+    ("testCenter__name", "Centro de Provas"),
+    ("presence", "Presença Confirmada"),
+    ("bookingKey", "Código da Reserva"),
+    ("notes", "Observações"),
+]
@@ -0,0 +1,74 @@
+# apps/testCenter/management/commands/import_exams.py
+
+"""
+Comando para importar (ou atualizar) Exames de uma agenda em CSV.
+
+Uso: ``python manage.py import_exams agenda.csv [--batch-size N]``
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.management import BaseCommand, CommandError
+
+from apps.testCenter.importers import IMPORT_BATCH_SIZE, import_exams
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa ou atualiza Exames de uma agenda em CSV (colunas: "
+        "booking, client, certification, testCenter, date, presence, notes)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Caminho do arquivo CSV.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Quantidade de linhas gravadas por lote.",
+        )
+        parser.add_argument(
+            "--encoding",
+            default="utf-8-sig",
+            help="Codificação do arquivo.",
+        )
+        parser.add_argument(
+            "--database",
+            default=None,
+            help="Alias do banco de dados.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size deve ser maior que zero.")
+
+        try:
+            with open(
+                options["path"], encoding=options["encoding"], newline=""
+            ) as csv_file:
+                result = import_exams(
+                    csv_file,
+                    batch_size=options["batch_size"],
+                    using=options["database"],
+                )
+        except OSError as e:
+            raise CommandError(f"Erro ao abrir o arquivo: {e}") from e
+        except UnicodeDecodeError as e:
+            raise CommandError(
+                f"Erro de codificação do arquivo: {e}"
+            ) from e
+        except ValidationError as e:
+            raise CommandError(" ".join(e.messages)) from e
+
+        for line, message in result.errors:
+            self.stderr.write(f"Linha {line}: {message}")
+        if result.error_count > len(result.errors):
+            self.stderr.write(
+                f"... e mais {result.error_count - len(result.errors)} "
+                f"erro(s)."
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{result.created} Exame(s) criado(s), "
+            f"{result.updated} Exame(s) atualizado(s), "
+            f"{result.error_count} linha(s) com erro."
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certifications', '0003_certification_tb_certification_name_idx'),
+        ('clients', '0002_client_tb_client_name_idx'),
+        ('testCenter', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='testcenter',
+            index=models.Index(fields=['name'], name='tb_test_center_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testcenterexam',
+            index=models.Index(fields=['date'], name='tb_tc_exam_date_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certifications', '0003_certification_tb_certification_name_idx'),
+        ('clients', '0002_client_tb_client_name_idx'),
+        ('testCenter', '0002_testcenter_tb_test_center_name_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='testcenterexam',
+            index=models.Index(
+                fields=['testCenter', 'date'],
+                name='tb_tc_exam_tc_date_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='testcenterexam',
+            index=models.Index(
+                fields=['client', 'date'],
+                name='tb_tc_exam_client_date_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='testcenterexam',
+            index=models.Index(
+                fields=['certification', 'date'],
+                name='tb_tc_exam_cert_date_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='testcenterexam',
+            index=models.Index(
+                fields=['presence', 'date'],
+                name='tb_tc_exam_presence_date_idx',
+            ),
+        ),
+    ]
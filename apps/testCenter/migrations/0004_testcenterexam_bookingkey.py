@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testCenter', '0003_testcenterexam_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testcenterexam',
+            name='bookingKey',
+            field=models.CharField(blank=True, max_length=100, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:00
+
+from django.db import migrations, models
+from django.db.models.functions import Now
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testCenter', '0004_testcenterexam_bookingkey'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='testcenter',
+            name='updated_at',
+            field=models.DateTimeField(
+                auto_now=True, db_default=Now()
+            ),
+        ),
+        migrations.AddField(
+            model_name='testcenterexam',
+            name='updated_at',
+            field=models.DateTimeField(
+                auto_now=True, db_default=Now()
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ Definições dos modelos do aplicativo 'testCenter'.
 from datetime import datetime
 
 from django.db import models
+from django.db.models.functions import Now
 
 from apps.certifications.models import Certification
 from apps.clients.models import Client
@@ -19,6 +20,7 @@ class TestCenter(models.Model):
     name = models.CharField(max_length=255)
     notes = models.TextField(blank=True, null=True)
     idle = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     def __str__(self):
         """Retorna uma representação em string do objeto TestCenter."""
@@ -27,6 +29,9 @@ class TestCenter(models.Model):
     class Meta:
         """Meta-informações para o modelo TestCenter."""
         db_table = "tb_test_center"
+        indexes = [
+            models.Index(fields=["name"], name="tb_test_center_name_idx"),
+        ]
 
 
 class TestCenterExam(models.Model):
@@ -41,6 +46,11 @@ class TestCenterExam(models.Model):
     date = models.DateTimeField()
     presence = models.BooleanField(default=False)
     notes = models.TextField(blank=True, null=True)
+    # Código da reserva no sistema do Certificador (importação de agendas)
+    bookingKey = models.CharField(
+        max_length=100, unique=True, blank=True, null=True
+    )
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     def __str__(self):
         if isinstance(self.date, datetime):
@@ -58,3 +68,24 @@ class TestCenterExam(models.Model):
     class Meta:
         """Meta-informações para o modelo TestCenterExam."""
         db_table = "tb_testCenter-exam"
+        indexes = [
+            models.Index(fields=["date"], name="tb_tc_exam_date_idx"),
+            # Índices compostos para os filtros da listagem de Exames,
+            # sempre ordenada por data
+            models.Index(
+                fields=["testCenter", "date"],
+                name="tb_tc_exam_tc_date_idx",
+            ),
+            models.Index(
+                fields=["client", "date"],
+                name="tb_tc_exam_client_date_idx",
+            ),
+            models.Index(
+                fields=["certification", "date"],
+                name="tb_tc_exam_cert_date_idx",
+            ),
+            models.Index(
+                fields=["presence", "date"],
+                name="tb_tc_exam_presence_date_idx",
+            ),
+        ]
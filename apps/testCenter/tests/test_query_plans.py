@@ -0,0 +1,112 @@
+# apps/testCenter/tests/test_query_plans.py
+
+"""
+Testes do plano de execução das consultas da listagem de Exames.
+
+Falham se algum filtro, com a ordenação padrão, deixar de usar o índice
+esperado, voltar a percorrer a tabela inteira ou ordenar fora de índice.
+Os testes do MySQL (marcador ``mysql``) rodam com ``USE_MYSQL`` e uma
+tabela populada, para que o otimizador escolha o plano de produção.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.db import connection
+
+from apps.certifications.models import Certification
+from apps.certifiers.models import Certifier
+from apps.clients.models import Client
+from apps.testCenter import models as exam_models
+from apps.testCenter.checks import EXAM_LIST_PLAN_SAMPLES
+from apps.testCenter.lists import EXAM_LIST
+from apps.utils.query_plans import full_scan_problems, plan_indexes
+
+# Índices aceitos para cada filtro (todos ordenados por data). Com o filtro
+# de presença, pouco seletivo, percorrer o índice de data também atende.
+EXPECTED_INDEXES = {
+    None: {"tb_tc_exam_date_idx"},
+    "exam-list-client": {"tb_tc_exam_client_date_idx"},
+    "exam-list-certification": {"tb_tc_exam_cert_date_idx"},
+    "exam-list-testCenter": {"tb_tc_exam_tc_date_idx"},
+    "exam-list-dateRange": {"tb_tc_exam_date_idx"},
+    "exam-list-presence": {
+        "tb_tc_exam_presence_date_idx",
+        "tb_tc_exam_date_idx",
+    },
+}
+
+PLAN_SAMPLES = [({}, EXPECTED_INDEXES[None])] + [
+    ({param: value}, EXPECTED_INDEXES[param])
+    for param, value in EXAM_LIST_PLAN_SAMPLES.items()
+]
+
+
+def sample_id(sample):
+    return ",".join(sample[0]) or "padrão"
+
+
+def assert_uses_index(params, expected):
+    queryset = EXAM_LIST.compile_params(params).queryset
+
+    assert full_scan_problems(queryset) == []
+    assert plan_indexes(queryset) & expected
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="Banco de testes não é SQLite."
+)
+@pytest.mark.parametrize("sample", PLAN_SAMPLES, ids=sample_id)
+def test_exam_list_filters_use_indexes_sqlite(sample):
+    assert_uses_index(*sample)
+
+
+@pytest.fixture
+def exam_table():
+    """
+    Popula a tabela de Exames com dados distribuídos entre Clientes,
+    Certificações e Centros de Provas, e atualiza as estatísticas.
+    """
+    certifier = Certifier.objects.create(
+        name="Certificador", abbreviation="ABC"
+    )
+    certifications = Certification.objects.bulk_create(
+        Certification(
+            id=f"ABC{number:04d}", certifier=certifier, name=f"Cert {number}"
+        )
+        for number in range(1, 21)
+    )
+    clients = Client.objects.bulk_create(
+        Client(uid=10000000 + number, name=f"CLIENTE {number}")
+        for number in range(50)
+    )
+    test_centers = exam_models.TestCenter.objects.bulk_create(
+        exam_models.TestCenter(id=number, name=f"Centro {number}")
+        for number in range(1, 11)
+    )
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    exam_models.TestCenterExam.objects.bulk_create(
+        exam_models.TestCenterExam(
+            certification=certifications[number % len(certifications)],
+            client=clients[number % len(clients)],
+            testCenter=test_centers[number % len(test_centers)],
+            date=start + timedelta(hours=7 * number),
+            presence=number % 2 == 0,
+        )
+        for number in range(5000)
+    )
+    table = exam_models.TestCenterExam._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE TABLE {connection.ops.quote_name(table)}")
+        cursor.fetchall()
+
+
+@pytest.mark.mysql
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "mysql", reason="Banco de testes não é MySQL."
+)
+@pytest.mark.parametrize("sample", PLAN_SAMPLES, ids=sample_id)
+def test_exam_list_filters_use_indexes_mysql(exam_table, sample):
+    assert_uses_index(*sample)
@@ -18,6 +18,11 @@ urlpatterns = [
 
     # URLs de Centros de Provas
     path("testCenter/list/", views.testcenter_list, name="testcenter_list"),
+    path(
+        "testCenter/autocomplete/",
+        views.testcenter_autocomplete,
+        name="testcenter_autocomplete"
+    ),
     path(
         "testCenter/<int:pk>/",
         views.testcenter_detail,
@@ -45,4 +50,19 @@ urlpatterns = [
         views.exam_list,
         name="exam_list"
     ),
+    path(
+        "exams/export/",
+        views.exam_export,
+        name="exam_export"
+    ),
+    path(
+        "exams/import/",
+        views.exam_import,
+        name="exam_import"
+    ),
+    path(
+        "exams/<int:pk>/",
+        views.exam_detail,
+        name="exam_detail"
+    ),
 ]
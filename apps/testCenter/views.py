@@ -4,23 +4,65 @@
 Definição das views para o aplicativo TestCenter.
 """
 
-from datetime import datetime, timedelta
+import io
 
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
 from django.db import IntegrityError, DatabaseError
-from django.db.models import Q, ProtectedError
-from django.http import JsonResponse
-from django.utils import timezone
+from django.db.models import ProtectedError
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
-from django.utils.safestring import mark_safe
 
+from apps.certifications.lists import (
+    CERTIFICATION_DIMENSION,
+    certification_option_label,
+)
+from apps.clients.lists import CLIENT_OPTION_VALUES, client_option_label
+from apps.utils.autocomplete import autocomplete_response, selected_option
+from apps.utils.conditional import detail_condition
+from apps.utils.exports import (
+    DEFAULT_EXPORT_FORMAT,
+    EXPORT_FORMATS,
+    export_response,
+)
+from apps.utils.guardrails import guardrails_exempt
 from apps.utils.json_responses import json_error_response, log_exception
-
-from .forms import TestCenterForm, TestCenterExamForm
-from .models import TestCenter, TestCenterExam, Certification, Client
+from apps.utils.list_engine import render_list
+from apps.utils.object_cache import ObjectCache
+
+from .forms import ExamImportForm, TestCenterForm, TestCenterExamForm
+from .importers import import_exams
+from .lists import (
+    TESTCENTER_DIMENSION,
+    TESTCENTER_LIST,
+    TESTCENTER_OPTION_VALUES,
+    EXAM_EXPORT_COLUMNS,
+    EXAM_LIST,
+    testcenter_option_label,
+    testcenter_option_q,
+)
+from .models import TestCenter, TestCenterExam, Client
+
+# Campos exibidos nas páginas de detalhe, mantidos em cache
+TESTCENTER_DETAIL = ObjectCache(
+    TestCenter,
+    fields=("name", "idle", "notes", "updated_at"),
+)
+EXAM_DETAIL = ObjectCache(
+    TestCenterExam,
+    fields=(
+        "id",
+        "date",
+        "presence",
+        "notes",
+        "updated_at",
+        "client__uid",
+        "client__name",
+        "certification__name",
+        "testCenter__name",
+    ),
+)
 
 
 def testcenter_home(request):
@@ -34,49 +76,6 @@ def testcenter_home(request):
 def testcenter_list(request):
     """View para listar os Centros de Provas."""
 
-    # Obtenção dos Filtros
-    query = request.GET.get("testCenter-list-query")
-    idle = request.GET.get("testCenter-list-idle")
-
-    # Ordenação
-    order_by = request.GET.get("order_by", "name")
-    descending = request.GET.get("descending", "False") == "True"
-
-    # Otimização da Consulta
-    testcenter = TestCenter.objects.all()
-
-    # Filtragem
-    if query:
-        testcenter = testcenter.filter(
-            Q(name__icontains=query)
-        )
-
-    if idle in ["True", "False"]:
-        testcenter = testcenter.filter(idle=(idle == "True"))
-
-    # Aplicação de Filtros da Ordenação
-    if descending:
-        order_by = f"-{order_by}"
-    testcenter = testcenter.order_by(order_by)
-
-    # Registros por Página
-    records_per_page = request.GET.get("records_per_page", 20)
-    try:
-        records_per_page = int(records_per_page)
-    except (ValueError, TypeError):
-        records_per_page = 10
-
-    # Paginação
-    paginator = Paginator(testcenter, records_per_page)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-
-    # Tratamento de Erros na Paginação
-    try:
-        page_obj = paginator.get_page(page_number)
-    except (ValueError, TypeError):
-        page_obj = paginator.get_page(1)
-
     # Definição dos Campos de Pesquisa
     search_fields = [
         {
@@ -97,44 +96,32 @@ def testcenter_list(request):
         },
     ]
 
-    context = {
-        "testcenter": testcenter,
-        "page_obj": page_obj,
-        "search_fields": search_fields,
-        "query_params": request.GET.urlencode(),
-        "headers": [
-            {"field": "id", "label": "ID"},
-            {"field": "name", "label": "Nome"},
-            {"field": "notes", "label": "Observações"},
-            {"field": "idle", "label": "Inativo"},
-        ],
-        "rows": [
-            [
-                testcenter.id,
-                mark_safe(
-                    f'<a href="{reverse(
-                        "testcenter_detail",
-                        args=[testcenter.id]
-                    )}">{testcenter.name}</a>'
-                ),
-                testcenter.notes if testcenter.notes else "",
-                "Sim" if testcenter.idle else "Não",
-            ]
-            for testcenter in page_obj
-        ],
-    }
-
-    if request.headers.get("x-requested-with") == "XMLHttpRequest":
-        return render(request, "includes/table.html", context)
-    else:
-        return render(request, "testCenters/testCenters_list.html", context)
+    return render_list(
+        request,
+        TESTCENTER_LIST,
+        "testCenters/testCenters_list.html",
+        {"search_fields": search_fields},
+    )
+
 
+def testcenter_autocomplete(request):
+    """View de autocompletar Centros de Provas nos campos select2."""
+
+    return autocomplete_response(
+        request,
+        TestCenter.objects.order_by("name", "pk"),
+        search=testcenter_option_q,
+        label=testcenter_option_label,
+        values=TESTCENTER_OPTION_VALUES,
+    )
 
+
+@detail_condition(TestCenter, objects=TESTCENTER_DETAIL)
 def testcenter_detail(request, pk):
     """View para exibir os detalhes de um Centro de Provas."""
 
     # Obtenção dos Filtros
-    testcenter = get_object_or_404(TestCenter, pk=pk)
+    testcenter = TESTCENTER_DETAIL.get_or_404(request, pk)
 
     # Mensagem de confirmação de exclusão do Centro de Provas
     message_confirmation_delete = (
@@ -426,80 +413,10 @@ def testcenter_delete(request, pk):
 def exam_list(request):
     """View para listar os Exames Realizados no Centro de Provas."""
 
-    # Obtenção dos Filtros
-    client = request.GET.get("exam-list-client")
-    certification = request.GET.get("exam-list-certification")
-    test_center = request.GET.get("exam-list-testCenter")
-    date_range = request.GET.get("exam-list-dateRange")
-    presence = request.GET.get("exam-list-presence")
-
-    # Ordenação
-    order_by = request.GET.get("order_by", "date")
-    descending = request.GET.get("descending", "False") == "True"
-
-    # Otimização da Consulta
-    exams = TestCenterExam.objects.select_related(
-        "client",
-        "testCenter",
-        "certification",
-    )
-
-    # Filtragem
-    if client:
-        exams = exams.filter(client__uid=client)
-
-    if certification:
-        exams = exams.filter(certification__id=certification)
-
-    if test_center:
-        exams = exams.filter(testCenter__id=test_center)
-
-    if date_range:
-        try:
-            start_date, end_date = date_range.split(" - ")
-            start_date = datetime.strptime(
-                start_date.strip(),
-                '%d/%m/%Y'
-            ).date()
-            end_date = datetime.strptime(
-                end_date.strip(),
-                '%d/%m/%Y'
-            ).date()
-            end_date += timedelta(days=1)  # Inclui o final do dia
-            exams = exams.filter(date__range=[start_date, end_date])
-        except (ValueError, TypeError):
-            pass
-
-    if presence in ["True", "False"]:
-        exams = exams.filter(presence=(presence == "True"))
-
-    # Aplicação de Filtros da Ordenação
-    if descending:
-        order_by = f"-{order_by}"
-        exams = exams.order_by(order_by)
-
-    # Registros por Página
-    records_per_page = request.GET.get("records_per_page", 20)
-    try:
-        records_per_page = int(records_per_page)
-    except (ValueError, TypeError):
-        records_per_page = 10
-
-    # Paginação
-    paginator = Paginator(exams, records_per_page)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
-
-    # Tratamento de Erros na Paginação
-    try:
-        page_obj = paginator.get_page(page_number)
-    except (ValueError, TypeError):
-        page_obj = paginator.get_page(1)
-
-    # Busca e Ordenação das Opções de Seleção
-    clients = Client.objects.order_by("name")
-    certifications = Certification.objects.order_by("name")
-    test_centers = TestCenter.objects.order_by("name")
+    # Valores selecionados nos filtros (as demais opções vêm por AJAX)
+    client = request.GET.get("exam-list-client", "")
+    certification = request.GET.get("exam-list-certification", "")
+    test_center = request.GET.get("exam-list-testCenter", "")
 
     # Definição dos Campos de Pesquisa
     search_fields = [
@@ -515,39 +432,36 @@ def exam_list(request):
             "name": "exam-list-client",
             "label": "Cliente",
             "type": "select",
-            "options": [
-                (
-                    client.uid,
-                    f"{client.uid}: {client.name}"
-                ) for client in clients
-            ],
-            "selected": request.GET.get("client", ""),
+            "ajax_url": reverse("client_autocomplete"),
+            "options": selected_option(
+                Client.objects.all(),
+                client,
+                label=client_option_label,
+                values=CLIENT_OPTION_VALUES,
+            ),
+            "selected": client,
         },
         {
             "id": "exam-list-certification",
             "name": "exam-list-certification",
             "label": "Certificação",
             "type": "select",
-            "options": [
-                (
-                    certification.id,
-                    f"{certification.name}({certification.examCode})"
-                ) for certification in certifications
-            ],
-            "selected": request.GET.get("certification", ""),
+            "ajax_url": reverse("certification_autocomplete"),
+            "options": CERTIFICATION_DIMENSION.selected_option(
+                request, certification, label=certification_option_label
+            ),
+            "selected": certification,
         },
         {
             "id": "exam-list-testCenter",
             "name": "exam-list-testCenter",
             "label": "Centro de Provas",
             "type": "select",
-            "options": [
-                (
-                    test_center.id,
-                    test_center.name
-                ) for test_center in test_centers
-            ],
-            "selected": request.GET.get("test_center", ""),
+            "ajax_url": reverse("testcenter_autocomplete"),
+            "options": TESTCENTER_DIMENSION.selected_option(
+                request, test_center, label=testcenter_option_label
+            ),
+            "selected": test_center,
         },
         {
             "id": "exam-list-presence",
@@ -559,50 +473,143 @@ def exam_list(request):
         },
     ]
 
-    context = {
-        "exams": exams,
-        "page_obj": page_obj,
-        "search_fields": search_fields,
-        "query_params": request.GET.urlencode(),
-        "headers": [
-            {"field": "date", "label": "Data e Hora do Exame"},
-            {"field": "client__name", "label": "Cliente"},
-            {"field": "certification__name", "label": "Certificação"},
-            {"field": "test_center__name", "label": "Centro de Provas"},
-            {"field": "presence", "label": "Presença Confirmada"},
-            {"field": "notes", "label": "Observações"},
-        ],
-        "rows": [
-            [
-                timezone.localtime(exam.date).strftime("%d/%m/%Y %H:%M"),
-                mark_safe(
-                    f'<a href="{reverse(
-                        "exam_detail",
-                        args=[exam.id]
-                    )}">'
-                    f'{exam.client.name if exam.client else ""}</a>'
-                ),
-                exam.certification.name if exam.certification else "",
-                exam.test_center.name if exam.test_center else "",
-                "Sim" if exam.presence else "Não",
-            ]
-            for exam in page_obj
-        ],
-    }
-
-    if request.headers.get("x-requested-with") == "XMLHttpRequest":
-        return render(request, "includes/table.html", context)
+    return render_list(
+        request,
+        EXAM_LIST,
+        "testCenters/exams_list.html",
+        {"search_fields": search_fields},
+    )
+
+
+def exam_export(request):
+    """
+    View para Exportar os Exames filtrados (CSV ou JSON Lines).
+
+    Aplica os mesmos filtros da listagem de Exames, sem paginação, em ordem
+    de data (e ID), crescente ou decrescente como na listagem; o formato é
+    escolhido por ``?format=csv|jsonl``.
+    """
+
+    export_format = request.GET.get("format", DEFAULT_EXPORT_FORMAT)
+    if export_format not in EXPORT_FORMATS:
+        return HttpResponseBadRequest(
+            f"Formato de exportação inválido: {export_format}. "
+            f"Use {' ou '.join(EXPORT_FORMATS)}."
+        )
+
+    # Filtros da listagem, sem ordenação: a exportação é lida em blocos
+    # por cursor sobre (date, id)
+    params = request.GET.copy()
+    params["pagination"] = "cursor"
+    list_query = EXAM_LIST.compile_params(params)
+
+    return export_response(
+        list_query.queryset,
+        EXAM_EXPORT_COLUMNS,
+        export_format,
+        filename="exames",
+        ordering=EXAM_LIST.cursor_ordering,
+        descending=list_query.descending,
+    )
+
+
+@guardrails_exempt
+def exam_import(request):
+    """View para Importar a agenda de Exames de um Certificador."""
+
+    result = None
+    if request.method == "POST":
+        form = ExamImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            # Leitura do arquivo em fluxo, sem carregá-lo inteiro na memória
+            csv_file = io.TextIOWrapper(
+                form.cleaned_data["file"].file,
+                encoding="utf-8-sig",
+                newline="",
+            )
+            try:
+                result = import_exams(csv_file)
+                messages.success(
+                    request,
+                    f"{result.created} Exame(s) criado(s), "
+                    f"{result.updated} Exame(s) atualizado(s), "
+                    f"{result.error_count} linha(s) com erro."
+                )
+            except UnicodeDecodeError:
+                form.add_error(
+                    "file",
+                    "O arquivo deve estar codificado em UTF-8."
+                )
+            except ValidationError as e:
+                form.add_error("file", e)
+            except DatabaseError as e:
+                log_exception(
+                    exception=e,
+                    context="Erro ao importar Exames",
+                )
+                messages.error(
+                    request,
+                    "Erro interno ao importar os Exames."
+                )
+        else:
+            messages.error(
+                request,
+                "Erro ao importar os Exames."
+            )
     else:
-        return render(request, "testCenters/exams_list.html", context)
+        form = ExamImportForm()
 
+    # Definição das Seções e Botões para o Template
+    sections = [
+        {
+            "title": "Agenda de Exames",
+            "fields": [form["file"]],
+        },
+    ]
+    if result is not None:
+        sections.append({
+            "title": (
+                f"Resultado: {result.created} Exame(s) criado(s), "
+                f"{result.updated} atualizado(s), "
+                f"{result.error_count} linha(s) com erro"
+            ),
+            "is_table": True,
+            "table_headers": ["Linha", "Erro"],
+            "fields": [
+                {"values": [line, message]}
+                for line, message in result.errors
+            ],
+        })
 
+    buttons = [
+        {
+            "class": "btn-return",
+            "url": reverse("testcenter_home"),
+            "title": "Retornar",
+            "text": "Retornar",
+        },
+    ]
+
+    # Renderização do Template
+    return render(
+        request,
+        "testCenters/exams_import.html",
+        {
+            "form": form,
+            "sections": sections,
+            "buttons": buttons,
+        },
+    )
+
+
+@detail_condition(TestCenterExam, objects=EXAM_DETAIL)
 def exam_detail(request, pk):
     """
     View para exibir os detalhes de um Exame Realizado no Centro de Provas.
     """
 
     # Obtenção dos Filtros
-    exam = get_object_or_404(TestCenterExam, pk=pk)
+    exam = EXAM_DETAIL.get_or_404(request, pk)
 
     # Mensagem de confirmação de exclusão do Exame
     message_confirmation_delete = (
@@ -656,8 +663,8 @@ def exam_detail(request, pk):
                 {
                     "label": "Centro de Provas",
                     "value": (
-                        exam.test_center.name
-                        if exam.test_center
+                        exam.testCenter.name
+                        if exam.testCenter
                         else ""
                     ),
                 },
@@ -674,15 +681,9 @@ def exam_detail(request, pk):
     ]
 
     buttons = [
-        {
-            "class": "btn-edit",
-            "url": reverse("exam_edit", args=[exam.pk]),
-            "title": "Editar Exame Realizado no Centro de Provas",
-            "aria-label": "Editar Exame Realizado no Centro de Provas",
-        },
         {
             "class": "btn-delete",
-            "url": reverse("exam_delete", args=[exam.pk]),
+            "url": reverse("delete_item", args=["TestCenterExam", exam.pk]),
             "data": {
                 "model": "TestCenterExam",
                 "pk": exam.pk,
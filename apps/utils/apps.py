@@ -1,4 +1,4 @@
-# apps/utils/utils.py
+# apps/utils/apps.py
 
 """
 Configuração do app 'utils' para a aplicação Django.
@@ -12,3 +12,7 @@ class UtilsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.utils"
+
+    def ready(self):
+        """Registra os receptores de sinais do app."""
+        from . import signals  # noqa: F401
@@ -0,0 +1,100 @@
+# apps/utils/autocomplete.py
+
+"""
+Respostas de autocompletar no protocolo AJAX do select2.
+
+O select2 envia ``term`` (texto digitado) e ``page`` (a partir de 1) e
+espera ``{"results": [{"id", "text"}], "pagination": {"more"}}``. A busca
+é feita por prefixo em colunas indexadas e apenas as colunas usadas no
+rótulo são carregadas.
+
+O parâmetro opcional ``idle`` ("True"/"False") restringe os resultados à
+situação do registro (ex.: apenas ativos nos formulários).
+"""
+
+from django.db.models import Q
+from django.http import JsonResponse
+
+AUTOCOMPLETE_PER_PAGE = 20
+
+# Maior caractere Unicode: limite superior de uma busca por prefixo
+PREFIX_UPPER_BOUND = "\U0010ffff"
+
+
+def prefix_q(field, term):
+    """
+    Busca por prefixo como intervalo (``campo >= termo AND campo < termo +
+    maior caractere``), que o banco atende com o índice do campo.
+    """
+    return Q(**{
+        f"{field}__gte": term,
+        f"{field}__lt": term + PREFIX_UPPER_BOUND,
+    })
+
+
+def selected_option(queryset, value, label, values):
+    """
+    Retorna apenas a opção selecionada de um campo de filtro, com uma única
+    consulta pela chave primária.
+
+    Args:
+        queryset (QuerySet): Consulta do modelo.
+        value (str): Valor selecionado (``request.GET``).
+        label (callable): Monta o rótulo a partir da tupla de ``values``.
+        values (tuple): Colunas carregadas; a primeira é a chave primária.
+
+    Returns:
+        list: [(valor, rótulo)] ou lista vazia.
+    """
+    if not value:
+        return []
+    try:
+        row = queryset.filter(pk=value).values_list(*values).first()
+    except (ValueError, TypeError):
+        return []
+    if row is None:
+        return []
+    return [(str(row[0]), label(row))]
+
+
+def autocomplete_response(request, queryset, search, label, values,
+                          per_page=AUTOCOMPLETE_PER_PAGE):
+    """
+    Gera a resposta JSON de uma página de resultados para o select2.
+
+    Args:
+        request (HttpRequest): Requisição com ``term``, ``page`` e,
+            opcionalmente, ``idle``.
+        queryset (QuerySet): Consulta base, já ordenada.
+        search (callable): Converte o termo em uma condição ``Q``.
+        label (callable): Monta o rótulo a partir da tupla de ``values``.
+        values (tuple): Colunas carregadas; a primeira é a chave primária.
+        per_page (int): Resultados por página.
+
+    Returns:
+        JsonResponse: Resultados e indicação de próxima página.
+    """
+    term = request.GET.get("term", "").strip()
+    try:
+        page = max(int(request.GET.get("page", 1)), 1)
+    except (ValueError, TypeError):
+        page = 1
+
+    if term:
+        queryset = queryset.filter(search(term))
+
+    idle = request.GET.get("idle")
+    if idle in ["True", "False"]:
+        queryset = queryset.filter(idle=idle == "True")
+
+    offset = (page - 1) * per_page
+    rows = list(
+        queryset.values_list(*values)[offset:offset + per_page + 1]
+    )
+
+    return JsonResponse({
+        "results": [
+            {"id": row[0], "text": label(row)} for row in rows[:per_page]
+        ],
+        "pagination": {"more": len(rows) > per_page},
+    })
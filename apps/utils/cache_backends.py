@@ -0,0 +1,350 @@
+# apps/utils/cache_backends.py
+
+"""
+Backend de cache em dois níveis: LRU local (por processo) sobre um cache
+remoto (ex.: Memcached).
+
+Leituras consultam primeiro a memória do processo e só vão à rede em caso
+de ausência; escritas vão aos dois níveis. Configuração::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "apps.utils.cache_backends.TwoTierCache",
+            "LOCATION": "memcached",  # Alias do cache remoto
+            "OPTIONS": {
+                "MAX_ENTRIES": 5000,
+                "LOCAL_TIMEOUT": 5,
+                "LOCAL_TIMEOUTS": {"data-version": 0, "list-table": None},
+                "LOCAL_EXCLUDED_SUFFIXES": (":lock", ":stale"),
+                "DEGRADE": True,
+                "FAILURE_THRESHOLD": 3,
+                "RETRY_INTERVAL": 30,
+            },
+        },
+        "memcached": {...},
+    }
+
+Coerência entre processos: uma entrada local pode ficar desatualizada
+enquanto outro processo grava a mesma chave, por isso o tempo de vida local
+é curto (``LOCAL_TIMEOUT``, em segundos). ``LOCAL_TIMEOUTS`` ajusta esse
+tempo pelo prefixo da chave:
+
+- 0: a chave nunca é guardada localmente, ex.: as versões de dados
+  (``cache_versions``), que são o mecanismo de invalidação;
+- None: o tempo de vida do cache remoto, para chaves versionadas (que
+  incluem a versão de dados e, portanto, nunca mudam de conteúdo).
+
+Chaves terminadas em um dos sufixos de ``LOCAL_EXCLUDED_SUFFIXES`` nunca
+são guardadas localmente, qualquer que seja o prefixo: ex.: as travas e as
+cópias desatualizadas de ``computations.py``, que mudam de conteúdo sob um
+prefixo de chaves versionadas.
+
+Com ``DEGRADE`` ativo, falhas do cache remoto não interrompem a requisição:
+a operação usa apenas o nível local e, após ``FAILURE_THRESHOLD`` falhas
+seguidas (com vários servidores, a queda de um deles é absorvida pelo
+cliente do Memcached, que redistribui as chaves), o cache remoto é
+ignorado por ``RETRY_INTERVAL`` segundos e o nível local
+passa a guardar as escritas com o tempo de vida completo (as sessões
+continuam válidas no processo durante a indisponibilidade). Quando o cache
+remoto volta a responder, o nível local é descartado.
+"""
+
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_TIMEOUT = 5
+DEFAULT_RETRY_INTERVAL = 30
+DEFAULT_FAILURE_THRESHOLD = 1
+
+_MISSING = object()
+
+
+class LocalLRU:
+    """
+    Armazenamento em memória com tamanho máximo (descarta as entradas
+    usadas há mais tempo) e tempo de vida por entrada.
+
+    Os valores são guardados serializados (``pickle``), para que
+    alterações no objeto devolvido não modifiquem o cache.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, pickled = entry
+            if expires is not None and expires <= time.time():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def set(self, key, value, expires):
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._data[key] = (expires, pickled)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TwoTierCache(BaseCache):
+    """
+    Cache com um nível local (``LocalLRU``) na frente de outro cache do
+    ``CACHES``, indicado em ``LOCATION``.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.remote_alias = location
+        self.local = LocalLRU(self._max_entries)
+        self.local_timeout = options.get(
+            "LOCAL_TIMEOUT", DEFAULT_LOCAL_TIMEOUT
+        )
+        self.local_timeouts = sorted(
+            options.get("LOCAL_TIMEOUTS", {}).items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.local_excluded_suffixes = tuple(
+            options.get("LOCAL_EXCLUDED_SUFFIXES", ())
+        )
+        self.degrade = options.get("DEGRADE", True)
+        self.retry_interval = options.get(
+            "RETRY_INTERVAL", DEFAULT_RETRY_INTERVAL
+        )
+        self.failure_threshold = options.get(
+            "FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD
+        )
+        self._failures = 0
+        self._unavailable_until = 0.0
+        self._degraded = False
+
+    @property
+    def remote(self):
+        return caches[self.remote_alias]
+
+    # Nível remoto
+
+    def remote_available(self):
+        """Indica se o cache remoto deve ser consultado."""
+        return time.monotonic() >= self._unavailable_until
+
+    def call_remote(self, method, *args, **kwargs):
+        """
+        Executa uma operação no cache remoto.
+
+        Returns:
+            O resultado da operação, ou ``_MISSING`` se o cache remoto
+            estiver indisponível (com ``DEGRADE`` ativo).
+        """
+        if not self.remote_available():
+            return _MISSING
+        try:
+            result = getattr(self.remote, method)(*args, **kwargs)
+        except ValueError:
+            # Erro de uso (ex.: incr de chave ausente), não de conexão
+            raise
+        except Exception as e:
+            if not self.degrade:
+                raise
+            self._degraded = True
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                logger.warning(
+                    "Falha no cache remoto '%s': %s", self.remote_alias, e
+                )
+                return _MISSING
+            self._failures = 0
+            self._unavailable_until = time.monotonic() + self.retry_interval
+            logger.warning(
+                "Cache remoto '%s' indisponível por %ss: %s",
+                self.remote_alias,
+                self.retry_interval,
+                e,
+            )
+            return _MISSING
+        self._failures = 0
+        if self._degraded:
+            # As cópias locais gravadas durante a indisponibilidade podem
+            # divergir do cache remoto
+            self._degraded = False
+            self.local.clear()
+            logger.warning(
+                "Cache remoto '%s' restabelecido.", self.remote_alias
+            )
+        return result
+
+    # Nível local
+
+    def local_key(self, key, version):
+        return self.make_and_validate_key(key, version=version)
+
+    def local_expiry(self, key, timeout, remote_stored=True):
+        """
+        Momento de expiração da entrada local, ou ``_MISSING`` se a chave
+        não deve ser guardada localmente.
+        """
+        backend_timeout = self.get_backend_timeout(timeout)
+        if not remote_stored:
+            # Cache remoto indisponível: o nível local é a única cópia
+            return backend_timeout
+        if key.endswith(self.local_excluded_suffixes):
+            return _MISSING
+        local_timeout = self.local_timeout
+        for prefix, prefix_timeout in self.local_timeouts:
+            if key.startswith(prefix):
+                local_timeout = prefix_timeout
+                break
+        if local_timeout is None:
+            return backend_timeout
+        if local_timeout == 0:
+            return _MISSING
+        expires = time.time() + local_timeout
+        if backend_timeout is not None:
+            expires = min(expires, backend_timeout)
+        return expires
+
+    def store_local(self, key, value, timeout, version, remote_stored=True):
+        local_key = self.local_key(key, version)
+        expires = self.local_expiry(key, timeout, remote_stored)
+        if expires is _MISSING:
+            self.local.delete(local_key)
+        else:
+            self.local.set(local_key, value, expires)
+
+    # API do cache
+
+    def get(self, key, default=None, version=None):
+        value = self.local.get(self.local_key(key, version))
+        if value is not _MISSING:
+            return value
+        value = self.call_remote("get", key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self.store_local(key, value, DEFAULT_TIMEOUT, version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(self.local_key(key, version))
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        if missing:
+            remote_found = self.call_remote(
+                "get_many", missing, version=version
+            )
+            if remote_found is not _MISSING:
+                for key, value in remote_found.items():
+                    self.store_local(key, value, DEFAULT_TIMEOUT, version)
+                found.update(remote_found)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        result = self.call_remote(
+            "set", key, value, timeout=timeout, version=version
+        )
+        self.store_local(
+            key, value, timeout, version, remote_stored=result is not _MISSING
+        )
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        result = self.call_remote(
+            "set_many", data, timeout=timeout, version=version
+        )
+        remote_stored = result is not _MISSING
+        failed = set(result) if remote_stored else set()
+        for key, value in data.items():
+            if key not in failed:
+                self.store_local(key, value, timeout, version, remote_stored)
+        return list(failed)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.call_remote(
+            "add", key, value, timeout=timeout, version=version
+        )
+        if added is _MISSING:
+            local_key = self.local_key(key, version)
+            if self.local.get(local_key) is not _MISSING:
+                return False
+            self.store_local(key, value, timeout, version, False)
+            return True
+        if added:
+            self.store_local(key, value, timeout, version)
+        return added
+
+    def incr(self, key, delta=1, version=None):
+        if self.remote_available():
+            value = self.call_remote("incr", key, delta, version=version)
+            if value is not _MISSING:
+                self.store_local(key, value, DEFAULT_TIMEOUT, version)
+                return value
+        # Cache remoto indisponível: incrementa a cópia local
+        local_key = self.local_key(key, version)
+        value = self.local.get(local_key)
+        if value is _MISSING:
+            raise ValueError(f"Key '{key}' not found")
+        value += delta
+        self.store_local(key, value, DEFAULT_TIMEOUT, version, False)
+        return value
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        touched = self.call_remote("touch", key, timeout, version=version)
+        local_key = self.local_key(key, version)
+        value = self.local.get(local_key)
+        if value is not _MISSING:
+            self.store_local(
+                key, value, timeout, version, touched is not _MISSING
+            )
+        if touched is _MISSING:
+            return value is not _MISSING
+        return bool(touched)
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def delete(self, key, version=None):
+        deleted_local = self.local.delete(self.local_key(key, version))
+        deleted = self.call_remote("delete", key, version=version)
+        if deleted is _MISSING:
+            return deleted_local
+        return bool(deleted) or deleted_local
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self.local.delete(self.local_key(key, version))
+        self.call_remote("delete_many", keys, version=version)
+
+    def clear(self):
+        self.local.clear()
+        self.call_remote("clear")
@@ -0,0 +1,97 @@
+# apps/utils/cache_versions.py
+
+"""
+Versões de dados por modelo, armazenadas no cache padrão.
+
+Cada modelo dos apps do projeto possui um número de versão que é
+incrementado após o commit de cada ``post_save``/``post_delete`` (ver
+``signals.py``). Chaves de cache que incluem essa versão ficam obsoletas
+automaticamente após uma escrita, sem a necessidade de apagar entradas uma
+a uma.
+
+Cada registro também possui uma versão própria (``object_version_key``),
+usada pelo cache de objetos (``object_cache``) para invalidar apenas as
+entradas que dependem do registro alterado. Essa versão é um token
+aleatório, e não um contador: uma chave expulsa do cache nunca volta a
+coincidir com o token guardado em uma entrada antiga.
+"""
+
+import uuid
+
+from django.core.cache import cache
+
+VERSION_KEY_PREFIX = "data-version"
+OBJECT_VERSION_KEY_PREFIX = "object-version"
+
+
+def version_key(model):
+    """Retorna a chave de cache da versão de dados do modelo."""
+    return f"{VERSION_KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def get_version(model):
+    """
+    Retorna a versão de dados atual do modelo.
+
+    Args:
+        model (Model): Classe do modelo.
+
+    Returns:
+        int: Versão atual (inicia em 1).
+    """
+    return cache.get_or_set(version_key(model), 1, timeout=None)
+
+
+def bump_version(model):
+    """
+    Incrementa a versão de dados do modelo, invalidando todas as chaves
+    derivadas dela.
+
+    Args:
+        model (Model): Classe do modelo.
+    """
+    key = version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Chave ausente (cache reiniciado ou expirado)
+        cache.set(key, 2, timeout=None)
+
+
+def object_version_key(model, pk):
+    """Retorna a chave de cache da versão de um registro."""
+    return f"{OBJECT_VERSION_KEY_PREFIX}:{model._meta.label_lower}:{pk}"
+
+
+def get_object_versions(keys):
+    """
+    Retorna as versões dos registros, criando as ausentes.
+
+    Args:
+        keys (list): Chaves de ``object_version_key``.
+
+    Returns:
+        dict: Chave -> versão (token).
+    """
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # add() não sobrescreve a versão gravada por outro processo
+            cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def bump_object_versions(model, pks):
+    """
+    Renova a versão dos registros, invalidando as entradas do cache de
+    objetos que dependem deles.
+
+    Args:
+        model (Model): Classe do modelo.
+        pks (iterable): Chaves primárias dos registros.
+    """
+    cache.set_many(
+        {object_version_key(model, pk): uuid.uuid4().hex for pk in pks},
+        timeout=None,
+    )
@@ -0,0 +1,153 @@
+# apps/utils/computations.py
+
+"""
+Cálculos caros em cache, protegidos contra recálculos simultâneos.
+
+Quando um valor em cache (ex.: a contagem de uma listagem) expira ou é
+invalidado sob carga, todas as requisições concorrentes tentariam
+recalculá-lo ao mesmo tempo. ``get_or_compute`` (e o decorador
+``cached_computation``) evita isso:
+
+- single-flight: apenas a requisição que obtém a trava da chave, via
+  ``cache.add()``, recalcula o valor;
+- stale-while-revalidate: enquanto isso, as demais recebem o último valor
+  calculado (mesmo que de uma versão de dados anterior); sem nenhum valor
+  anterior, aguardam o cálculo por até ``COMPUTATION_WAIT_TIMEOUT``
+  segundos antes de calcular por conta própria;
+- tempo de vida com variação aleatória (``COMPUTATION_TTL_JITTER``), para
+  que as chaves criadas juntas não expirem todas no mesmo instante.
+
+O valor atual fica na chave ``<chave>:<carimbo>`` (o carimbo é, por
+exemplo, a versão de dados do modelo) e uma cópia do último valor fica em
+``<chave>:stale``, com tempo de vida maior, para ser servida durante o
+recálculo.
+"""
+
+import random
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+
+LOCK_SUFFIX = "lock"
+STALE_SUFFIX = "stale"
+
+# Intervalo (em segundos) entre as verificações de quem aguarda um cálculo
+WAIT_INTERVAL = 0.05
+
+_MISSING = object()
+
+
+def jittered(timeout, jitter=None):
+    """
+    Tempo de vida com variação aleatória para baixo de até ``jitter``
+    (fração do tempo de vida).
+    """
+    if jitter is None:
+        jitter = settings.COMPUTATION_TTL_JITTER
+    if not timeout or not jitter:
+        return timeout
+    return max(int(timeout * (1 - random.uniform(0, jitter))), 1)
+
+
+def get_or_compute(key, compute, timeout, stamp=None, stale_timeout=None,
+                   lock_timeout=None, wait_timeout=None):
+    """
+    Retorna o valor em cache da chave, calculando-o uma única vez entre as
+    requisições concorrentes.
+
+    Args:
+        key (str): Chave lógica do cálculo.
+        compute (callable): Calcula o valor (sem argumentos).
+        timeout (int): Tempo de vida do valor atual, em segundos.
+        stamp (str | int): Carimbo do valor, ex.: versão de dados; um valor
+            com outro carimbo é tratado como desatualizado.
+        stale_timeout (int): Tempo extra em que o último valor pode ser
+            servido desatualizado (padrão: ``timeout``).
+        lock_timeout (int): Tempo máximo da trava de recálculo, em
+            segundos (padrão: ``COMPUTATION_LOCK_TIMEOUT``).
+        wait_timeout (float): Espera máxima pelo cálculo de outra
+            requisição quando não há valor anterior (padrão:
+            ``COMPUTATION_WAIT_TIMEOUT``).
+
+    Returns:
+        O valor calculado ou em cache.
+    """
+    fresh_key = key if stamp is None else f"{key}:{stamp}"
+    value = cache.get(fresh_key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    if lock_timeout is None:
+        lock_timeout = settings.COMPUTATION_LOCK_TIMEOUT
+    lock_key = f"{fresh_key}:{LOCK_SUFFIX}"
+    stale_key = f"{key}:{STALE_SUFFIX}"
+
+    if not cache.add(lock_key, 1, timeout=lock_timeout):
+        # Outra requisição está recalculando: serve o último valor
+        stale = cache.get(stale_key, _MISSING)
+        if stale is not _MISSING:
+            return stale
+
+        if wait_timeout is None:
+            wait_timeout = settings.COMPUTATION_WAIT_TIMEOUT
+        deadline = time.monotonic() + wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(WAIT_INTERVAL)
+            value = cache.get(fresh_key, _MISSING)
+            if value is not _MISSING:
+                return value
+        # A requisição com a trava demorou demais (ou falhou)
+        return compute()
+
+    try:
+        value = compute()
+        if stale_timeout is None:
+            stale_timeout = timeout
+        cache.set(fresh_key, value, timeout=jittered(timeout))
+        cache.set(stale_key, value, timeout=timeout + stale_timeout)
+    finally:
+        cache.delete(lock_key)
+    return value
+
+
+def cached_computation(key_func, timeout, stamp_func=None, **options):
+    """
+    Decorador de ``get_or_compute`` para funções.
+
+    Args:
+        key_func (callable): Monta a chave a partir dos argumentos da
+            função.
+        timeout (int | callable): Tempo de vida do valor, em segundos (ou
+            função sem argumentos que o retorna, ex.: lida dos settings).
+        stamp_func (callable): Monta o carimbo a partir dos argumentos da
+            função (ex.: versão de dados do modelo).
+        **options: Demais argumentos de ``get_or_compute``.
+
+    Exemplo::
+
+        @cached_computation(
+            key_func=lambda year: f"exams-per-month:{year}",
+            timeout=600,
+            stamp_func=lambda year: get_version(TestCenterExam),
+        )
+        def exams_per_month(year):
+            ...
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return get_or_compute(
+                key_func(*args, **kwargs),
+                lambda: func(*args, **kwargs),
+                timeout=timeout() if callable(timeout) else timeout,
+                stamp=(
+                    stamp_func(*args, **kwargs)
+                    if stamp_func is not None else None
+                ),
+                **options,
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,113 @@
+# apps/utils/conditional.py
+
+"""
+GET condicional (ETag/Last-Modified) para as páginas de detalhe.
+
+O ETag de uma página de detalhe combina:
+
+- o ``updated_at`` do registro exibido (uma consulta pela chave primária,
+  sem renderizar o template);
+- a versão de dados (``cache_versions``) dos modelos relacionados cujos
+  campos também aparecem na página (ex.: nome do Cliente em um Exame);
+- o usuário e o token CSRF da sessão, que fazem parte do HTML.
+
+Com um cache de objetos (``object_cache``), o ``updated_at`` e as versões
+vêm da entrada em cache do registro, que a view reutiliza: as versões do
+registro e de cada registro relacionado exibido substituem as versões dos
+modelos relacionados, e a página não consulta o banco de dados.
+
+Quando o navegador envia ``If-None-Match`` com o ETag atual, a resposta é
+304 sem consultar os demais dados nem renderizar o template.
+``Last-Modified`` é enviado apenas para páginas sem modelos relacionados,
+pois nesse caso o ``updated_at`` do registro basta para descrevê-las.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .cache_versions import get_version
+
+
+def get_updated_at(request, model, pk):
+    """
+    Retorna o ``updated_at`` do registro, consultado uma única vez por
+    requisição (ou None se o registro não existir).
+    """
+    cache = request.__dict__.setdefault("_detail_updated_at", {})
+    key = (model._meta.label, str(pk))
+    if key not in cache:
+        try:
+            cache[key] = (
+                model.objects.filter(pk=pk)
+                .values_list("updated_at", flat=True)
+                .first()
+            )
+        except (ValueError, TypeError):
+            cache[key] = None
+    return cache[key]
+
+
+def detail_condition(model, related=(), objects=None):
+    """
+    Decorador de views de detalhe (``view(request, pk)``) com GET
+    condicional.
+
+    As respostas recebem ``Cache-Control: private, no-cache``, para que o
+    navegador sempre revalide a página com o servidor.
+
+    Args:
+        model (Model): Modelo exibido na página.
+        related (tuple): Modelos relacionados exibidos na página.
+        objects (ObjectCache): Cache dos registros usado pela view; os
+            campos devem incluir ``updated_at``.
+    """
+
+    def versions(request, pk):
+        if objects is not None:
+            entry = objects.get_entry(request, pk)
+            return sorted(entry["versions"].items())
+        return [get_version(related_model) for related_model in related]
+
+    def updated_at_of(request, pk):
+        if objects is not None:
+            entry = objects.get_entry(request, pk)
+            return entry["values"]["updated_at"] if entry else None
+        return get_updated_at(request, model, pk)
+
+    def etag_func(request, pk, **kwargs):
+        updated_at = updated_at_of(request, pk)
+        if updated_at is None:
+            return None
+        key = repr((
+            model._meta.label,
+            str(pk),
+            updated_at.isoformat(),
+            versions(request, pk),
+            request.user.pk,
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ""),
+        ))
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def last_modified_func(request, pk, **kwargs):
+        if related or (objects is not None and objects.relations):
+            return None
+        return updated_at_of(request, pk)
+
+    def decorator(view):
+        conditional_view = condition(
+            etag_func=etag_func, last_modified_func=last_modified_func
+        )(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,133 @@
+# apps/utils/counts.py
+
+"""
+Contagem de registros em cache para as listagens.
+
+A contagem é armazenada no ``CACHES["default"]`` com uma chave formada
+pelo modelo, pela sua versão de dados e pelos filtros normalizados. Como a
+versão é incrementada em ``post_save``/``post_delete``, qualquer escrita no
+modelo invalida as contagens anteriores.
+
+O recálculo passa por ``cached_computation`` (``computations.py``): apenas
+uma requisição por vez conta os registros, enquanto as demais exibem a
+última contagem conhecida.
+
+Para listagens sem filtros sobre tabelas grandes, é possível usar uma
+contagem aproximada obtida das estatísticas do banco de dados.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+from .cache_versions import get_version
+from .computations import cached_computation
+
+COUNT_KEY_PREFIX = "list-count"
+
+
+def normalize_filters(filters):
+    """
+    Normaliza os parâmetros de filtro para compor a chave de cache.
+
+    Valores vazios são descartados e as chaves são ordenadas, de modo que
+    requisições equivalentes compartilhem a mesma entrada.
+
+    Args:
+        filters (dict): Parâmetros de filtro aplicados à consulta.
+
+    Returns:
+        str: Representação estável dos filtros.
+    """
+    normalized = {
+        str(key): str(value).strip()
+        for key, value in (filters or {}).items()
+        if value not in (None, "") and str(value).strip()
+    }
+    return json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+
+
+def count_cache_key(queryset, filters=None, approximate=False):
+    """
+    Retorna a chave de cache da contagem para o modelo da consulta e os
+    filtros (sem a versão de dados, usada como carimbo).
+    """
+    digest = hashlib.sha1(
+        normalize_filters(filters).encode("utf-8")
+    ).hexdigest()
+    return f"{COUNT_KEY_PREFIX}:{queryset.model._meta.label_lower}:{digest}"
+
+
+def count_stamp(queryset, filters=None, approximate=False):
+    """Carimbo da contagem: a versão de dados do modelo da consulta."""
+    return f"v{get_version(queryset.model)}"
+
+
+def estimate_count(model, using="default"):
+    """
+    Retorna a quantidade estimada de linhas da tabela do modelo, a partir
+    das estatísticas do banco de dados, sem percorrer a tabela.
+
+    Returns:
+        int | None: Estimativa, ou None se o banco não oferecer estatísticas.
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+
+    if connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+        params = [table]
+    elif connection.vendor == "mysql":
+        sql = (
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s"
+        )
+        params = [table]
+    else:
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+@cached_computation(
+    key_func=count_cache_key,
+    timeout=lambda: getattr(settings, "LIST_COUNT_CACHE_TIMEOUT", 300),
+    stamp_func=count_stamp,
+)
+def cached_count(queryset, filters=None, approximate=False):
+    """
+    Retorna a quantidade de registros da consulta, usando o cache.
+
+    Args:
+        queryset (QuerySet): Consulta já filtrada.
+        filters (dict): Parâmetros de filtro que deram origem à consulta.
+        approximate (bool): Permite contagem aproximada quando não há
+            filtros e a tabela excede ``LIST_COUNT_APPROXIMATE_THRESHOLD``.
+
+    Returns:
+        tuple: (contagem, indicador de contagem aproximada).
+    """
+    model = queryset.model
+    result = None
+    if approximate and normalize_filters(filters) == "{}":
+        estimate = estimate_count(model, using=queryset.db)
+        threshold = getattr(
+            settings, "LIST_COUNT_APPROXIMATE_THRESHOLD", 100000
+        )
+        if estimate is not None and estimate >= threshold:
+            result = (estimate, True)
+
+    if result is None:
+        result = (queryset.count(), False)
+    return result
@@ -0,0 +1,161 @@
+# apps/utils/dimensions.py
+
+"""
+Cache local (por processo) de tabelas pequenas e pouco alteradas.
+
+Certificadores, Certificações e Centros de Provas são exibidos em quase
+todas as listagens e campos de seleção, mas mudam raramente. Uma
+``Dimension`` mantém em memória todos os registros de um desses modelos
+(chave primária -> registro compacto, com ``__slots__``), de modo que
+nomes e rótulos sejam resolvidos sem JOIN nem consultas extras.
+
+A sincronização entre processos usa a versão de dados do modelo
+(``cache_versions``) no cache compartilhado: a versão é verificada no
+máximo uma vez por requisição e, se tiver mudado, a tabela é recarregada
+por inteiro com uma única consulta.
+"""
+
+import threading
+
+from django.core.exceptions import ValidationError
+
+from .cache_versions import get_version
+
+
+class DimensionRecord:
+    """
+    Registro compacto de uma dimensão.
+
+    Os atributos são as colunas da dimensão (a primeira é a chave
+    primária); o registro também pode ser desempacotado ou indexado como a
+    tupla de ``values_list`` das mesmas colunas.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    @property
+    def pk(self):
+        return getattr(self, self.__slots__[0])
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self.__slots__)
+
+    def __getitem__(self, index):
+        return getattr(self, self.__slots__[index])
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({values})"
+
+
+class Dimension:
+    """
+    Tabela de um modelo mantida em memória no processo.
+
+    Args:
+        model (Model): Modelo da dimensão.
+        values (tuple): Colunas carregadas; a primeira é a chave primária.
+        ordering (tuple): Ordenação dos registros em ``all()``.
+    """
+
+    def __init__(self, model, values, ordering=("pk",)):
+        self.model = model
+        self.values = tuple(values)
+        self.ordering = tuple(ordering)
+        self.record_class = type(
+            f"{model.__name__}Record",
+            (DimensionRecord,),
+            {"__slots__": self.values},
+        )
+        self._records = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Dimension: {self.model._meta.label}>"
+
+    def current_version(self, request=None):
+        """
+        Versão de dados do modelo, lida do cache compartilhado no máximo
+        uma vez por requisição.
+        """
+        if request is None:
+            return get_version(self.model)
+        versions = request.__dict__.setdefault("_dimension_versions", {})
+        label = self.model._meta.label_lower
+        if label not in versions:
+            versions[label] = get_version(self.model)
+        return versions[label]
+
+    def load(self, version):
+        """Recarrega todos os registros com uma única consulta."""
+        rows = self.model._default_manager.order_by(
+            *self.ordering
+        ).values_list(*self.values)
+        self._records = {row[0]: self.record_class(*row) for row in rows}
+        self._version = version
+
+    def records(self, request=None):
+        """
+        Registros da dimensão (chave primária -> registro), recarregados se
+        a versão de dados tiver mudado.
+
+        Args:
+            request (HttpRequest): Requisição atual; limita a verificação da
+                versão a uma vez por requisição.
+
+        Returns:
+            dict: Registros, na ordem de ``ordering``.
+        """
+        version = self.current_version(request)
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self.load(version)
+        return self._records
+
+    def all(self, request=None):
+        """Lista de registros, na ordem de ``ordering``."""
+        return list(self.records(request).values())
+
+    def get(self, pk, request=None):
+        """
+        Registro pela chave primária (aceita o valor recebido no
+        ``request.GET``).
+
+        Returns:
+            DimensionRecord | None: Registro, ou None se não existir.
+        """
+        try:
+            pk = self.model._meta.pk.to_python(pk)
+        except ValidationError:
+            return None
+        return self.records(request).get(pk)
+
+    def selected_option(self, request, value, label):
+        """
+        Opção selecionada de um campo de filtro, sem consultar o banco.
+
+        Args:
+            request (HttpRequest): Requisição atual.
+            value (str): Valor selecionado (``request.GET``).
+            label (callable): Monta o rótulo a partir do registro.
+
+        Returns:
+            list: [(valor, rótulo)] ou lista vazia.
+        """
+        if not value:
+            return []
+        record = self.get(value, request)
+        if record is None:
+            return []
+        return [(str(record.pk), label(record))]
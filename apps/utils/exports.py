@@ -0,0 +1,132 @@
+# apps/utils/exports.py
+
+"""
+Exportação de listagens em CSV ou JSON Lines, transmitida em fluxo.
+
+As linhas são lidas em blocos de ``chunk_size`` registros, cada bloco com
+uma consulta por cursor (keyset, ver ``CursorPaginator``) sobre uma
+projeção ``values_list`` (tuplas simples, sem instanciar modelos), e
+escritas uma a uma em um ``StreamingHttpResponse``. Ao contrário de
+``QuerySet.iterator()``, que no MySQL (MySQLdb) recebe o resultado inteiro
+no cliente, cada consulta traz apenas um bloco: o consumo de memória do
+servidor não depende da quantidade de registros exportados.
+"""
+
+import csv
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .pagination import CursorPaginator
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "jsonl": ("application/x-ndjson; charset=utf-8", "jsonl"),
+}
+DEFAULT_EXPORT_FORMAT = "csv"
+
+
+class Echo:
+    """Buffer que devolve o texto escrito, usado pelo ``csv.writer``."""
+
+    def write(self, value):
+        return value
+
+
+def csv_value(value):
+    """Formata um valor para o CSV (datas no fuso horário local)."""
+    if isinstance(value, datetime):
+        return timezone.localtime(value).strftime("%d/%m/%Y %H:%M")
+    if isinstance(value, bool):
+        return "Sim" if value else "Não"
+    return value
+
+
+def keyset_rows(queryset, ordering, descending, chunk_size):
+    """
+    Lê a consulta em blocos de ``chunk_size`` registros, cada bloco a
+    partir da chave de ordenação do último registro lido.
+    """
+    paginator = CursorPaginator(
+        queryset, ordering=ordering, per_page=chunk_size, descending=descending
+    )
+    cursor = None
+    while True:
+        page = paginator.get_page(cursor)
+        yield from page
+        if not page.has_next():
+            return
+        cursor = page.next_cursor
+
+
+def csv_rows(rows, columns):
+    """Gera as linhas do CSV, a começar pelo cabeçalho."""
+    writer = csv.writer(Echo())
+    # BOM para que planilhas reconheçam a codificação UTF-8
+    yield "\ufeff" + writer.writerow([label for _, label in columns])
+    for row in rows:
+        yield writer.writerow(
+            [csv_value(value) for value in row[:len(columns)]]
+        )
+
+
+def jsonl_rows(rows, columns):
+    """Gera um objeto JSON por linha, com os campos como chaves."""
+    fields = [field for field, _ in columns]
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(fields, row))) + "\n"
+
+
+def export_response(queryset, columns, export_format, filename,
+                    ordering=("pk",), descending=False,
+                    chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Exporta uma consulta em CSV ou JSON Lines.
+
+    Args:
+        queryset (QuerySet): Consulta já filtrada (sem ordenação).
+        columns (list): Colunas exportadas, como (campo do ORM, rótulo).
+            O rótulo é o cabeçalho do CSV; o campo é a chave no JSON.
+        export_format (str): "csv" ou "jsonl" (ver ``EXPORT_FORMATS``).
+        filename (str): Nome do arquivo, sem extensão.
+        ordering (tuple): Campos da chave de ordenação, usada para ler os
+            blocos; o último campo deve ser único, ex.: ("date", "id").
+        descending (bool): Ordenação decrescente.
+        chunk_size (int): Registros lidos do banco por consulta.
+
+    Returns:
+        StreamingHttpResponse: Arquivo transmitido em fluxo.
+
+    Raises:
+        ValueError: Se o formato não for suportado.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportação inválido: {export_format}")
+    content_type, extension = EXPORT_FORMATS[export_format]
+
+    # Os campos da chave de ordenação são lidos junto das colunas (ao fim
+    # de cada linha, fora do arquivo) para posicionar o bloco seguinte
+    fields = [field for field, _ in columns]
+    fields += [field for field in ordering if field not in fields]
+    rows = keyset_rows(
+        queryset.values_list(*fields, named=True),
+        ordering,
+        descending,
+        chunk_size,
+    )
+    rows = (
+        csv_rows(rows, columns)
+        if export_format == "csv"
+        else jsonl_rows(rows, columns)
+    )
+
+    response = StreamingHttpResponse(rows, content_type=content_type)
+    response["Content-Disposition"] = (
+        f'attachment; filename="{filename}.{extension}"'
+    )
+    return response
@@ -0,0 +1,215 @@
+# apps/utils/guardrails.py
+
+"""
+Limites de consumo por requisição.
+
+Uma única requisição não deve ocupar um worker indefinidamente nem
+materializar resultados arbitrariamente grandes. Os limites são:
+
+- tamanho máximo de página das listagens (``LIST_MAX_RECORDS_PER_PAGE``),
+  aplicado pelo ``ListSpec``;
+- quantidade de consultas SQL por requisição (``REQUEST_QUERY_BUDGET``);
+- tempo total gasto em consultas SQL por requisição
+  (``REQUEST_SQL_TIME_BUDGET``, em segundos);
+- tempo máximo de cada consulta (``DB_STATEMENT_TIMEOUT``, em
+  milissegundos): no MySQL, pela dica ``MAX_EXECUTION_TIME`` nas consultas
+  SELECT; no SQLite, interrompendo a consulta pelo ``progress_handler``.
+
+Os limites de consultas são aplicados pelo ``QueryBudgetMiddleware``
+(``venturix_testCenter/middleware.py``) apenas durante a view; views
+marcadas com ``guardrails_exempt`` (ex.: importações) não são limitadas.
+Um valor 0 desativa o limite correspondente. Toda violação é registrada no
+log com o nome da view.
+"""
+
+import logging
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import OperationalError, connections
+
+logger = logging.getLogger(__name__)
+
+# Intervalo (em instruções da máquina virtual do SQLite) entre as
+# verificações do tempo da consulta
+SQLITE_PROGRESS_STEPS = 10000
+
+SELECT_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+
+class GuardrailViolation(Exception):
+    """
+    Limite de consumo excedido durante uma requisição.
+
+    Args:
+        guardrail (str): Limite excedido, ex.: "query_count".
+        detail (str): Descrição para o log.
+    """
+
+    def __init__(self, guardrail, detail):
+        super().__init__(f"{guardrail}: {detail}")
+        self.guardrail = guardrail
+        self.detail = detail
+
+
+def view_name(request):
+    """Nome da view da requisição (ou o caminho, se não resolvida)."""
+    match = getattr(request, "resolver_match", None)
+    if match is not None:
+        return match.view_name or match._func_path
+    return request.path
+
+
+def log_violation(request, guardrail, detail):
+    """Registra no log uma violação de limite."""
+    logger.warning(
+        "Limite '%s' excedido em %s (%s %s): %s",
+        guardrail,
+        view_name(request),
+        request.method,
+        request.get_full_path(),
+        detail,
+    )
+
+
+def guardrails_exempt(view_func):
+    """Marca uma view como isenta dos limites de consultas SQL."""
+
+    @wraps(view_func)
+    def wrapped_view(*args, **kwargs):
+        return view_func(*args, **kwargs)
+
+    wrapped_view.guardrails_exempt = True
+    return wrapped_view
+
+
+def clamp_per_page(request, per_page, maximum):
+    """
+    Limita o tamanho de página solicitado, registrando o excesso no log.
+
+    Args:
+        request (HttpRequest): Requisição da listagem.
+        per_page (int): Registros por página solicitados.
+        maximum (int): Limite (0 desativa).
+
+    Returns:
+        int: Registros por página aplicados.
+    """
+    if maximum and per_page > maximum:
+        log_violation(
+            request,
+            "records_per_page",
+            f"{per_page} solicitados, limitado a {maximum}",
+        )
+        return maximum
+    return per_page
+
+
+@contextmanager
+def sqlite_deadline(connection, seconds):
+    """Interrompe a consulta do SQLite que ultrapassar o tempo indicado."""
+    raw_connection = connection.connection
+    deadline = time.monotonic() + seconds
+    raw_connection.set_progress_handler(
+        lambda: time.monotonic() > deadline, SQLITE_PROGRESS_STEPS
+    )
+    try:
+        yield
+    finally:
+        raw_connection.set_progress_handler(None, 0)
+
+
+class QueryBudget:
+    """
+    Limites de consultas SQL de uma requisição, aplicados como
+    ``execute_wrapper`` em todas as conexões.
+
+    Args:
+        max_queries (int): Quantidade máxima de consultas (0 desativa).
+        time_budget (float): Tempo máximo total em consultas, em segundos
+            (0 desativa).
+        statement_timeout (int): Tempo máximo de cada consulta, em
+            milissegundos (0 desativa).
+    """
+
+    def __init__(self, max_queries, time_budget, statement_timeout):
+        self.max_queries = max_queries
+        self.time_budget = time_budget
+        self.statement_timeout = statement_timeout
+        self.enabled = True
+        self.queries = 0
+        self.elapsed = 0.0
+
+    @classmethod
+    def from_settings(cls):
+        return cls(
+            max_queries=settings.REQUEST_QUERY_BUDGET,
+            time_budget=settings.REQUEST_SQL_TIME_BUDGET,
+            statement_timeout=settings.DB_STATEMENT_TIMEOUT,
+        )
+
+    @contextmanager
+    def activate(self):
+        """Aplica os limites às conexões de todos os bancos de dados."""
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    def timeout(self):
+        """
+        Tempo máximo (em segundos) da próxima consulta: o menor entre o
+        limite por consulta e o que resta do limite da requisição.
+        """
+        limits = []
+        if self.statement_timeout:
+            limits.append(self.statement_timeout / 1000)
+        if self.time_budget:
+            limits.append(self.time_budget - self.elapsed)
+        return min(limits) if limits else None
+
+    def __call__(self, execute, sql, params, many, context):
+        if not self.enabled:
+            return execute(sql, params, many, context)
+
+        if self.max_queries and self.queries >= self.max_queries:
+            raise GuardrailViolation(
+                "query_count", f"mais de {self.max_queries} consultas SQL"
+            )
+        timeout = self.timeout()
+        if timeout is not None and timeout <= 0:
+            raise GuardrailViolation(
+                "query_time",
+                f"mais de {self.time_budget}s em consultas SQL",
+            )
+
+        connection = context["connection"]
+        self.queries += 1
+        start = time.monotonic()
+        try:
+            if timeout is None:
+                return execute(sql, params, many, context)
+            if connection.vendor == "mysql" and SELECT_RE.match(sql):
+                milliseconds = max(int(timeout * 1000), 1)
+                sql = SELECT_RE.sub(
+                    f"SELECT /*+ MAX_EXECUTION_TIME({milliseconds}) */",
+                    sql,
+                    count=1,
+                )
+                return execute(sql, params, many, context)
+            if connection.vendor == "sqlite":
+                with sqlite_deadline(connection, timeout):
+                    return execute(sql, params, many, context)
+            return execute(sql, params, many, context)
+        except OperationalError as e:
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise GuardrailViolation(
+                    "statement_timeout",
+                    f"consulta interrompida após {timeout:.2f}s",
+                ) from e
+            raise
+        finally:
+            self.elapsed += time.monotonic() - start
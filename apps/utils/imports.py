@@ -0,0 +1,84 @@
+# apps/utils/imports.py
+
+"""
+Utilitários comuns às importações em massa de arquivos CSV.
+"""
+
+from django.core.exceptions import ValidationError
+
+# Quantidade máxima de erros guardados no relatório (os demais são apenas
+# contados)
+MAX_REPORTED_ERRORS = 500
+
+BOOLEAN_VALUES = {
+    "": False,
+    "0": False,
+    "false": False,
+    "não": False,
+    "nao": False,
+    "n": False,
+    "1": True,
+    "true": True,
+    "sim": True,
+    "s": True,
+}
+
+
+class ImportResult:
+    """Resultado de uma importação: registros gravados e erros por linha."""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.error_count = 0
+        self.errors = []
+
+    def add_error(self, line, message):
+        """Registra o erro de uma linha do arquivo."""
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+
+def parse_boolean(column, value):
+    """
+    Converte o valor de uma coluna booleana ("sim"/"não", "true"/"false",
+    "1"/"0" ou vazio).
+
+    Raises:
+        ValidationError: Se o valor não for reconhecido.
+    """
+    value = (value or "").strip().lower()
+    if value not in BOOLEAN_VALUES:
+        raise ValidationError(f"Valor inválido para '{column}': {value!r}.")
+    return BOOLEAN_VALUES[value]
+
+
+def normalize_header(reader, required):
+    """
+    Normaliza o cabeçalho de um ``csv.DictReader`` (minúsculas, sem
+    espaços) e confere as colunas obrigatórias.
+
+    Raises:
+        ValidationError: Se faltar alguma coluna obrigatória.
+    """
+    fieldnames = [
+        (name or "").strip().lower() for name in (reader.fieldnames or [])
+    ]
+    missing = [column for column in required if column not in fieldnames]
+    if missing:
+        raise ValidationError(
+            "O arquivo deve ter um cabeçalho com as colunas: "
+            + ", ".join(f"'{column}'" for column in missing) + "."
+        )
+    reader.fieldnames = fieldnames
+
+
+def error_message(error):
+    """Mensagem de um erro de validação, indicando a coluna quando houver."""
+    if hasattr(error, "error_dict"):
+        return " ".join(
+            f"{field}: {' '.join(messages)}"
+            for field, messages in error.message_dict.items()
+        )
+    return " ".join(error.messages)
@@ -0,0 +1,573 @@
+# apps/utils/list_engine.py
+
+"""
+Motor declarativo das listagens.
+
+Cada listagem é descrita por um ``ListSpec`` (filtros, chaves de ordenação,
+colunas e células das linhas). A cada requisição, o ``ListSpec`` compila os
+parâmetros do ``request.GET`` em uma única consulta, pagina o resultado e
+renderiza a página completa ou apenas a tabela (requisições AJAX).
+
+Quando o ``ListSpec`` declara ``values``, a consulta busca apenas essas
+colunas (``values_list(named=True)``) e as linhas são montadas a partir de
+tuplas nomeadas, sem instanciar os modelos nem carregar campos que a tabela
+não exibe (ex.: ``notes``).
+
+A ordenação segue um registro de chaves por listagem (``SortKey``): cada
+chave exibida nos cabeçalhos corresponde a campos indexados do ORM, e a
+chave primária é acrescentada como desempate sempre que os campos não
+forem únicos, para que a paginação não repita nem pule registros. Chaves
+desconhecidas ou sem índice no banco de dados são rejeitadas na definição
+do ``ListSpec``; na requisição, uma chave fora do registro é substituída
+pela ordenação padrão.
+
+O HTML da tabela devolvido às requisições AJAX fica em cache, com uma
+chave formada pela view, pelos parâmetros normalizados e pelas versões de
+dados (``cache_versions``) dos modelos exibidos: qualquer escrita nesses
+modelos invalida as tabelas em cache sem apagá-las uma a uma.
+"""
+
+import hashlib
+import json
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.db.models import Q
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .cache_versions import get_version
+from .guardrails import clamp_per_page
+from .pagination import CachedCountPaginator, CursorPaginator
+from .tables import TableRenderer
+
+DEFAULT_RECORDS_PER_PAGE = 20
+INVALID_RECORDS_PER_PAGE = 10
+
+TABLE_KEY_PREFIX = "list-table"
+TABLE_TEMPLATE = "includes/table.html"
+
+# Parâmetros que não alteram a tabela (ex.: anti-cache do jQuery)
+IGNORED_TABLE_PARAMS = {"_"}
+
+
+class ListFilter:
+    """
+    Filtro declarativo de uma listagem.
+
+    Args:
+        param (str): Nome do parâmetro no ``request.GET``.
+        field (str): Caminho do campo no ORM.
+    """
+
+    def __init__(self, param, field):
+        self.param = param
+        self.field = field
+
+    def to_q(self, value):
+        """
+        Converte o valor recebido em uma condição ``Q``.
+
+        Returns:
+            Q | None: Condição, ou None se o valor não deve filtrar.
+        """
+        raise NotImplementedError
+
+
+class ExactFilter(ListFilter):
+    """Filtro por igualdade, ex.: ``certifier__id=valor``."""
+
+    def to_q(self, value):
+        return Q(**{self.field: value})
+
+
+class BooleanFilter(ListFilter):
+    """Filtro booleano com os valores "True"/"False"."""
+
+    def to_q(self, value):
+        if value not in ["True", "False"]:
+            return None
+        return Q(**{self.field: value == "True"})
+
+
+class SearchFilter(ListFilter):
+    """
+    Busca textual em um ou mais campos (``icontains``), combinados com OR.
+
+    Args:
+        param (str): Nome do parâmetro no ``request.GET``.
+        fields (list): Campos pesquisados.
+    """
+
+    def __init__(self, param, fields):
+        super().__init__(param, fields[0])
+        self.fields = list(fields)
+
+    def to_q(self, value):
+        condition = Q()
+        for field in self.fields:
+            condition |= Q(**{f"{field}__icontains": value})
+        return condition
+
+
+class DateRangeFilter(ListFilter):
+    """
+    Filtro por período no formato "dd/mm/aaaa - dd/mm/aaaa".
+
+    O dia final é incluído por completo.
+    """
+
+    date_format = "%d/%m/%Y"
+
+    def to_q(self, value):
+        try:
+            start_date, end_date = value.split(" - ")
+            start_date = datetime.strptime(
+                start_date.strip(), self.date_format
+            ).date()
+            end_date = datetime.strptime(
+                end_date.strip(), self.date_format
+            ).date()
+        except (ValueError, TypeError):
+            return None
+        end_date += timedelta(days=1)  # Inclui o final do dia
+        return Q(**{
+            f"{self.field}__range": [
+                timezone.make_aware(datetime.combine(start_date, time.min)),
+                timezone.make_aware(datetime.combine(end_date, time.min)),
+            ]
+        })
+
+
+def resolve_field(model, path):
+    """
+    Resolve um caminho do ORM (possivelmente através de relações).
+
+    Args:
+        model (Model): Modelo de origem.
+        path (str): Caminho do campo no ORM, ex.: "client__name".
+
+    Returns:
+        tuple: (modelo do campo, campo).
+
+    Raises:
+        FieldDoesNotExist: Se o caminho não existir.
+    """
+    *relations, name = path.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+        if model is None:
+            raise FieldDoesNotExist(path)
+    return model, model._meta.get_field(name)
+
+
+def is_indexed(model, path):
+    """
+    Indica se o campo (possivelmente através de relações) é indexado no
+    banco de dados.
+
+    Raises:
+        FieldDoesNotExist: Se o caminho não existir.
+    """
+    model, field = resolve_field(model, path)
+    if field.primary_key or field.unique or field.db_index:
+        return True
+    return any(
+        index.fields and index.fields[0].lstrip("-") == field.name
+        for index in model._meta.indexes
+    )
+
+
+def related_models(model, path):
+    """
+    Retorna os modelos percorridos por um caminho do ORM, ex.:
+    "client__name" a partir de um Exame -> [Client].
+    """
+    models = []
+    for relation in path.split("__")[:-1]:
+        try:
+            model = model._meta.get_field(relation).related_model
+        except FieldDoesNotExist:
+            break
+        if model is None:
+            break
+        models.append(model)
+    return models
+
+
+def is_unique(model, path):
+    """
+    Indica se o campo identifica um único registro do modelo de origem
+    (chave primária ou campo único, sem atravessar relações).
+    """
+    if path == "pk":
+        return True
+    if "__" in path:
+        return False
+    field = model._meta.get_field(path)
+    return field.primary_key or (field.unique and not field.null)
+
+
+class SortKey:
+    """
+    Chave de ordenação de uma listagem.
+
+    Args:
+        key (str): Chave exibida nos cabeçalhos e recebida em ``order_by``.
+        fields (tuple): Campos do ORM ordenados, em sequência; por padrão,
+            a própria chave. O primeiro campo deve ser indexado.
+    """
+
+    def __init__(self, key, fields=None):
+        self.key = key
+        self.fields = tuple(fields or (key,))
+
+    def ordering(self, model, descending=False):
+        """
+        Expressões de ``order_by`` da chave, com a chave primária como
+        desempate quando o último campo não for único.
+        """
+        fields = list(self.fields)
+        if not is_unique(model, fields[-1]):
+            fields.append("pk")
+        return [f"-{field}" if descending else field for field in fields]
+
+
+class ListQuery:
+    """Consulta compilada de uma requisição de listagem."""
+
+    def __init__(self, queryset, filters, order_by, descending, per_page,
+                 cursor_mode):
+        self.queryset = queryset
+        self.filters = filters
+        self.order_by = order_by
+        self.descending = descending
+        self.per_page = per_page
+        self.cursor_mode = cursor_mode
+
+
+class ListSpec:
+    """
+    Especificação declarativa de uma listagem.
+
+    Args:
+        model (Model): Modelo listado.
+        filters (list): Filtros (``ListFilter``) aceitos.
+        sort_keys (list): Chaves aceitas em ``order_by`` (``SortKey``, ou
+            o nome de um campo indexado).
+        default_sort (str): Ordenação padrão (uma das ``sort_keys``).
+        columns (list): Cabeçalhos da tabela (``{"field", "label"}``).
+        cells (list): Células de cada linha (``apps/utils/tables.py``), na
+            ordem dos cabeçalhos.
+        values (tuple): Projeção das colunas buscadas (caminhos do ORM,
+            incluindo relações, ex.: "client__name"). Quando informada,
+            as células recebem tuplas nomeadas em vez de instâncias do modelo.
+        select_related (tuple): Relações carregadas na mesma consulta
+            (apenas sem ``values``).
+        cursor_ordering (tuple): Chave da paginação por cursor; quando
+            informada, habilita ``?pagination=cursor``.
+        approximate_count (bool): Permite contagem aproximada sem filtros.
+
+    Raises:
+        ImproperlyConfigured: Se alguma chave de ordenação for desconhecida
+            ou não indexada, ou se alguma coluna for desconhecida.
+    """
+
+    def __init__(self, model, *, filters, sort_keys, default_sort, columns,
+                 cells, values=None, select_related=(), cursor_ordering=None,
+                 approximate_count=False):
+        self.model = model
+        self.filters = list(filters)
+        self.sort_keys = {}
+        for sort_key in sort_keys:
+            if isinstance(sort_key, str):
+                sort_key = SortKey(sort_key)
+            self.sort_keys[sort_key.key] = sort_key
+        self.default_sort = default_sort
+        self.columns = list(columns)
+        self.table = TableRenderer(cells)
+        self.select_related = tuple(select_related)
+        self.cursor_ordering = cursor_ordering
+        self.values = None
+        if values is not None:
+            # A chave do cursor precisa estar presente em cada linha
+            self.values = tuple(values) + tuple(
+                field for field in (cursor_ordering or ())
+                if field not in values
+            )
+        self.approximate_count = approximate_count
+        self._validate()
+
+    def _validate(self):
+        """
+        Rejeita chaves de ordenação desconhecidas ou não indexadas e
+        colunas que não correspondem a campos do modelo.
+        """
+        label = self.model._meta.label
+        if self.default_sort not in self.sort_keys:
+            raise ImproperlyConfigured(
+                f"{label}: ordenação padrão '{self.default_sort}' não está "
+                f"entre as chaves de ordenação."
+            )
+        for key, sort_key in self.sort_keys.items():
+            try:
+                indexed = is_indexed(self.model, sort_key.fields[0])
+                for field in sort_key.fields[1:]:
+                    resolve_field(self.model, field)
+            except FieldDoesNotExist as e:
+                raise ImproperlyConfigured(
+                    f"{label}: chave de ordenação desconhecida '{key}'."
+                ) from e
+            if not indexed:
+                raise ImproperlyConfigured(
+                    f"{label}: chave de ordenação '{key}' não é indexada."
+                )
+        for column in self.columns:
+            try:
+                resolve_field(self.model, column["field"])
+            except FieldDoesNotExist as e:
+                raise ImproperlyConfigured(
+                    f"{label}: coluna desconhecida '{column['field']}'."
+                ) from e
+
+    def depends_on(self):
+        """
+        Modelos cujos dados aparecem na listagem: o modelo listado, os
+        modelos relacionados da projeção e das chaves de ordenação e os
+        modelos lidos pelas células (dimensões).
+        """
+        models = [self.model]
+        for model in self.table.depends_on():
+            if model not in models:
+                models.append(model)
+        paths = [
+            *(self.values or ()),
+            *(
+                field
+                for sort_key in self.sort_keys.values()
+                for field in sort_key.fields
+            ),
+            *self.select_related,
+        ]
+        for path in paths:
+            for model in related_models(self.model, path):
+                if model not in models:
+                    models.append(model)
+        return models
+
+    def headers(self, cursor_mode=False):
+        """
+        Cabeçalhos da tabela, indicando quais colunas são ordenáveis.
+
+        Na paginação por cursor a ordem é a de ``cursor_ordering``, então
+        nenhuma coluna é ordenável.
+        """
+        return [
+            {
+                **column,
+                "sortable": (
+                    not cursor_mode and column["field"] in self.sort_keys
+                ),
+            }
+            for column in self.columns
+        ]
+
+    def compile(self, request, max_per_page=None):
+        """
+        Compila os parâmetros da requisição em uma única consulta.
+
+        Args:
+            request (HttpRequest): Requisição da listagem.
+            max_per_page (int): Limite de registros por página; por padrão,
+                ``LIST_MAX_RECORDS_PER_PAGE``.
+
+        Returns:
+            ListQuery: Consulta filtrada e ordenada, e os parâmetros usados.
+        """
+        list_query = self.compile_params(request.GET)
+        if max_per_page is None:
+            max_per_page = settings.LIST_MAX_RECORDS_PER_PAGE
+        list_query.per_page = clamp_per_page(
+            request, list_query.per_page, max_per_page
+        )
+        return list_query
+
+    def compile_params(self, params):
+        """
+        Compila parâmetros no formato do ``request.GET`` em uma consulta.
+
+        Args:
+            params (QueryDict | dict): Parâmetros da listagem.
+
+        Returns:
+            ListQuery: Consulta filtrada e ordenada, e os parâmetros usados.
+        """
+        # Filtragem
+        queryset = self.model.objects.all()
+        if self.values is None and self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        filters = {}
+        for list_filter in self.filters:
+            value = params.get(list_filter.param)
+            if not value:
+                continue
+            q = list_filter.to_q(value)
+            if q is None:
+                continue
+            try:
+                queryset = queryset.filter(q)
+            except (ValueError, TypeError, ValidationError):
+                # Valor incompatível com o campo (ex.: texto em um ID)
+                continue
+            filters[list_filter.param] = value
+
+        # Ordenação
+        cursor_mode = (
+            self.cursor_ordering is not None
+            and params.get("pagination") == "cursor"
+        )
+        order_by = params.get("order_by", self.default_sort)
+        if order_by not in self.sort_keys:
+            order_by = self.default_sort
+        descending = params.get("descending", "False") == "True"
+        if not cursor_mode:
+            queryset = queryset.order_by(
+                *self.sort_keys[order_by].ordering(self.model, descending)
+            )
+
+        # Projeção das colunas exibidas
+        if self.values is not None:
+            queryset = queryset.values_list(*self.values, named=True)
+
+        # Registros por Página
+        per_page = params.get("records_per_page", DEFAULT_RECORDS_PER_PAGE)
+        try:
+            per_page = int(per_page)
+        except (ValueError, TypeError):
+            per_page = INVALID_RECORDS_PER_PAGE
+        if per_page < 1:
+            per_page = INVALID_RECORDS_PER_PAGE
+
+        return ListQuery(
+            queryset=queryset,
+            filters=filters,
+            order_by=order_by,
+            descending=descending,
+            per_page=per_page,
+            cursor_mode=cursor_mode,
+        )
+
+    def paginate(self, request, list_query):
+        """
+        Pagina a consulta compilada (por cursor ou por página).
+
+        Returns:
+            Page | CursorPage: Página solicitada.
+        """
+        if list_query.cursor_mode:
+            paginator = CursorPaginator(
+                list_query.queryset,
+                ordering=self.cursor_ordering,
+                per_page=list_query.per_page,
+                descending=list_query.descending,
+            )
+            return paginator.get_page(request.GET.get("cursor"))
+
+        # Paginação (contagem de registros em cache)
+        paginator = CachedCountPaginator(
+            list_query.queryset,
+            list_query.per_page,
+            filters=list_query.filters,
+            approximate=self.approximate_count,
+        )
+        return paginator.get_page(request.GET.get("page"))
+
+
+def table_cache_key(request, spec):
+    """
+    Chave de cache da tabela de uma listagem.
+
+    Formada pela view, pelas versões de dados dos modelos exibidos e pelos
+    parâmetros da requisição normalizados (ordenados, sem valores vazios).
+    """
+    params = sorted(
+        (key, sorted(value for value in values if value.strip()))
+        for key, values in request.GET.lists()
+        if key not in IGNORED_TABLE_PARAMS
+    )
+    digest = hashlib.sha1(
+        json.dumps(
+            [(key, values) for key, values in params if values],
+            separators=(",", ":"),
+        ).encode("utf-8")
+    ).hexdigest()
+    view_name = (
+        request.resolver_match.view_name
+        if request.resolver_match
+        else request.path
+    )
+    versions = ".".join(
+        str(get_version(model)) for model in spec.depends_on()
+    )
+    return f"{TABLE_KEY_PREFIX}:{view_name}:v{versions}:{digest}"
+
+
+def list_context(request, spec, context=None):
+    """Compila, pagina e monta o contexto de uma listagem."""
+    list_query = spec.compile(request)
+    page_obj = spec.paginate(request, list_query)
+
+    return {
+        **(context or {}),
+        "page_obj": page_obj,
+        "cursor_mode": list_query.cursor_mode,
+        "query_params": request.GET.urlencode(),
+        "headers": spec.headers(list_query.cursor_mode),
+        "rows_html": spec.table.render(page_obj, request),
+    }
+
+
+def render_list(request, spec, template_name, context=None):
+    """
+    Renderiza uma listagem descrita por um ``ListSpec``.
+
+    Requisições AJAX recebem apenas a tabela (``includes/table.html``),
+    servida do cache enquanto os dados exibidos não mudarem.
+
+    Args:
+        request (HttpRequest): Requisição da listagem.
+        spec (ListSpec): Especificação da listagem.
+        template_name (str): Template da página completa.
+        context (dict): Contexto adicional (ex.: ``search_fields``).
+
+    Returns:
+        HttpResponse: Página ou tabela renderizada.
+    """
+    if request.headers.get("x-requested-with") == "XMLHttpRequest":
+        key = table_cache_key(request, spec)
+        html = cache.get(key)
+        if html is None:
+            html = render_to_string(
+                TABLE_TEMPLATE,
+                list_context(request, spec, context),
+                request,
+            )
+            cache.set(
+                key,
+                html,
+                getattr(settings, "LIST_TABLE_CACHE_TIMEOUT", 600),
+            )
+        return HttpResponse(html)
+
+    return render(
+        request, template_name, list_context(request, spec, context)
+    )
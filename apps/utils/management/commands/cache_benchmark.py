@@ -0,0 +1,107 @@
+# apps/utils/management/commands/cache_benchmark.py
+
+"""
+Comando para medir a latência dos caches configurados.
+
+Uso: ``python manage.py cache_benchmark [--aliases memcached default]``
+
+Compara, por padrão, o Memcached acessado diretamente (alias "memcached")
+com o cache em dois níveis (alias "default"), em leituras de chaves
+existentes (como as sessões), leituras de chaves ausentes e escritas.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import BaseCommand, CommandError
+
+BENCHMARK_KEY_PREFIX = "cache-benchmark"
+
+
+def measure(operation, iterations):
+    """
+    Executa a operação repetidamente.
+
+    Returns:
+        float: Tempo médio por operação, em microssegundos.
+    """
+    start = time.perf_counter()
+    for i in range(iterations):
+        operation(i)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+class Command(BaseCommand):
+    help = "Mede a latência de leitura e escrita dos caches configurados."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--aliases",
+            nargs="+",
+            default=["memcached", "default"],
+            help="Aliases do CACHES comparados.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=10000,
+            help="Quantidade de operações por medição.",
+        )
+        parser.add_argument(
+            "--keys",
+            type=int,
+            default=200,
+            help="Quantidade de chaves distintas lidas.",
+        )
+        parser.add_argument(
+            "--value-size",
+            type=int,
+            default=512,
+            help="Tamanho (em bytes) de cada valor.",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1 or options["keys"] < 1:
+            raise CommandError("--iterations e --keys devem ser positivos.")
+
+        iterations = options["iterations"]
+        keys = [
+            f"{BENCHMARK_KEY_PREFIX}:{i}" for i in range(options["keys"])
+        ]
+        missing_keys = [
+            f"{BENCHMARK_KEY_PREFIX}:missing:{i}" for i in range(iterations)
+        ]
+        value = {"data": "x" * options["value_size"]}
+
+        self.stdout.write(
+            f"{'cache':<12} {'get (µs)':>10} {'ausente (µs)':>13} "
+            f"{'set (µs)':>10} {'get/s':>10}"
+        )
+        for alias in options["aliases"]:
+            if alias not in settings.CACHES:
+                self.stderr.write(f"{alias:<12} não configurado.")
+                continue
+            cache = caches[alias]
+
+            try:
+                cache.set_many({key: value for key in keys})
+                get = measure(
+                    lambda i: cache.get(keys[i % len(keys)]), iterations
+                )
+                missing = measure(
+                    lambda i: cache.get(missing_keys[i]), iterations
+                )
+                set_ = measure(
+                    lambda i: cache.set(keys[i % len(keys)], value),
+                    iterations,
+                )
+                cache.delete_many(keys)
+            except Exception as e:
+                self.stderr.write(f"{alias:<12} indisponível: {e}")
+                continue
+
+            self.stdout.write(
+                f"{alias:<12} {get:>10.1f} {missing:>13.1f} "
+                f"{set_:>10.1f} {1_000_000 / get:>10.0f}"
+            )
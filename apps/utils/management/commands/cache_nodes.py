@@ -0,0 +1,77 @@
+# apps/utils/management/commands/cache_nodes.py
+
+"""
+Comando para verificar os servidores Memcached configurados.
+
+Uso: ``python manage.py cache_nodes [--alias memcached] [--keys 1000]``
+
+Para cada servidor de ``MEMCACHED_SERVERS``, informa se ele responde (uma
+escrita e uma leitura diretamente no servidor) e a fração das chaves que o
+hash consistente atribui a ele; servidores retirados da distribuição após
+falhas não recebem chaves. Pode ser usado com instâncias locais do
+Memcached em portas distintas para conferir a distribuição e a troca de
+servidor após uma falha.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import BaseCommand, CommandError
+
+PROBE_KEY = "cache-nodes:probe"
+
+
+class Command(BaseCommand):
+    help = "Verifica os servidores Memcached e a distribuição das chaves."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--alias",
+            default="memcached",
+            help="Alias do CACHES com os servidores Memcached.",
+        )
+        parser.add_argument(
+            "--keys",
+            type=int,
+            default=1000,
+            help="Quantidade de chaves usadas para medir a distribuição.",
+        )
+
+    def handle(self, *args, **options):
+        alias = options["alias"]
+        if alias not in settings.CACHES:
+            raise CommandError(
+                f"Cache não configurado: '{alias}' (MEMCACHED_SERVERS vazio?)."
+            )
+        if options["keys"] < 1:
+            raise CommandError("--keys deve ser positivo.")
+
+        cache = caches[alias]
+        client = getattr(cache, "_cache", None)
+        if client is None or not hasattr(client, "clients"):
+            raise CommandError(f"O cache '{alias}' não é um Memcached.")
+
+        # Situação de cada servidor
+        status = {}
+        for server, server_client in client.clients.items():
+            try:
+                server_client.set(PROBE_KEY, b"1", expire=10)
+                ok = server_client.get(PROBE_KEY) == b"1"
+                server_client.delete(PROBE_KEY)
+                status[server] = "ok" if ok else "resposta inválida"
+            except Exception as e:
+                status[server] = f"indisponível ({e})"
+
+        # Distribuição das chaves entre os servidores ativos
+        shares = dict.fromkeys(client.clients, 0)
+        for i in range(options["keys"]):
+            node = client.hasher.get_node(
+                cache.make_key(f"cache-nodes:{i}")
+            )
+            if node is not None:
+                shares[node] += 1
+
+        for server in client.clients:
+            share = shares[server] / options["keys"] * 100
+            self.stdout.write(
+                f"{server:<24} {share:>6.1f}% das chaves  {status[server]}"
+            )
@@ -0,0 +1,220 @@
+# apps/utils/object_cache.py
+
+"""
+Cache de leitura (read-through) dos registros das páginas de detalhe.
+
+Um ``ObjectCache`` declara os campos exibidos na página de detalhe de um
+modelo, inclusive os dos registros relacionados por chave estrangeira
+(ex.: ``client__name`` em um Exame). Os valores são carregados com uma
+única consulta (com JOIN) e guardados no cache sob a chave
+``detail:<modelo>:<pk>``, de modo que uma página acessada com frequência
+não consulta o banco de dados.
+
+A invalidação é precisa: a entrada guarda a versão (``cache_versions``)
+do próprio registro e de cada registro relacionado exibido, e é
+descartada na leitura se alguma delas tiver mudado. Os sinais de
+``post_save``/``post_delete`` (``signals.py``) renovam a versão apenas do
+registro alterado, então editar um Cliente invalida somente as páginas do
+próprio Cliente e dos Exames que o referenciam.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.http import Http404
+
+from .cache_versions import get_object_versions, object_version_key
+
+DETAIL_KEY_PREFIX = "detail"
+
+# Consultas de um registro na mesma leitura, quando os relacionados mudam
+# entre a leitura das versões e a consulta
+LOAD_ATTEMPTS = 2
+
+
+class DetailRecord:
+    """
+    Registro de uma página de detalhe, com acesso por atributo como a
+    instância do modelo (ex.: ``exam.client.name``, em Python ou nos
+    templates).
+    """
+
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.pk}>"
+
+
+class ObjectCache:
+    """
+    Cache dos registros exibidos na página de detalhe de um modelo.
+
+    Args:
+        model (Model): Modelo exibido.
+        fields (tuple): Campos exibidos; campos de um registro relacionado
+            usam ``<chave estrangeira>__<campo>`` (apenas um nível).
+        timeout (int): Tempo de vida das entradas, em segundos (padrão:
+            ``DETAIL_CACHE_TIMEOUT``).
+
+    Raises:
+        ImproperlyConfigured: Se um campo relacionado não partir de uma
+            chave estrangeira do modelo.
+    """
+
+    def __init__(self, model, fields, timeout=None):
+        self.model = model
+        self.fields = tuple(fields)
+        self.timeout = timeout
+
+        # Relação -> (coluna da chave estrangeira, modelo relacionado)
+        self.relations = {}
+        for path in self.fields:
+            name, _, attribute = path.partition("__")
+            if not attribute:
+                continue
+            field = model._meta.get_field(name)
+            if not field.many_to_one or "__" in attribute:
+                raise ImproperlyConfigured(
+                    f"{model._meta.label}: '{path}' deve ser um campo de "
+                    f"uma chave estrangeira do modelo."
+                )
+            self.relations[name] = (field.attname, field.related_model)
+
+        self.values = tuple(dict.fromkeys((
+            "pk",
+            *self.fields,
+            *(attname for attname, _ in self.relations.values()),
+        )))
+
+    def __repr__(self):
+        return f"<ObjectCache: {self.model._meta.label}>"
+
+    def key(self, pk):
+        """Retorna a chave de cache do registro."""
+        return f"{DETAIL_KEY_PREFIX}:{self.model._meta.label_lower}:{pk}"
+
+    def dependencies(self, values):
+        """
+        Chaves das versões dos registros exibidos: o próprio registro e os
+        relacionados.
+        """
+        keys = [object_version_key(self.model, values["pk"])]
+        for attname, related_model in self.relations.values():
+            if values[attname] is not None:
+                keys.append(object_version_key(related_model, values[attname]))
+        return keys
+
+    def load(self, pk):
+        """Carrega os valores do registro com uma única consulta."""
+        return self.model._default_manager.filter(pk=pk).values(
+            *self.values
+        ).first()
+
+    def fetch(self, pk):
+        """
+        Retorna a entrada do registro, do cache ou do banco de dados.
+
+        Args:
+            pk: Chave primária (aceita o valor recebido na URL).
+
+        Returns:
+            dict | None: ``{"values": ..., "versions": ...}``, ou None se o
+            registro não existir.
+        """
+        try:
+            pk = self.model._meta.pk.to_python(pk)
+        except ValidationError:
+            return None
+        key = self.key(pk)
+
+        entry = cache.get(key)
+        if entry is not None:
+            versions = entry["versions"]
+            if cache.get_many(list(versions)) == versions:
+                return entry
+
+        # As versões são lidas antes da consulta: uma escrita concorrente as
+        # renova e invalida a entrada gravada a seguir. Os registros
+        # relacionados só são conhecidos após a consulta; se forem outros
+        # que os da entrada anterior (ou se não houver entrada), a consulta
+        # é repetida com as versões deles já lidas.
+        if entry is not None:
+            keys = list(entry["versions"])
+        else:
+            keys = [object_version_key(self.model, pk)]
+        for _ in range(LOAD_ATTEMPTS):
+            versions = get_object_versions(keys)
+            values = self.load(pk)
+            if values is None:
+                return None
+            dependencies = self.dependencies(values)
+            if set(dependencies) <= set(versions):
+                break
+            keys = dependencies
+        else:
+            # Relacionados alterados entre as consultas: não guarda em cache
+            return {"values": values, "versions": {}}
+
+        entry = {
+            "values": values,
+            "versions": {key: versions[key] for key in dependencies},
+        }
+        if cache.get_many(dependencies) != entry["versions"]:
+            # Registro ou relacionado alterado durante a consulta
+            return entry
+        timeout = self.timeout
+        if timeout is None:
+            timeout = settings.DETAIL_CACHE_TIMEOUT
+        cache.set(key, entry, timeout=timeout)
+        return entry
+
+    def get_entry(self, request, pk):
+        """``fetch`` consultado uma única vez por requisição."""
+        entries = request.__dict__.setdefault("_object_cache", {})
+        key = (self.model._meta.label, str(pk))
+        if key not in entries:
+            entries[key] = self.fetch(pk)
+        return entries[key]
+
+    def get(self, request, pk):
+        """
+        Retorna o registro exibido na página de detalhe.
+
+        Args:
+            request (HttpRequest): Requisição atual.
+            pk: Chave primária do registro.
+
+        Returns:
+            DetailRecord | None: Registro com os campos de ``fields`` e os
+            relacionados como atributos (None se a chave estrangeira for
+            nula), ou None se o registro não existir.
+        """
+        entry = self.get_entry(request, pk)
+        if entry is None:
+            return None
+
+        values = dict(entry["values"])
+        for name, (attname, _) in self.relations.items():
+            prefix = f"{name}__"
+            related = {
+                field[len(prefix):]: values.pop(field)
+                for field in list(values)
+                if field.startswith(prefix)
+            }
+            related["pk"] = values[attname]
+            values[name] = (
+                DetailRecord(related) if values[attname] is not None else None
+            )
+        return DetailRecord(values)
+
+    def get_or_404(self, request, pk):
+        """
+        Como ``get``, mas levanta ``Http404`` se o registro não existir.
+        """
+        record = self.get(request, pk)
+        if record is None:
+            raise Http404(
+                f"Nenhum {self.model._meta.object_name} encontrado."
+            )
+        return record
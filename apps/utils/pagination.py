@@ -0,0 +1,235 @@
+# apps/utils/pagination.py
+
+"""
+Paginação das listagens.
+
+- ``CachedCountPaginator``: paginação por página (``OFFSET``) com a
+  contagem de registros em cache (ver ``counts.py``).
+- ``CursorPaginator``: paginação por cursor (keyset) para listagens
+  extensas. Não usa ``OFFSET`` nem ``COUNT(*)``: cada página é obtida a
+  partir da chave do último registro exibido, de modo que a página 500
+  custa o mesmo que a página 1. Os cursores trafegam como tokens opacos e
+  assinados.
+"""
+
+from django.core import signing
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+from .counts import cached_count
+
+CURSOR_SALT = "apps.utils.pagination.cursor"
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginador cuja contagem de registros vem do cache.
+
+    Args:
+        object_list (QuerySet): Consulta já filtrada e ordenada.
+        per_page (int): Registros por página.
+        filters (dict): Parâmetros de filtro que compõem a chave da contagem.
+        approximate (bool): Permite contagem aproximada para listagens sem
+            filtros sobre tabelas grandes.
+    """
+
+    def __init__(self, object_list, per_page, filters=None,
+                 approximate=False, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.filters = filters
+        self.approximate = approximate
+
+    @cached_property
+    def _cached_count(self):
+        """Par (contagem, aproximada?) obtido uma única vez por paginador."""
+        return cached_count(
+            self.object_list,
+            filters=self.filters,
+            approximate=self.approximate,
+        )
+
+    @cached_property
+    def count(self):
+        """Quantidade (possivelmente aproximada) de registros."""
+        return self._cached_count[0]
+
+    @property
+    def is_approximate(self):
+        """Indica se a contagem exibida é uma estimativa."""
+        return self._cached_count[1]
+
+
+def encode_cursor(values, direction):
+    """
+    Gera um token opaco a partir dos valores da chave de ordenação.
+
+    Args:
+        values (tuple): Valores da chave do registro de referência.
+        direction (str): "next" ou "previous".
+
+    Returns:
+        str: Token assinado, seguro para uso em query strings.
+    """
+    payload = [
+        direction,
+        [
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in values
+        ],
+    ]
+    return signing.dumps(payload, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(token):
+    """
+    Decodifica um token gerado por ``encode_cursor``.
+
+    Args:
+        token (str): Token recebido na query string.
+
+    Returns:
+        tuple: (direction, values) ou (None, None) se o token for inválido.
+    """
+    if not token:
+        return None, None
+    try:
+        direction, values = signing.loads(token, salt=CURSOR_SALT)
+    except (signing.BadSignature, TypeError, ValueError):
+        return None, None
+    if direction not in ("next", "previous"):
+        return None, None
+    return direction, values
+
+
+class CursorPage:
+    """
+    Página de resultados da paginação por cursor.
+
+    Expõe a mesma interface de iteração de ``Page`` e os tokens para a
+    página seguinte e anterior.
+    """
+
+    is_cursor = True
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        """Indica se existe uma página seguinte."""
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        """Indica se existe uma página anterior."""
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        """Indica se existe alguma outra página."""
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    Paginador por cursor sobre uma chave de ordenação única.
+
+    Args:
+        queryset (QuerySet): Consulta já filtrada (sem ordenação).
+        ordering (tuple): Campos da chave, ex.: ("date", "id"). O último
+            campo deve ser único para garantir uma ordem total.
+        per_page (int): Registros por página.
+        descending (bool): Ordenação decrescente.
+    """
+
+    def __init__(self, queryset, ordering, per_page, descending=False):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.descending = descending
+
+    def get_page(self, token=None):
+        """
+        Retorna a página indicada pelo token (ou a primeira página).
+
+        Tokens inválidos ou adulterados levam à primeira página.
+        """
+        direction, values = decode_cursor(token)
+        if values is not None and len(values) != len(self.ordering):
+            direction, values = None, None
+
+        backwards = direction == "previous"
+        reverse = self.descending != backwards
+
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(
+                self._keyset_filter(self._parse(values), reverse)
+            )
+        queryset = queryset.order_by(
+            *[f"-{field}" if reverse else field for field in self.ordering]
+        )
+
+        # Um registro a mais indica se há continuação nesta direção
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+
+        # Avançando, há página anterior se a página veio de um cursor; ao
+        # voltar, a página seguinte é sempre a de origem do cursor
+        if backwards:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_next:
+                next_cursor = encode_cursor(self._key(rows[-1]), "next")
+            if has_previous:
+                previous_cursor = encode_cursor(
+                    self._key(rows[0]), "previous"
+                )
+
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+    def _key(self, obj):
+        """Obtém os valores da chave de ordenação de um registro."""
+        return tuple(getattr(obj, field) for field in self.ordering)
+
+    def _parse(self, values):
+        """Converte os valores do token de volta aos tipos dos campos."""
+        parsed = []
+        for field, value in zip(self.ordering, values):
+            internal_type = (
+                self.queryset.model._meta.get_field(field).get_internal_type()
+            )
+            if internal_type == "DateTimeField" and isinstance(value, str):
+                value = parse_datetime(value)
+            parsed.append(value)
+        return parsed
+
+    def _keyset_filter(self, values, reverse):
+        """
+        Monta a condição "linha depois da chave" para ordenação composta,
+        ex.: (date > d) OR (date = d AND id > i).
+        """
+        lookup = "lt" if reverse else "gt"
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            term = Q(**{f"{field}__{lookup}": values[index]})
+            for previous_field, previous_value in zip(
+                self.ordering[:index], values[:index]
+            ):
+                term &= Q(**{previous_field: previous_value})
+            condition |= term
+        return condition
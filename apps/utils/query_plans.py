@@ -0,0 +1,116 @@
+# apps/utils/query_plans.py
+
+"""
+Inspeção do plano de execução de consultas (SQLite e MySQL).
+
+Usado pelos testes (``apps/testCenter/tests``) e pelas verificações do
+sistema (``manage.py check --database``) para garantir que as consultas das
+listagens continuem usando índices, e não voltem a percorrer a tabela
+inteira após alguma alteração.
+"""
+
+import re
+
+from django.db import connections
+
+# Índice citado no plano do SQLite (ex.: "SEARCH t USING INDEX idx (a=?)")
+SQLITE_INDEX_RE = re.compile(r"USING (?:COVERING )?INDEX (\S+)")
+
+
+def _explain(queryset):
+    """
+    Executa o EXPLAIN da consulta.
+
+    Returns:
+        tuple: (vendor, linhas do plano); no SQLite, as descrições de cada
+        passo; no MySQL, dicionários com as colunas do EXPLAIN.
+    """
+    connection = connections[queryset.db]
+    sql, params = queryset.query.sql_with_params()
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return "sqlite", [row[-1] for row in cursor.fetchall()]
+
+    if connection.vendor == "mysql":
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {sql}", params)
+            columns = [column[0].lower() for column in cursor.description]
+            return "mysql", [
+                dict(zip(columns, row)) for row in cursor.fetchall()
+            ]
+
+    return connection.vendor, None
+
+
+def full_scan_problems(queryset):
+    """
+    Executa o EXPLAIN da consulta e aponta leituras completas da tabela
+    principal ou ordenações fora de índice.
+
+    Args:
+        queryset (QuerySet): Consulta a ser analisada.
+
+    Returns:
+        list | None: Descrição dos problemas encontrados (vazia se o plano
+        usa índices), ou None se o banco não for suportado.
+    """
+    table = queryset.model._meta.db_table
+    vendor, plan = _explain(queryset)
+
+    if vendor == "sqlite":
+        problems = [
+            detail for detail in plan
+            if detail.startswith(f"SCAN {table}") and "USING" not in detail
+        ]
+        problems += [
+            detail for detail in plan
+            if "TEMP B-TREE FOR ORDER BY" in detail
+        ]
+        return problems
+
+    if vendor == "mysql":
+        problems = []
+        for row in plan:
+            if row.get("table") != table:
+                continue
+            if row.get("type") == "ALL":
+                problems.append(f"full scan em {table}")
+            if "Using filesort" in (row.get("extra") or ""):
+                problems.append(f"filesort em {table}")
+        return problems
+
+    return None
+
+
+def plan_indexes(queryset):
+    """
+    Executa o EXPLAIN da consulta e retorna os índices usados na tabela
+    principal.
+
+    Args:
+        queryset (QuerySet): Consulta a ser analisada.
+
+    Returns:
+        set | None: Nomes dos índices usados, ou None se o banco não for
+        suportado.
+    """
+    table = queryset.model._meta.db_table
+    vendor, plan = _explain(queryset)
+
+    if vendor == "sqlite":
+        return {
+            match.group(1)
+            for detail in plan
+            if detail.startswith((f"SCAN {table} ", f"SEARCH {table} "))
+            for match in SQLITE_INDEX_RE.finditer(detail)
+        }
+
+    if vendor == "mysql":
+        return {
+            row["key"] for row in plan
+            if row.get("table") == table and row.get("key")
+        }
+
+    return None
@@ -0,0 +1,55 @@
+# apps/utils/signals.py
+
+"""
+Receptores de sinais do app 'utils'.
+
+Mantém as versões de dados (``cache_versions``) dos modelos e dos
+registros do projeto sincronizadas com as escritas no banco de dados.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache_versions import bump_object_versions, bump_version
+
+
+def is_tracked(model):
+    """Indica se o modelo pertence a um dos apps do projeto."""
+    app_config = model._meta.app_config
+    return app_config is not None and app_config.name.startswith("apps.")
+
+
+def bump_versions_on_commit(model, pk, using):
+    """
+    Renova a versão do modelo e a do registro após o commit da transação,
+    para que outra requisição que leia os dados nesse intervalo não os
+    guarde em cache (contagens, tabelas, opções, dimensões ou páginas de
+    detalhe) com a versão nova.
+    """
+
+    def bump():
+        bump_version(model)
+        bump_object_versions(model, [pk])
+
+    transaction.on_commit(bump, using=using)
+
+
+@receiver(post_save, dispatch_uid="utils_bump_version_on_save")
+def bump_version_on_save(sender, **kwargs):
+    """Invalida os dados em cache do modelo e do registro após um save."""
+    if is_tracked(sender):
+        bump_versions_on_commit(
+            sender, kwargs["instance"].pk, kwargs["using"]
+        )
+
+
+@receiver(post_delete, dispatch_uid="utils_bump_version_on_delete")
+def bump_version_on_delete(sender, **kwargs):
+    """
+    Invalida os dados em cache do modelo e do registro após uma exclusão.
+    """
+    if is_tracked(sender):
+        bump_versions_on_commit(
+            sender, kwargs["instance"].pk, kwargs["using"]
+        )
@@ -0,0 +1,187 @@
+# apps/utils/tables.py
+
+"""
+Renderização das linhas das tabelas de listagem.
+
+As células são declaradas uma vez por listagem (``Cell``, ``LinkCell``,
+``BooleanCell``, ``DateTimeCell`` e ``DimensionCell``) e o
+``TableRenderer`` monta o HTML de todas as linhas de uma página em uma
+única passagem:
+
+- os dados compartilhados pelas linhas são preparados uma única vez por
+  renderização (``Cell.prepare``): os links são resolvidos com
+  ``reverse()`` com uma chave de marcação, e a chave de cada registro é
+  inserida por substituição de texto; os nomes de tabelas pequenas vêm do
+  cache local de dimensões (``dimensions.py``), sem JOIN;
+- todos os valores são escapados.
+"""
+
+from urllib.parse import quote
+
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+# Chave de marcação usada ao resolver os links; aceita pelos conversores
+# "int" e "str" das URLs
+LINK_PLACEHOLDER = 987654321
+
+
+class Cell:
+    """
+    Célula com o valor de um campo do registro.
+
+    Args:
+        field (str): Atributo do registro (tupla nomeada ou modelo).
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def depends_on(self):
+        """Modelos lidos pela célula fora da consulta da listagem."""
+        return []
+
+    def prepare(self, request, lookups):
+        """
+        Prepara os dados compartilhados pelas linhas, uma vez por
+        renderização, em ``lookups``.
+        """
+
+    def value(self, row):
+        """Valor exibido (texto, ainda sem escape)."""
+        value = getattr(row, self.field)
+        return "" if value is None else str(value)
+
+    def render(self, row, lookups):
+        """HTML da célula."""
+        return escape(self.value(row))
+
+
+class BooleanCell(Cell):
+    """Célula booleana exibida como "Sim"/"Não"."""
+
+    def value(self, row):
+        return "Sim" if getattr(row, self.field) else "Não"
+
+
+class DateTimeCell(Cell):
+    """Célula de data e hora no fuso horário local."""
+
+    def __init__(self, field, date_format="%d/%m/%Y %H:%M"):
+        super().__init__(field)
+        self.date_format = date_format
+
+    def value(self, row):
+        value = getattr(row, self.field)
+        if value is None:
+            return ""
+        return timezone.localtime(value).strftime(self.date_format)
+
+
+class LinkCell(Cell):
+    """
+    Célula com link para outra página, ex.: o detalhe do registro.
+
+    Args:
+        field (str): Atributo exibido como texto do link.
+        url_name (str): Nome da URL, com um único argumento.
+        pk_field (str): Atributo do registro usado como argumento da URL.
+    """
+
+    def __init__(self, field, url_name, pk_field):
+        super().__init__(field)
+        self.url_name = url_name
+        self.pk_field = pk_field
+
+    def prepare(self, request, lookups):
+        if self.url_name in lookups:
+            return
+        url = reverse(self.url_name, args=[LINK_PLACEHOLDER])
+        prefix, suffix = url.rsplit(str(LINK_PLACEHOLDER), 1)
+        lookups[self.url_name] = (prefix, suffix)
+
+    def render(self, row, lookups):
+        prefix, suffix = lookups[self.url_name]
+        pk = quote(str(getattr(row, self.pk_field)), safe="")
+        href = prefix + pk + suffix
+        return f'<a href="{escape(href)}">{escape(self.value(row))}</a>'
+
+
+class DimensionCell(Cell):
+    """
+    Célula com um atributo de um registro de dimensão (ex.: o nome do
+    Certificador), a partir da chave estrangeira da linha.
+
+    Args:
+        field (str): Atributo do registro com a chave estrangeira, ex.:
+            "certifier_id".
+        dimension (Dimension): Dimensão do modelo relacionado.
+        attribute (str): Atributo exibido do registro da dimensão.
+    """
+
+    def __init__(self, field, dimension, attribute="name"):
+        super().__init__(field)
+        self.dimension = dimension
+        self.attribute = attribute
+
+    def depends_on(self):
+        return [self.dimension.model]
+
+    def prepare(self, request, lookups):
+        if self.dimension not in lookups:
+            lookups[self.dimension] = self.dimension.records(request)
+
+    def render(self, row, lookups):
+        record = lookups[self.dimension].get(getattr(row, self.field))
+        if record is None:
+            return ""
+        value = getattr(record, self.attribute)
+        return escape("" if value is None else value)
+
+
+class TableRenderer:
+    """
+    Monta o HTML das linhas de uma tabela.
+
+    Args:
+        cells (list): Células (``Cell``) de cada linha, na ordem das
+            colunas.
+    """
+
+    def __init__(self, cells):
+        self.cells = list(cells)
+
+    def depends_on(self):
+        """Modelos lidos pelas células fora da consulta da listagem."""
+        models = []
+        for cell in self.cells:
+            for model in cell.depends_on():
+                if model not in models:
+                    models.append(model)
+        return models
+
+    def render(self, rows, request=None):
+        """
+        Renderiza as linhas (``<tr>``) dos registros.
+
+        Args:
+            rows (iterable): Registros da página.
+            request (HttpRequest): Requisição atual.
+
+        Returns:
+            SafeString: HTML das linhas, vazio se não houver registros.
+        """
+        lookups = {}
+        for cell in self.cells:
+            cell.prepare(request, lookups)
+        cells = self.cells
+        return mark_safe("".join(
+            "<tr>"
+            + "".join(
+                f"<td>{cell.render(row, lookups)}</td>" for cell in cells
+            )
+            + "</tr>"
+            for row in rows
+        ))
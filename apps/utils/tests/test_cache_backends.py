@@ -0,0 +1,243 @@
+# apps/utils/tests/test_cache_backends.py
+
+"""
+Testes do cache em dois níveis (``TwoTierCache``) e da configuração dos
+servidores Memcached (``MEMCACHED_SERVERS``).
+
+O Memcached é substituído por um ``HashClient`` em memória, que pode ser
+derrubado para simular a indisponibilidade dos servidores.
+"""
+
+import importlib.util
+import time
+
+import pymemcache
+import pytest
+from django.core.cache import caches
+
+import venturix_testCenter.settings
+from apps.utils import cache_backends
+
+SERVERS = "10.0.0.1:11211, 10.0.0.2:11211"
+
+
+class FakeHashClient:
+    """``pymemcache.HashClient`` em memória; ``down`` simula a queda."""
+
+    def __init__(self, servers, **options):
+        self.servers = servers
+        self.options = options
+        self.data = {}
+        self.down = False
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        if self.down:
+            raise ConnectionRefusedError("Memcached indisponível")
+
+    def get(self, key, default=None):
+        self._call()
+        return self.data.get(key, default)
+
+    def get_multi(self, keys):
+        self._call()
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    def set(self, key, value, expire=0):
+        self._call()
+        self.data[key] = value
+        return True
+
+    def set_multi(self, values, expire=0):
+        self._call()
+        self.data.update(values)
+        return []
+
+    def add(self, key, value, expire=0):
+        self._call()
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    def touch(self, key, expire=0):
+        self._call()
+        return key in self.data
+
+    def delete(self, key):
+        self._call()
+        return self.data.pop(key, None) is not None
+
+    def delete_multi(self, keys):
+        self._call()
+        for key in keys:
+            self.data.pop(key, None)
+
+    def incr(self, key, delta):
+        self._call()
+        if key not in self.data:
+            return None
+        self.data[key] += delta
+        return self.data[key]
+
+    def decr(self, key, delta):
+        return self.incr(key, -delta)
+
+    def flush_all(self):
+        self._call()
+        self.data.clear()
+
+    def disconnect_all(self):
+        pass
+
+
+class FakeClock:
+    """
+    Relógio controlado pelo teste (``time.time`` e ``time.monotonic``).
+
+    Parte da hora atual, pois ``get_backend_timeout`` calcula a expiração
+    com o relógio real.
+    """
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def load_settings(monkeypatch, **environ):
+    """Executa o ``settings.py`` do projeto com as variáveis informadas."""
+    for name, value in environ.items():
+        monkeypatch.setenv(name, value)
+    spec = importlib.util.spec_from_file_location(
+        "settings_under_test", venturix_testCenter.settings.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_backends, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(settings, monkeypatch, clock):
+    """``TwoTierCache`` com a configuração do projeto sobre o HashClient."""
+    monkeypatch.setattr(pymemcache, "HashClient", FakeHashClient)
+    project = load_settings(monkeypatch, MEMCACHED_SERVERS=SERVERS)
+    settings.CACHES = project.CACHES
+    return caches["default"]
+
+
+@pytest.fixture
+def remote(cache):
+    return caches["memcached"]._cache
+
+
+def test_memcached_nodes_from_environment(monkeypatch, cache, remote):
+    project = load_settings(monkeypatch, MEMCACHED_SERVERS=SERVERS)
+
+    assert remote.servers == ["10.0.0.1:11211", "10.0.0.2:11211"]
+    assert remote.options["dead_timeout"] == 30
+    assert remote.options["use_pooling"] is True
+    assert project.SESSION_ENGINE == "django.contrib.sessions.backends.cache"
+
+
+def test_without_memcached_servers_uses_local_memory(monkeypatch):
+    project = load_settings(monkeypatch, MEMCACHED_SERVERS="")
+
+    assert "memcached" not in project.CACHES
+    assert project.CACHES["default"]["BACKEND"].endswith("LocMemCache")
+    assert project.SESSION_ENGINE.endswith(".cached_db")
+
+
+def test_local_tier_expires_after_local_timeout(cache, remote, clock):
+    cache.set("list-page", "antigo")
+    # Gravação de outro processo, direto no Memcached
+    remote.data[":1:list-page"] = "novo"
+
+    calls = remote.calls
+    assert cache.get("list-page") == "antigo"
+    assert remote.calls == calls
+
+    clock.advance(cache.local_timeout + 1)
+    assert cache.get("list-page") == "novo"
+
+
+def test_versioned_keys_keep_the_remote_timeout(cache, remote, clock):
+    cache.set("list-table:exams:v1.2:abc", "<table>", timeout=600)
+
+    clock.advance(cache.local_timeout + 1)
+    calls = remote.calls
+    assert cache.get("list-table:exams:v1.2:abc") == "<table>"
+    assert remote.calls == calls
+
+    clock.advance(600)
+    assert cache.get("list-table:exams:v1.2:abc") == "<table>"
+    assert remote.calls == calls + 1
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "data-version:clients.client",
+        "object-version:clients.client:10000000",
+        "django.contrib.sessions.cacheabc123",
+        "list-count:exams:v1:abc:lock",
+        "list-count:exams:v1:abc:stale",
+    ],
+)
+def test_excluded_keys_bypass_the_local_tier(cache, remote, key):
+    cache.set(key, 1)
+    remote.data[f":1:{key}"] = 2
+
+    assert cache.get(key) == 2
+    assert cache.get_many([key]) == {key: 2}
+
+
+def test_remote_outage_falls_back_to_the_local_tier(cache, remote, clock):
+    cache.set("list-page", "local")
+    remote.down = True
+
+    # Leituras e escritas seguem pelo nível local
+    assert cache.get("list-page") == "local"
+    cache.set("django.contrib.sessions.cacheabc123", {"user": 1})
+    assert cache.get("django.contrib.sessions.cacheabc123") == {"user": 1}
+
+    # Após FAILURE_THRESHOLD falhas, o Memcached deixa de ser consultado
+    for _ in range(cache.failure_threshold):
+        cache.get("missing")
+    calls = remote.calls
+    assert cache.get("missing") is None
+    assert remote.calls == calls
+
+    # Escritas durante a queda valem pelo tempo de vida completo
+    clock.advance(cache.local_timeout + 1)
+    assert cache.get("django.contrib.sessions.cacheabc123") == {"user": 1}
+
+    # De volta após RETRY_INTERVAL: o nível local é descartado
+    remote.down = False
+    remote.data[":1:list-page"] = "remoto"
+    clock.advance(cache.retry_interval)
+    assert cache.get("list-page") == "remoto"
+    assert cache.get("django.contrib.sessions.cacheabc123") is None
+
+
+def test_degrade_disabled_raises(cache, remote):
+    cache.degrade = False
+    remote.down = True
+
+    with pytest.raises(ConnectionRefusedError):
+        cache.get("list-page")
@@ -0,0 +1,27 @@
+# apps/utils/tests/test_list_engine.py
+
+"""
+Testes da listagem declarativa (``ListSpec``).
+"""
+
+from apps.testCenter.lists import EXAM_LIST
+
+
+def sortable_fields(headers):
+    return [header["field"] for header in headers if header["sortable"]]
+
+
+def test_page_mode_headers_are_sortable():
+    sortable = sortable_fields(EXAM_LIST.headers())
+
+    assert sortable
+    assert set(sortable) <= set(EXAM_LIST.sort_keys)
+
+
+def test_cursor_mode_headers_are_not_sortable():
+    list_query = EXAM_LIST.compile_params(
+        {"pagination": "cursor", "order_by": "client"}
+    )
+
+    assert list_query.cursor_mode
+    assert sortable_fields(EXAM_LIST.headers(list_query.cursor_mode)) == []
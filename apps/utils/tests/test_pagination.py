@@ -0,0 +1,63 @@
+# apps/utils/tests/test_pagination.py
+
+"""
+Testes da paginação por cursor (``CursorPaginator``).
+"""
+
+import pytest
+
+from apps.certifiers.models import Certifier
+from apps.utils.pagination import CursorPaginator
+
+pytestmark = pytest.mark.django_db
+
+PER_PAGE = 25
+
+
+@pytest.fixture
+def paginator():
+    Certifier.objects.bulk_create(
+        Certifier(
+            name=f"Certificador {index:02d}", abbreviation=f"C{index:02d}"
+        )
+        for index in range(60)
+    )
+    return CursorPaginator(
+        Certifier.objects.all(), ("name", "id"), per_page=PER_PAGE
+    )
+
+
+def names(page):
+    return [certifier.name for certifier in page]
+
+
+def test_first_page_has_no_previous_page(paginator):
+    page = paginator.get_page()
+
+    assert names(page) == [f"Certificador {index:02d}" for index in range(25)]
+    assert page.has_next()
+    assert not page.has_previous()
+
+
+def test_previous_from_second_page_returns_first_page(paginator):
+    first = paginator.get_page()
+    second = paginator.get_page(first.next_cursor)
+    assert second.has_previous()
+
+    back = paginator.get_page(second.previous_cursor)
+
+    assert names(back) == names(first)
+    assert back.has_next()
+    assert not back.has_previous()
+
+
+def test_last_page_links_back_only(paginator):
+    page = paginator.get_page()
+    while page.has_next():
+        page = paginator.get_page(page.next_cursor)
+
+    assert len(page) == 60 - 2 * PER_PAGE
+    assert page.has_previous()
+    assert names(paginator.get_page(page.previous_cursor)) == [
+        f"Certificador {index:02d}" for index in range(25, 50)
+    ]
@@ -4,6 +4,8 @@
 Este módulo contém widgets personalizados para uso em formulários.
 """
 
+from urllib.parse import urlencode
+
 from django import forms
 
 
@@ -19,3 +21,83 @@ class BooleanSelect(forms.Select):
             (False, "Não"),
         ]
         super().__init__(choices=choices, *args, **kwargs)
+
+
+class AjaxSelect(forms.Select):
+    """
+    Widget de seleção cujas opções são carregadas sob demanda pelo select2
+    (protocolo AJAX, ver ``apps/utils/autocomplete.py``).
+
+    Apenas a opção vazia e o valor atual são renderizados, de modo que o
+    HTML do formulário não cresce com o tamanho da tabela.
+
+    Args:
+        url (str): URL do endpoint de autocompletar (aceita ``reverse_lazy``).
+        url_params (dict): Parâmetros fixos enviados ao endpoint.
+    """
+
+    def __init__(self, url, url_params=None, attrs=None):
+        super().__init__(attrs=attrs)
+        self.url = url
+        self.url_params = url_params or {}
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        url = str(self.url)
+        if self.url_params:
+            url = f"{url}?{urlencode(self.url_params)}"
+        context["widget"]["attrs"]["data-ajax--url"] = url
+        context["widget"]["attrs"].setdefault("data-ajax--delay", "250")
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        """Gera apenas a opção vazia e as opções selecionadas."""
+        field = getattr(self.choices, "field", None)
+        options = []
+
+        if field is not None and field.empty_label is not None:
+            options.append(
+                self.create_option(name, "", field.empty_label, False, 0)
+            )
+
+        selected = [str(v) for v in value if v not in (None, "")]
+        if field is not None and selected:
+            key = field.to_field_name or "pk"
+            # Uma única consulta pelo valor atual, mesmo que ele não
+            # esteja mais entre as opções válidas do campo
+            queryset = field.queryset.model._default_manager.filter(
+                **{f"{key}__in": selected}
+            )
+            for obj in queryset:
+                options.append(
+                    self.create_option(
+                        name,
+                        str(field.prepare_value(obj)),
+                        field.label_from_instance(obj),
+                        True,
+                        len(options),
+                        attrs=attrs,
+                    )
+                )
+
+        return [(None, options, 0)] if options else []
+
+
+class AjaxModelChoiceField(forms.ModelChoiceField):
+    """
+    ``ModelChoiceField`` para tabelas grandes, usado com ``AjaxSelect``.
+
+    O ``queryset`` não é percorrido para gerar as opções: ele apenas
+    restringe os valores aceitos, validados com uma única consulta pela
+    chave primária em ``to_python``.
+    """
+
+    widget = AjaxSelect
+
+    def __init__(self, queryset, *, widget=None, **kwargs):
+        if widget is None:
+            raise TypeError(
+                "AjaxModelChoiceField requer um widget AjaxSelect com a URL "
+                "de autocompletar."
+            )
+        super().__init__(queryset, widget=widget, **kwargs)
@@ -0,0 +1,19 @@
+# conftest.py
+
+"""
+Configuração comum dos testes (pytest-django).
+"""
+
+import os
+
+from django.conf import settings
+
+
+def pytest_configure():
+    """
+    Usa uma chave secreta fixa quando não houver ``SECRET_KEY`` no ambiente
+    (ex.: no CI, sem ``.env``); tokens assinados, como os cursores da
+    paginação, dependem dela.
+    """
+    if not os.getenv("SECRET_KEY"):
+        settings.SECRET_KEY = "django-insecure-testes"
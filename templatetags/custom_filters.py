@@ -7,10 +7,17 @@ Este módulo contém filtros e tags personalizados para templates Django.
 from urllib.parse import urlencode, parse_qs
 
 from django import template
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
 
+from apps.utils.cache_versions import get_version
+
 register = template.Library()
 
+OPTIONS_KEY_PREFIX = "search-options"
+
 @register.filter
 def remove_page_param(query_params):
     """
@@ -26,58 +33,149 @@ def remove_page_param(query_params):
     params.pop('page', None)  # Remove o parâmetro 'page', se presente
     return urlencode(params, doseq=True)
 
+@register.filter
+def remove_cursor_param(query_params):
+    """
+    Remove o parâmetro 'cursor' dos query parameters.
+    
+    Args:
+        query_params (str): Query parameters da URL.
+    
+    Returns:
+        str: Query parameters sem o parâmetro 'cursor'.
+    """
+    params = parse_qs(query_params)
+    params.pop('cursor', None)  # Remove o parâmetro 'cursor', se presente
+    return urlencode(params, doseq=True)
+
+def render_options(options):
+    """Renderiza as tags ``<option>`` (valores e rótulos escapados)."""
+    return format_html_join(
+        "\n",
+        '<option value="{}">{}</option>',
+        ((value, label) for value, label in options),
+    )
+
+def options_html(field):
+    """
+    Retorna o bloco de ``<option>`` de um campo de seleção, sem marcação de
+    seleção.
+
+    Se o campo informar ``options_model``, o bloco é guardado em cache com a
+    versão de dados do modelo, e as opções (que podem ser uma função) só são
+    carregadas quando o bloco não está em cache.
+    """
+    options = field.get("options", [])
+    model = field.get("options_model")
+    if model is None:
+        return render_options(options() if callable(options) else options)
+
+    key = (
+        f"{OPTIONS_KEY_PREFIX}:{field.get('name')}:"
+        f"{model._meta.label_lower}:v{get_version(model)}"
+    )
+    html = cache.get(key)
+    if html is None:
+        if callable(options):
+            options = options()
+        html = str(render_options(options))
+        cache.set(
+            key,
+            html,
+            getattr(settings, "SEARCH_OPTIONS_CACHE_TIMEOUT", 3600),
+        )
+    return mark_safe(html)
+
+def mark_selected(html, value):
+    """Marca como selecionada a opção com o valor informado."""
+    if value in (None, ""):
+        return html
+    option = format_html('<option value="{}">', value)
+    return mark_safe(
+        html.replace(option, option[:-1] + " selected>", 1)
+    )
+
 @register.simple_tag
 def render_search_fields(fields, request):
     """
-    Gera dinamicamente os campos de pesquisa com base em um dicionário.
-    
+    Gera os campos de pesquisa das listagens a partir de uma lista de
+    dicionários (``id``, ``name``, ``label``, ``type``, ``options``,
+    ``options_model``, ``ajax_url`` e ``class``).
+
+    O valor de cada campo vem do ``request.GET``; na ausência dele, de
+    ``selected``/``value``. Todos os valores são escapados e o HTML é
+    montado em uma única junção de partes.
+
     Args:
         fields (list): Lista de dicionários contendo informações dos campos.
         request (HttpRequest): Objeto de requisição HTTP.
-    
+
     Returns:
         str: HTML dos campos de pesquisa.
-    
+
     Exemplo de uso no template:
     {% render_search_fields search_fields request %}
     """
-    form_html = '<div class="apps-list-form-group-search">'
+    parts = ['<div class="apps-list-form-group-search">']
     for field in fields:
         field_name = field.get("name")
+        field_id = field.get("id", field_name)
         field_label = field.get("label", field_name.capitalize())
         field_type = field.get("type", "text")
-        field_options = field.get("options", [])
-
-        value = request.GET.get(field_name, "")
+        value = request.GET.get(
+            field_name, field.get("selected", field.get("value", ""))
+        )
 
-        form_html += f"""
-        <div class="apps-list-form-group-search-sub">
-            <input type="checkbox" id="check-{field_name}" data-target="{field_name}">
-            <label for="search-{field_name}">{field_label}:</label>
-        """
+        parts.append(format_html(
+            '<div class="apps-list-form-group-search-sub">'
+            '<input type="checkbox" id="check-{}" data-target="{}">'
+            '<label for="search-{}">{}</label>',
+            field_id, field_id, field_id, field_label,
+        ))
 
         if field_type == "select":
-            form_html += (
-                f'<select name="{field_name}" id="{field_name}" '
-                f'class="select-search select2">'
-            )
-            form_html += '<option value="">-- Selecione --</option>'
-            for option_value, option_label in field_options:
-                selected = 'selected' if str(value) == str(option_value) else ''
-                form_html += f'<option value="{option_value}" {selected}>{option_label}</option>'
-            form_html += '</select>'
-
+            ajax_attrs = ""
+            if field.get("ajax_url"):
+                ajax_attrs = format_html(
+                    ' data-ajax--url="{}" data-ajax--delay="250"',
+                    field["ajax_url"],
+                )
+            parts.append(format_html(
+                '<select name="{}" id="{}" class="{}"{}>'
+                '<option value="">Selecionar {}</option>',
+                field_name,
+                field_id,
+                field.get("class", "select-search select2"),
+                ajax_attrs,
+                field_label,
+            ))
+            parts.append(mark_selected(options_html(field), str(value)))
+            parts.append("</select>")
+        elif field_type == "daterange":
+            parts.append(format_html(
+                '<input type="text" id="{}" name="{}" class="{}" '
+                'placeholder="Selecione o período" value="{}">',
+                field_id,
+                field_name,
+                field.get("class", "apps-list-search-form daterange"),
+                value,
+            ))
         else:  # Campos de texto, padrão
-            form_html += (
-                f'<input type="{field_type}" id="{field_name}" name="{field_name}" '
-                f'value="{value}" class="form-control">'
-            )
+            parts.append(format_html(
+                '<input type="text" id="{}" name="{}" class="{}" '
+                'placeholder="{}" value="{}">',
+                field_id,
+                field_name,
+                field.get("class", "form-control"),
+                field_label,
+                value,
+            ))
 
-        form_html += "</div>"
+        parts.append("</div>")
 
-    form_html += "</div>"
+    parts.append("</div>")
 
-    return mark_safe(form_html)
+    return mark_safe("".join(parts))
 
 @register.filter
 def get_item(dictionary, key):
@@ -1,14 +1,25 @@
 # venturix_testCenter/middleware.py
 
 """
-Middleware para garantir que o usuário esteja autenticado
-antes de acessar certas URLs.
+Middlewares do projeto:
+
+- ``LoginRequiredMiddleware``: garante que o usuário esteja autenticado
+  antes de acessar certas URLs;
+- ``QueryBudgetMiddleware``: aplica os limites de consultas SQL por
+  requisição (``apps/utils/guardrails.py``).
 """
 
 from django.conf import settings
+from django.http import HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 
+from apps.utils.guardrails import (
+    GuardrailViolation,
+    QueryBudget,
+    log_violation,
+)
+
 EXEMPT_URLS = [
     settings.LOGIN_URL.lstrip("/"),
     "recuperar-senha/",
@@ -35,3 +46,36 @@ class LoginRequiredMiddleware:
             if not any(path.startswith(str(url)) for url in EXEMPT_URLS):
                 return redirect(settings.LOGIN_URL)
         return self.get_response(request)
+
+
+class QueryBudgetMiddleware:
+    """
+    Middleware que limita a quantidade e o tempo das consultas SQL de cada
+    requisição.
+
+    Uma requisição que excede os limites é interrompida com o status 503 e
+    a violação é registrada no log com o nome da view.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        budget = QueryBudget.from_settings()
+        request.query_budget = budget
+        with budget.activate():
+            return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if getattr(view_func, "guardrails_exempt", False):
+            request.query_budget.enabled = False
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, GuardrailViolation):
+            return None
+        log_violation(request, exception.guardrail, exception.detail)
+        return HttpResponse(
+            "A requisição excedeu o limite de consultas ao banco de dados.",
+            content_type="text/plain; charset=utf-8",
+            status=503,
+        )
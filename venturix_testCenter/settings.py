@@ -68,22 +68,140 @@ else:
 
 
 # Configuração de cache
+# Servidores Memcached, separados por vírgula (ex.: "10.0.0.1:11211,
+# 10.0.0.2:11211"). As chaves são distribuídas entre os servidores por hash
+# consistente (rendezvous) e um servidor que deixa de responder é retirado
+# da distribuição até ``MEMCACHED_DEAD_TIMEOUT``. Vazio: cache em memória
+# do processo (padrão com DEBUG).
+MEMCACHED_SERVERS = [
+    server.strip()
+    for server in os.getenv(
+        "MEMCACHED_SERVERS", "" if DEBUG else "127.0.0.1:11211"
+    ).split(",")
+    if server.strip()
+]
+
+# O cache padrão mantém um LRU local (por processo) na frente do Memcached
+# (apps/utils/cache_backends.py); o alias "memcached" acessa apenas os
+# servidores remotos.
 CACHES = {
     "default": {
+        "BACKEND": "apps.utils.cache_backends.TwoTierCache",
+        "LOCATION": "memcached",  # Alias do cache remoto
+        "OPTIONS": {
+            # Quantidade máxima de entradas no nível local
+            "MAX_ENTRIES": int(os.getenv("LOCAL_CACHE_MAX_ENTRIES", "5000")),
+            # Tempo de vida (em segundos) das entradas locais
+            "LOCAL_TIMEOUT": int(os.getenv("LOCAL_CACHE_TIMEOUT", "5")),
+            # Tempo de vida local por prefixo da chave: 0 nunca guarda
+            # localmente; None usa o tempo de vida remoto (chaves que
+            # incluem a versão de dados e nunca mudam de conteúdo, ou que
+            # são validadas pelas versões dos registros a cada leitura)
+            "LOCAL_TIMEOUTS": {
+                "data-version": 0,
+                "object-version": 0,
+                # Sessões: um logout em um processo vale para os demais
+                "django.contrib.sessions.": 0,
+                "detail": None,
+                "list-count": None,
+                "list-table": None,
+                "search-options": None,
+            },
+            # Chaves nunca guardadas localmente: travas e cópias
+            # desatualizadas dos cálculos em cache (computations.py)
+            "LOCAL_EXCLUDED_SUFFIXES": (":lock", ":stale"),
+            # Mantém o site funcionando se o Memcached ficar indisponível:
+            # após FAILURE_THRESHOLD falhas seguidas, usa apenas o nível
+            # local por RETRY_INTERVAL segundos
+            "DEGRADE": True,
+            "FAILURE_THRESHOLD": 3,
+            "RETRY_INTERVAL": 30,
+        },
+    },
+    "memcached": {
         "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
-        "LOCATION": "127.0.0.1:11211",  # Endereço do servidor Memcached
-    }
+        "LOCATION": MEMCACHED_SERVERS,
+        "OPTIONS": {
+            # Tempos (em segundos) de conexão e de resposta de um servidor
+            "connect_timeout": float(
+                os.getenv("MEMCACHED_CONNECT_TIMEOUT", "0.5")
+            ),
+            "timeout": float(os.getenv("MEMCACHED_TIMEOUT", "0.5")),
+            # Falhas toleradas (a cada MEMCACHED_RETRY_TIMEOUT segundos)
+            # antes de retirar o servidor da distribuição, e tempo até
+            # tentar usá-lo novamente
+            "retry_attempts": int(os.getenv("MEMCACHED_RETRY_ATTEMPTS", "2")),
+            "retry_timeout": float(os.getenv("MEMCACHED_RETRY_TIMEOUT", "1")),
+            "dead_timeout": float(os.getenv("MEMCACHED_DEAD_TIMEOUT", "30")),
+            "use_pooling": True,
+        },
+    },
 }
 
-# Configuração de cache em memória para ambiente de desenvolvimento
-if DEBUG:
-    CACHES["default"] = {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-snowflake",
+# Sem Memcached, o cache fica na memória de cada processo
+if not MEMCACHED_SERVERS:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unique-snowflake",
+        }
     }
 
+# Configuração da contagem de registros das listagens (apps/utils/counts.py)
+# Tempo (em segundos) que a contagem permanece em cache; escritas no modelo
+# invalidam a contagem antes disso.
+LIST_COUNT_CACHE_TIMEOUT = int(os.getenv("LIST_COUNT_CACHE_TIMEOUT", "300"))
+# Tamanho mínimo de tabela para exibir contagem aproximada em listagens
+# sem filtros (apenas PostgreSQL e MySQL).
+LIST_COUNT_APPROXIMATE_THRESHOLD = int(
+    os.getenv("LIST_COUNT_APPROXIMATE_THRESHOLD", "100000")
+)
+# Cálculos caros em cache (apps/utils/computations.py), como as contagens:
+# tempo máximo (em segundos) da trava de recálculo, espera máxima de quem
+# não tem um valor anterior para exibir e variação aleatória (fração) do
+# tempo de vida.
+COMPUTATION_LOCK_TIMEOUT = int(os.getenv("COMPUTATION_LOCK_TIMEOUT", "30"))
+COMPUTATION_WAIT_TIMEOUT = float(os.getenv("COMPUTATION_WAIT_TIMEOUT", "2"))
+COMPUTATION_TTL_JITTER = float(os.getenv("COMPUTATION_TTL_JITTER", "0.1"))
+# Tempo (em segundos) que o HTML da tabela das listagens (requisições
+# AJAX) permanece em cache; escritas nos modelos exibidos invalidam a
+# tabela antes disso.
+LIST_TABLE_CACHE_TIMEOUT = int(os.getenv("LIST_TABLE_CACHE_TIMEOUT", "600"))
+# Tempo (em segundos) que o bloco de opções dos campos de pesquisa
+# (templatetags/custom_filters.py) permanece em cache; escritas no modelo
+# das opções invalidam o bloco antes disso.
+SEARCH_OPTIONS_CACHE_TIMEOUT = int(
+    os.getenv("SEARCH_OPTIONS_CACHE_TIMEOUT", "3600")
+)
+# Tempo (em segundos) que os dados das páginas de detalhe
+# (apps/utils/object_cache.py) permanecem em cache; escritas no registro ou
+# nos registros relacionados exibidos invalidam os dados antes disso.
+DETAIL_CACHE_TIMEOUT = int(os.getenv("DETAIL_CACHE_TIMEOUT", "3600"))
+
+# Limites de consumo por requisição (apps/utils/guardrails.py); 0 desativa
+# o limite correspondente.
+# Registros por página aceitos nas listagens.
+LIST_MAX_RECORDS_PER_PAGE = int(os.getenv("LIST_MAX_RECORDS_PER_PAGE", "1000"))
+# Quantidade de consultas SQL por requisição.
+REQUEST_QUERY_BUDGET = int(os.getenv("REQUEST_QUERY_BUDGET", "200"))
+# Tempo total (em segundos) gasto em consultas SQL por requisição.
+REQUEST_SQL_TIME_BUDGET = float(os.getenv("REQUEST_SQL_TIME_BUDGET", "10"))
+# Tempo máximo (em milissegundos) de cada consulta SQL.
+DB_STATEMENT_TIMEOUT = int(os.getenv("DB_STATEMENT_TIMEOUT", "5000"))
+
+# Quantidade de UIDs de Clientes reservados por processo a cada acesso ao
+# contador (apps/clients/uids.py).
+CLIENT_UID_BLOCK_SIZE = int(os.getenv("CLIENT_UID_BLOCK_SIZE", "50"))
+
 # Configuração de sessão
-SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+# Com Memcached, as sessões ficam apenas no cache compartilhado; sem ele,
+# são gravadas também no banco de dados ("cached_db"), para valerem em todos
+# os processos (ex.: workers do gunicorn).
+SESSION_ENGINE = os.getenv(
+    "SESSION_ENGINE",
+    "django.contrib.sessions.backends."
+    + ("cache" if MEMCACHED_SERVERS else "cached_db"),
+)
 SESSION_CACHE_ALIAS = "default"  # O alias do cache definido anteriormente
 
 # Configuração dos aplicativos instalados (INSTALLED_APPS)
@@ -102,6 +220,7 @@ INSTALLED_APPS = [
     "apps.certifiers",  # Aplicativo de Certificadores
     "apps.clients",  # Aplicativo de Clientes
     "apps.testCenter",  # Aplicativo de Centros de Provas
+    "apps.api",  # Aplicativo da API JSON
 ]
 
 # Configuração dos middlewares (MIDDLEWARE)
@@ -115,6 +234,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "venturix_testCenter.middleware.LoginRequiredMiddleware",
+    "venturix_testCenter.middleware.QueryBudgetMiddleware",
 ]
 
 # Configuração dos templates (TEMPLATES)
@@ -193,6 +313,11 @@ else:
                 "class": "logging.FileHandler",
                 "filename": "django_errors.log",
             },
+            "guardrails_file": {
+                "level": "WARNING",
+                "class": "logging.FileHandler",
+                "filename": "django_errors.log",
+            },
         },
         "loggers": {
             "django": {
@@ -200,6 +325,11 @@ else:
                 "level": "ERROR",
                 "propagate": True,
             },
+            "apps.utils.guardrails": {
+                "handlers": ["guardrails_file"],
+                "level": "WARNING",
+                "propagate": False,
+            },
         },
     }
 
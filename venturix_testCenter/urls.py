@@ -24,6 +24,8 @@ urlpatterns = [
     path("", include("apps.certifications.urls")),
     path("", include("apps.certifiers.urls")),
     path("", include("apps.testCenter.urls")),
+    # URLs da API JSON (somente leitura)
+    path("api/v1/", include("apps.api.urls")),
     path('migrar-dados/', migrar_dados),
     # Path para exclusão de registros
     path("delete/<str:model_name>/<int:pk>/", delete_item, name="delete_item"),